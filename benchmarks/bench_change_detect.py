@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+변화 감지 벤치마크
+현재 ev_subsidy_data.csv / kg_mobility_subsidy.csv를 지역 이름을 바꿔 N배로 늘린 합성 데이터에
+일부 값 변경/행 추가/삭제를 섞은 이전 데이터를 만든 뒤, diff_tables 소요 시간을 측정
+
+사용법:
+  python benchmarks/bench_change_detect.py [--scale 20] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+
+from change_detect import DEFAULT_RULES, diff_tables
+from history_store import DATASETS, read_csv_file
+from report_data import EVSubsidyData, KGMobilityData
+
+
+def build_pair(cls, dataset: str, scale: int, seed: int = 0):
+    """(현재, 이전) 합성 데이터 - 이전 데이터는 숫자 값 2% 변경, 행 1% 삭제/1% 추가"""
+    header, rows = read_csv_file(DATASETS[dataset]["csv"])
+    numeric = [header.index(name) for name in DEFAULT_RULES[dataset].fields]
+    district = header.index("지역구분")
+    rng = random.Random(seed)
+
+    current = []
+    for copy in range(scale):
+        for row in rows:
+            row = list(row)
+            row[district] = f"{row[district]}{copy}"
+            current.append(row)
+
+    prev = []
+    for row in current:
+        if rng.random() < 0.01:
+            continue
+        row = list(row)
+        if rng.random() < 0.02:
+            column = rng.choice(numeric)
+            row[column] = str(int(row[column] or 0) + rng.randint(1, 50))
+        prev.append(row)
+    prev.extend([*row[:district], f"{row[district]}_신규", *row[district + 1:]]
+                for row in rng.sample(current, len(current) // 100))
+
+    to_data = lambda data: cls.from_rows([dict(zip(header, row)) for row in data])
+    return to_data(current), to_data(prev)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="변화 감지 벤치마크")
+    parser.add_argument("--scale", type=int, default=20, help="현재 CSV를 몇 배로 늘릴지")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for cls, dataset in [(EVSubsidyData, "ev_subsidy"), (KGMobilityData, "kg_mobility")]:
+        current, prev = build_pair(cls, dataset, args.scale)
+        rules = DEFAULT_RULES[dataset]
+        # 숫자 컬럼 변환은 보고서에서도 한 번만 하므로 측정에서 제외
+        for field in rules.fields:
+            current.numbers(field)
+            prev.numbers(field)
+
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            changes = diff_tables(current, prev, rules)
+            times.append((time.perf_counter() - start) * 1000)
+
+        print(f"[{dataset}] 현재 {len(current):,}행 / 이전 {len(prev):,}행 × 비교 {len(rules.fields)}컬럼")
+        print(f"  {changes.summary_text()}")
+        print(f"  diff_tables: 중앙값 {statistics.median(times):.1f}ms, 최소 {min(times):.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+엔드투엔드 벤치마크 (녹화 재생)
+녹화된 ev.or.kr 응답을 로컬 대역 서버로 재생하면서 ev_crawler.crawl_ev_subsidy, crawl_ev_subsidy.main,
+report_generator.main 전체 실행 시간을 측정
+
+src를 임시 디렉터리에 복사해 그 복사본을 실행하므로 CSV/보고서/저널 등 출력은 저장소 data/, reports/에 남지 않음.
+재생 서버는 로컬이므로 기본적으로 실제 사이트용 요청 간격 대신 --rate 요청 속도를 사용
+
+사용법:
+  python benchmarks/bench_end_to_end.py --record          # 실제 사이트에서 녹화 (1회, 실제 요청 발생)
+  python benchmarks/bench_end_to_end.py [--repeat 3] [--latency-ms 300] [--jitter-ms 100] [--fetch]
+"""
+
+import argparse
+import asyncio
+import importlib
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+
+DEFAULT_FIXTURES = os.path.join(BENCH_DIR, "fixtures", "site")
+
+# 보고서의 이전 데이터/추세 비교용으로 복사할 파일
+DATA_FILES = ["history.sqlite", "ev_subsidy_data_prev.csv", "kg_mobility_subsidy_prev.csv", "kg_region_catalog.json"]
+
+
+def load_isolated_modules(work_dir: str) -> dict:
+    """src를 work_dir에 복사하고 그 복사본의 모듈을 로드 (출력 경로가 모두 work_dir 아래가 됨)"""
+    shutil.copytree(os.path.join(REPO_DIR, "src"), os.path.join(work_dir, "src"),
+                    ignore=shutil.ignore_patterns("__pycache__"))
+    os.makedirs(os.path.join(work_dir, "data"))
+    for name in DATA_FILES:
+        source = os.path.join(REPO_DIR, "data", name)
+        if os.path.exists(source):
+            shutil.copy2(source, os.path.join(work_dir, "data", name))
+
+    sys.path.insert(0, os.path.join(work_dir, "src"))
+    return {name: importlib.import_module(name)
+            for name in ["ev_crawler", "crawl_ev_subsidy", "report_generator", "site_fixtures", "metrics"]}
+
+
+def record(fixture_dir: str):
+    """실제 사이트에서 두 크롤러를 실행하며 응답 녹화 (요청 간격은 실제 설정 그대로)"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        modules = load_isolated_modules(work_dir)
+        fixtures = modules["site_fixtures"].SiteFixtures(record_dir=fixture_dir)
+        try:
+            modules["ev_crawler"].crawl_ev_subsidy(fixtures=fixtures)
+            # 직접 조회 모드 재생도 가능하도록 팝업 HTTP 응답까지 녹화
+            asyncio.run(modules["crawl_ev_subsidy"].main(fetch_mode=True, fixtures=fixtures))
+        finally:
+            fixtures.close()
+
+
+def run(fixture_dir: str, repeat: int, latency_ms: float, jitter_ms: float, rate: float, fetch_mode: bool):
+    with tempfile.TemporaryDirectory() as work_dir:
+        modules = load_isolated_modules(work_dir)
+        ev_crawler = modules["ev_crawler"]
+        crawl_ev_subsidy = modules["crawl_ev_subsidy"]
+        report_generator = modules["report_generator"]
+        metrics = modules["metrics"].METRICS
+
+        if rate > 0:
+            ev_crawler.PAGE_MIN_INTERVAL_SEC = 1 / rate
+            crawl_ev_subsidy.POPUP_MIN_INTERVAL_SEC = 1 / rate
+
+        fixtures = modules["site_fixtures"].SiteFixtures.replay(fixture_dir, latency_ms, jitter_ms)
+        stages = [
+            ("ev_crawler.crawl_ev_subsidy", lambda: ev_crawler.crawl_ev_subsidy(fixtures=fixtures)),
+            ("crawl_ev_subsidy.main", lambda: asyncio.run(crawl_ev_subsidy.main(fetch_mode=fetch_mode,
+                                                                                fixtures=fixtures))),
+            ("report_generator.main", lambda: report_generator.main()),
+        ]
+        times = {name: [] for name, _ in stages}
+        try:
+            metrics.reset()
+            for _ in range(repeat):
+                for name, stage in stages:
+                    start = time.perf_counter()
+                    stage()
+                    times[name].append(time.perf_counter() - start)
+        finally:
+            fixtures.close()
+
+        print("\n" + "=" * 60)
+        print(f"엔드투엔드 벤치마크 (반복 {repeat}회, 지연 {latency_ms:g}±{jitter_ms:g}ms, "
+              f"요청 속도 {'실제 설정' if rate <= 0 else f'{rate:g}/s'}, {'직접 조회' if fetch_mode else '브라우저 팝업'})")
+        print("=" * 60)
+        print(f"{'단계':<30} {'중앙값(s)':>10} {'최소(s)':>9}")
+        for name, samples in times.items():
+            print(f"{name:<30} {statistics.median(samples):>10.2f} {min(samples):>9.2f}")
+        total = [sum(run_times) for run_times in zip(*times.values())]
+        print(f"{'합계':<30} {statistics.median(total):>10.2f} {min(total):>9.2f}")
+
+        # 구간별 누적 시간 (전체 반복 합계, 동시 작업자 구간은 각각 더해짐)
+        print(f"\n{'구간':<36} {'횟수':>6} {'합계(s)':>9} {'최대(s)':>8}")
+        spans = sorted(metrics.summary("bench")["spans"], key=lambda span: -span["total"])
+        for span in spans[:15]:
+            labels = ",".join(f"{k}={v}" for k, v in span["labels"].items())
+            name = f"{span['name']}{f'[{labels}]' if labels else ''}"
+            print(f"{name:<36} {span['count']:>6} {span['total']:>9.2f} {span['max']:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화 재생 엔드투엔드 벤치마크")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES, help="녹화 디렉터리")
+    parser.add_argument("--record", action="store_true", help="실제 사이트에서 녹화 (실제 요청 발생)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=300, help="재생 서버 응답 지연 (밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=100, help="재생 서버 응답 지연 편차 (± 밀리초)")
+    parser.add_argument("--rate", type=float, default=20,
+                        help="재생 시 초당 요청 수 (0이면 실제 사이트용 요청 간격 그대로)")
+    parser.add_argument("--fetch", action="store_true", help="KG 지역 팝업을 HTTP 직접 조회로 재생")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.fixtures)
+    elif not os.path.exists(os.path.join(args.fixtures, "index.jsonl")):
+        print(f"녹화 디렉터리가 없습니다: {args.fixtures} (--record로 먼저 녹화하세요)")
+    else:
+        run(args.fixtures, args.repeat, args.latency_ms, args.jitter_ms, args.rate, args.fetch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+숫자 열 파싱 벤치마크
+현재 ev_subsidy_data.csv의 세부 대수를 원본 셀 형태('10500 (1600) (0) (0) (8900)')로 되돌려 N배로 늘린 뒤,
+셀마다 정규식을 돌리던 기존 방식과 number_columns의 열 단위 파싱 소요 시간을 비교하고,
+경계 사례(콤마만 있는 토큰 등)를 포함해 두 방식의 결과가 같은지 확인
+
+사용법:
+  python benchmarks/bench_number_parse.py [--scale 50] [--repeat 5]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+
+from history_store import DATASETS, read_csv_file
+from number_columns import BREAKDOWN_GROUPS, parse_breakdowns, parse_int_column
+
+
+def legacy_parse_numbers(text):
+    """기존 ev_crawler.parse_numbers (셀마다 re.findall + 패딩)"""
+    if not text or text.strip() == '':
+        return ['', '', '', '', '']
+    numbers = re.findall(r'[\d,]+', text)
+    if not numbers:
+        return ['', '', '', '', '']
+    numbers = [n.replace(',', '') for n in numbers]
+    while len(numbers) < 5:
+        numbers.append('')
+    return numbers[:5]
+
+
+# 결과 비교용 경계 사례 (콤마가 든 숫자, 콤마만 있는 토큰, 숫자 5개 미만/초과, 빈 셀, 숫자 없는 셀)
+EDGE_CELLS = ["1,050 (1,600) (0) (0) (8,900)", "10500 , (5)", ", (3)", "7 (1)", "1 (2) (3) (4) (5) (6)",
+              "", "  ", "-", "합계 12 (3)", "1,2,3 (4)"]
+
+
+def legacy_int_column(values):
+    """기존 TableData.numbers (값마다 int 변환)"""
+    numbers, valid = [], bytearray()
+    for value in values:
+        try:
+            numbers.append(int(value or 0))
+            valid.append(1)
+        except ValueError:
+            numbers.append(0)
+            valid.append(0)
+    return numbers, valid
+
+
+def measure(func, repeat: int) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="숫자 열 파싱 벤치마크")
+    parser.add_argument("--scale", type=int, default=50, help="현재 CSV를 몇 배로 늘릴지")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    header, rows = read_csv_file(DATASETS["ev_subsidy"]["csv"])
+    rows = rows * args.scale
+    cells = {}
+    for group in BREAKDOWN_GROUPS:
+        start = header.index(f"{group}_전체")
+        cells[group] = [f"{r[start]} ({r[start + 1]}) ({r[start + 2]}) ({r[start + 3]}) ({r[start + 4]})"
+                        for r in rows]
+
+    results = {
+        "셀 파싱 - 기존 (셀마다 정규식)": measure(
+            lambda: [[legacy_parse_numbers(c) for c in column] for column in cells.values()], args.repeat),
+        "셀 파싱 - 열 단위 (parse_breakdowns)": measure(
+            lambda: [parse_breakdowns(column) for column in cells.values()], args.repeat),
+    }
+    columns = [[r[i] for r in rows] for i, name in enumerate(header) if name in DATASETS["ev_subsidy"]["numeric"]]
+    results["CSV 숫자 열 - 기존 (값마다 int)"] = measure(
+        lambda: [legacy_int_column(column) for column in columns], args.repeat)
+    results["CSV 숫자 열 - 일괄 (parse_int_column)"] = measure(
+        lambda: [parse_int_column(column) for column in columns], args.repeat)
+
+    print(f"[ev_subsidy] {len(rows):,}행 × 셀 {len(cells)}열 / 숫자 {len(columns)}열")
+    for name, times in results.items():
+        print(f"  {name}: 중앙값 {statistics.median(times):.1f}ms, 최소 {min(times):.1f}ms")
+
+    # 결과가 기존 방식과 같은지 확인 (세부 대수 문자열, 숫자 열의 정수/유효 여부)
+    parsed = parse_breakdowns(EDGE_CELLS + cells[BREAKDOWN_GROUPS[0]])
+    same_cells = all(parsed.texts(i) == legacy_parse_numbers(c)
+                     for i, c in enumerate(EDGE_CELLS + cells[BREAKDOWN_GROUPS[0]]))
+    same_numbers = all(tuple(map(list, parse_int_column(column))) == tuple(map(list, legacy_int_column(column)))
+                       for column in [*columns, ["", "12", "x", "3.5", "007"]])
+    print(f"\n결과 일치: 셀 파싱 {'예' if same_cells else '아니오'}, 숫자 열 {'예' if same_numbers else '아니오'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+페이지 로드 프로필 벤치마크
+녹화된 HAR 픽스처를 재생하여 프로필(full/lean)별 페이지 로드 시간과 요청 수를 비교
+
+사용법:
+  python benchmarks/bench_page_profile.py --record   # 실제 사이트에서 HAR 녹화 (1회)
+  python benchmarks/bench_page_profile.py [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from playwright.async_api import async_playwright
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+
+from page_profile import PROFILES, apply_profile
+
+DEFAULT_HAR = os.path.join(BENCH_DIR, "fixtures", "ev_pages.har")
+
+# (페이지 이름, URL, DOM 준비 조건 셀렉터)
+PAGES = [
+    ("접수현황", "https://ev.or.kr/nportal/buySupprt/initSubsidyPaymentCheckAction.do", "table >> nth=1"),
+    ("지역별 차종 보조금", "https://ev.or.kr/nportal/buySupprt/initPsLocalCarPirceAction.do", "select#year1"),
+]
+
+
+async def record(har_path: str):
+    """실제 사이트 페이지를 HAR로 녹화 (리소스 포함)"""
+    os.makedirs(os.path.dirname(har_path), exist_ok=True)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(record_har_path=har_path, record_har_content="embed")
+        page = await context.new_page()
+        for name, url, _ in PAGES:
+            print(f"녹화 중: {name} {url}")
+            await page.goto(url, wait_until="networkidle")
+        await context.close()
+        await browser.close()
+    print(f"HAR 저장: {har_path}")
+
+
+async def measure(browser, har_path: str, profile_name: str, url: str, ready_selector: str) -> tuple[float, int, int]:
+    """(로드 시간 초, 요청 수, 차단 수)"""
+    context = await browser.new_context()
+    # HAR 재생 라우트를 먼저 등록하고 프로필 라우트를 나중에 등록 (나중 등록 라우트가 먼저 실행됨)
+    await context.route_from_har(har_path, not_found="abort")
+    stats = await apply_profile(context, profile_name)
+    page = await context.new_page()
+    requests = []
+    page.on("request", lambda r: requests.append(r))
+
+    start = time.perf_counter()
+    await page.goto(url, wait_until="domcontentloaded")
+    await page.wait_for_selector(ready_selector)
+    elapsed = time.perf_counter() - start
+
+    await context.close()
+    return elapsed, len(requests), stats["blocked"]
+
+
+async def run(har_path: str, repeat: int):
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        print(f"{'페이지':<12} {'프로필':<6} {'중앙값(ms)':>10} {'최소(ms)':>9} {'요청':>5} {'차단':>5}")
+        for name, url, ready_selector in PAGES:
+            for profile_name in PROFILES:
+                samples = [await measure(browser, har_path, profile_name, url, ready_selector) for _ in range(repeat)]
+                times = [s[0] * 1000 for s in samples]
+                print(f"{name:<12} {profile_name:<6} {statistics.median(times):>10.1f} {min(times):>9.1f} "
+                      f"{samples[-1][1]:>5} {samples[-1][2]:>5}")
+        await browser.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페이지 로드 프로필 벤치마크")
+    parser.add_argument("--har", default=DEFAULT_HAR, help="HAR 픽스처 경로")
+    parser.add_argument("--record", action="store_true", help="실제 사이트에서 HAR 녹화")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record(args.har))
+    elif not os.path.exists(args.har):
+        print(f"HAR 픽스처가 없습니다: {args.har} (--record로 먼저 녹화하세요)")
+    else:
+        asyncio.run(run(args.har, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+스냅샷 저장/읽기 벤치마크
+현재 ev_subsidy_data.csv / kg_mobility_subsidy.csv를 N배로 늘린 데이터를 임시 디렉터리에
+기존 방식(제자리 쓰기)과 snapshot_io(임시 파일 + fsync + 교체, 보조 파일)로 저장하고,
+CSV와 컬럼 형식 보조 파일(.cols.gz)을 읽는 시간과 파일 크기를 비교
+
+사용법:
+  python benchmarks/bench_snapshot_io.py [--scale 20] [--repeat 5]
+"""
+
+import argparse
+import csv
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+
+from history_store import DATASETS, read_csv_file
+from report_data import EVSubsidyData, KGMobilityData
+from snapshot_io import read_columns, sidecar_path, write_snapshot
+
+
+def legacy_write(path: str, header: list[str], rows: list[list[str]]):
+    """기존 방식 - 원래 파일에 바로 쓰기 (중간에 중단되면 잘린 파일이 남음)"""
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def measure(func, repeat: int) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스냅샷 저장/읽기 벤치마크")
+    parser.add_argument("--scale", type=int, default=20, help="현재 CSV를 몇 배로 늘릴지")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for cls, dataset in [(EVSubsidyData, "ev_subsidy"), (KGMobilityData, "kg_mobility")]:
+            header, rows = read_csv_file(DATASETS[dataset]["csv"])
+            rows = rows * args.scale
+            path = os.path.join(work_dir, os.path.basename(DATASETS[dataset]["csv"]))
+            legacy_path = os.path.join(work_dir, "legacy_" + os.path.basename(path))
+
+            results = {
+                "저장 - 기존 (제자리 쓰기)": measure(lambda: legacy_write(legacy_path, header, rows), args.repeat),
+                "저장 - 원자적 (CSV만)": measure(lambda: write_snapshot(path, header, rows, sidecars=[]), args.repeat),
+                "저장 - 원자적 + cols,gz": measure(lambda: write_snapshot(path, header, rows, sidecars=["cols", "gz"]),
+                                                args.repeat),
+            }
+            sizes = {os.path.basename(p): os.path.getsize(p)
+                     for p in [path, sidecar_path(path, "cols"), sidecar_path(path, "gz")]}
+            results["읽기 - 보고서 CSV (TableData.from_csv)"] = measure(lambda: cls.from_csv(legacy_path), args.repeat)
+            results["읽기 - 보고서 cols (TableData.from_csv)"] = measure(lambda: cls.from_csv(path), args.repeat)
+            results["읽기 - 컬럼 형식만 (read_columns)"] = measure(lambda: read_columns(path), args.repeat)
+
+            print(f"[{dataset}] {len(rows):,}행 × {len(header)}열")
+            print("  " + ", ".join(f"{name} {size / 1024:,.0f}KB" for name, size in sizes.items()))
+            for name, times in results.items():
+                print(f"  {name}: 중앙값 {statistics.median(times):.1f}ms, 최소 {min(times):.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+테이블 추출 벤치마크
+셀 단위 inner_text() 방식과 일괄 evaluate 방식의 CDP 왕복 횟수/소요 시간 비교
+(실제 사이트 대신 ev.or.kr 접수현황 구조를 흉내낸 합성 테이블 사용)
+
+사용법: python benchmarks/bench_table_extract.py [행 수]
+"""
+
+import os
+import sys
+import time
+
+from playwright.sync_api import sync_playwright
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from table_extract import DEFAULT_LINK_SELECTOR, TABLE_ROWS_JS
+
+
+def build_html(row_count: int) -> str:
+    """접수현황(10열) 형태의 합성 테이블 HTML"""
+    rows = []
+    for i in range(row_count):
+        rows.append(
+            "<tr>"
+            f"<td>시도{i % 17}</td><td>지역{i}</td><td>전기승용</td><td>본공고 1</td><td>*일반: 출고등록순</td>"
+            "<td>10500 (1600) (0) (840) (8060)</td><td>2012 (667) (63) (78) (1204)</td>"
+            "<td>546 (186) (21) (0) (339)</td><td>9954 (1414) (0) (840) (7721)</td>"
+            f"<td><a href=\"#\" onclick=\"psPopupLocalCarModelPrice('2026','{1000 + i}','지역{i}')\">비고</a></td>"
+            "</tr>"
+        )
+    return f"<table></table><table><tbody>{''.join(rows)}</tbody></table>"
+
+
+def extract_per_cell(page) -> tuple[list[list[str]], int]:
+    """기존 방식: 행/셀마다 count()/inner_text() 호출 - (데이터, 왕복 횟수)"""
+    round_trips = 0
+    data_rows = page.locator('table').nth(1).locator('tbody tr')
+    row_count = data_rows.count()
+    round_trips += 1
+
+    data = []
+    for i in range(row_count):
+        cells = data_rows.nth(i).locator('td')
+        cell_count = cells.count()
+        round_trips += 1
+        row = []
+        for j in range(cell_count):
+            row.append(" ".join(cells.nth(j).inner_text().split()))
+            round_trips += 1
+        data.append(row)
+    return data, round_trips
+
+
+def extract_batched(page) -> tuple[list[list[str]], int]:
+    """일괄 방식: evaluate_all 1회 - (데이터, 왕복 횟수)"""
+    rows = page.locator('table').nth(1).locator('tbody tr').evaluate_all(TABLE_ROWS_JS, DEFAULT_LINK_SELECTOR)
+    return [cells for cells, _ in rows], 1
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 290
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        page.set_content(build_html(row_count))
+
+        results = {}
+        for name, func in [("셀 단위 inner_text", extract_per_cell), ("일괄 evaluate_all", extract_batched)]:
+            start = time.perf_counter()
+            data, round_trips = func(page)
+            elapsed = time.perf_counter() - start
+            results[name] = data
+            print(f"{name:<20} 행 {len(data):>4}  왕복 {round_trips:>5}회  {elapsed * 1000:>9.1f} ms")
+
+        browser.close()
+
+    per_cell, batched = results.values()
+    print(f"\n결과 일치: {'예' if per_cell == batched else '아니오'}")
+
+
+if __name__ == "__main__":
+    main()
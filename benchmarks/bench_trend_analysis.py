@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+추세 분석 벤치마크
+현재 ev_subsidy_data.csv를 바탕으로 출고잔여대수가 매일 줄어드는 합성 이력(스냅샷 N개)을
+임시 SQLite에 만든 뒤, 이력 로드 + 추세/이상 변동 계산 시간을 측정
+
+사용법:
+  python benchmarks/bench_trend_analysis.py [--snapshots 300] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+
+from history_store import DATASETS, KST, HistoryStore, read_csv_file
+from trend_analysis import load_trends
+
+
+def build_history(db_path: str, snapshots: int, seed: int = 0):
+    """하루 한 번 크롤링한 것처럼 잔여대수를 감소시키며 스냅샷 추가 (가끔 예산 추가)"""
+    header, rows = read_csv_file(DATASETS["ev_subsidy"]["csv"])
+    column = header.index("출고잔여대수_전체")
+    rng = random.Random(seed)
+    remaining = [int(row[column] or 0) + snapshots * 5 for row in rows]
+    start = datetime(2026, 1, 1, 9, tzinfo=KST)
+
+    with HistoryStore(db_path) as store:
+        for day in range(snapshots):
+            for i, value in enumerate(remaining):
+                used = rng.randint(0, 8)
+                if rng.random() < 0.002:
+                    used -= 300
+                remaining[i] = max(0, value - used)
+                rows[i][column] = str(remaining[i])
+            store.append_snapshot("ev_subsidy", header, rows, start + timedelta(days=day), source="bench")
+    return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추세 분석 벤치마크")
+    parser.add_argument("--snapshots", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "history.sqlite")
+        row_count = build_history(db_path, args.snapshots)
+        print(f"합성 이력: 스냅샷 {args.snapshots}개 × {row_count}행")
+
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            trends, jumps = load_trends(db_path)
+            times.append((time.perf_counter() - start) * 1000)
+
+        expected = sum(1 for t in trends if t["소진예상일"] is not None)
+        print(f"추세 {len(trends)}개 (소진 예상 {expected}개), 이상 변동 {len(jumps)}건")
+        print(f"load_trends: 중앙값 {statistics.median(times):.1f}ms, 최소 {min(times):.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
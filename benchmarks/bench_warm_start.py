@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+브라우저 웜 스타트 벤치마크
+접수현황 페이지의 첫 데이터 행이 나타날 때까지의 시간(time-to-first-row)을 기동 방식별로 비교
+
+- cold: 브라우저 실행 + 새 컨텍스트 + 페이지 로드 (매 실행마다 브라우저를 새로 띄우는 기존 방식)
+- warm: 이미 실행 중인 브라우저에 새 컨텍스트 + 페이지 로드 (run_all --daemon)
+- warm+session: warm + 저장된 쿠키/세션으로 컨텍스트 시작 (--session-cache)
+
+기본은 녹화된 HAR 픽스처(bench_page_profile.py --record로 녹화)를 재생하며, --live면 실제 사이트에 접속
+
+사용법:
+  python benchmarks/bench_warm_start.py [--repeat 5]
+  python benchmarks/bench_warm_start.py --live --repeat 3
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from playwright.async_api import Browser, async_playwright
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+
+from browser_session import SessionCache
+from ev_crawler import URL
+from page_profile import DEFAULT_PROFILE, apply_profile
+
+DEFAULT_HAR = os.path.join(BENCH_DIR, "fixtures", "ev_pages.har")
+
+# 접수현황 표의 첫 데이터 행
+FIRST_ROW_SELECTOR = "table >> nth=1 >> tbody tr >> nth=0"
+
+
+async def first_row(browser: Browser, har_path: str | None, session: SessionCache | None = None) -> float:
+    """새 컨텍스트에서 첫 데이터 행이 나타날 때까지 걸린 시간 (초)"""
+    start = time.perf_counter()
+    context = await browser.new_context(**(session.context_kwargs() if session else {}))
+    # HAR 재생 라우트를 먼저 등록하고 프로필 라우트를 나중에 등록 (나중 등록 라우트가 먼저 실행됨)
+    if har_path:
+        await context.route_from_har(har_path, not_found="abort")
+    await apply_profile(context, DEFAULT_PROFILE)
+    try:
+        page = await context.new_page()
+        await page.goto(URL, timeout=60000, wait_until="domcontentloaded")
+        await page.wait_for_selector(FIRST_ROW_SELECTOR, timeout=30000)
+        elapsed = time.perf_counter() - start
+        if session:
+            await session.save(context)
+    finally:
+        await context.close()
+    return elapsed
+
+
+async def measure_cold(p, har_path: str | None) -> float:
+    """브라우저 실행부터 첫 행까지 (초)"""
+    start = time.perf_counter()
+    browser = await p.chromium.launch(headless=True)
+    try:
+        await first_row(browser, har_path)
+        return time.perf_counter() - start
+    finally:
+        await browser.close()
+
+
+async def run(har_path: str | None, repeat: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        session = SessionCache(os.path.join(tmp_dir, "browser_state.json"))
+        async with async_playwright() as p:
+            results = {"cold": [await measure_cold(p, har_path) for _ in range(repeat)]}
+
+            browser = await p.chromium.launch(headless=True)
+            try:
+                # 첫 방문으로 세션 상태를 저장해 두고 측정에서는 제외
+                await first_row(browser, har_path, session)
+                results["warm"] = [await first_row(browser, har_path) for _ in range(repeat)]
+                results["warm+session"] = [await first_row(browser, har_path, session) for _ in range(repeat)]
+            finally:
+                await browser.close()
+
+    cold_median = statistics.median(results["cold"])
+    print(f"{'방식':<14} {'중앙값(ms)':>10} {'최소(ms)':>9} {'cold 대비':>9}")
+    for name, samples in results.items():
+        median = statistics.median(samples)
+        print(f"{name:<14} {median * 1000:>10.1f} {min(samples) * 1000:>9.1f} {median / cold_median:>8.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브라우저 웜 스타트 벤치마크 (time-to-first-row)")
+    parser.add_argument("--har", default=DEFAULT_HAR, help="HAR 픽스처 경로")
+    parser.add_argument("--live", action="store_true", help="HAR 대신 실제 사이트에 접속")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if not args.live and not os.path.exists(args.har):
+        print(f"HAR 픽스처가 없습니다: {args.har} (bench_page_profile.py --record로 먼저 녹화하거나 --live 사용)")
+        return
+    asyncio.run(run(None if args.live else args.har, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+브라우저 세션 캐시
+컨텍스트의 저장 상태(쿠키, localStorage)를 파일로 보관했다가 다음 컨텍스트 생성 시 재사용하여
+매 실행마다 사이트 세션을 새로 만드는 비용을 줄임
+"""
+
+import json
+import os
+import time
+
+from playwright.async_api import BrowserContext
+
+from run_log import get_logger
+
+log = get_logger("browser_session")
+
+# 스크립트 위치 기준 경로 설정
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+SESSION_STATE_FILE = os.path.join(DATA_DIR, "browser_state.json")
+
+# 저장 상태를 재사용하는 최대 시간 (지나면 새 세션으로 시작)
+SESSION_MAX_AGE_HOURS = 12
+
+
+class SessionCache:
+    """컨텍스트 저장 상태 파일 캐시
+
+    사용 예:
+        session = SessionCache()
+        context = await browser.new_context(**session.context_kwargs())
+        ...
+        await session.save(context)
+    """
+
+    def __init__(self, path: str = SESSION_STATE_FILE, max_age_hours: float = SESSION_MAX_AGE_HOURS):
+        self.path = path
+        self.max_age_hours = max_age_hours
+
+    def is_fresh(self) -> bool:
+        """재사용 가능한 저장 상태가 있는지 (파일 존재 + 유효 시간 이내)"""
+        if not os.path.exists(self.path):
+            return False
+        age_hours = (time.time() - os.path.getmtime(self.path)) / 3600
+        return age_hours <= self.max_age_hours
+
+    def context_kwargs(self) -> dict:
+        """new_context에 넘길 인자 (재사용할 상태가 없으면 빈 dict)"""
+        if not self.is_fresh():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            log.warning("세션 상태 파일을 읽지 못함 - 새 세션으로 시작", exc_info=e)
+            return {}
+        return {"storage_state": state}
+
+    async def save(self, context: BrowserContext):
+        """컨텍스트 저장 상태 기록 (두 크롤러가 동시에 저장해도 파일이 깨지지 않도록 임시 파일 후 교체)"""
+        try:
+            state = await context.storage_state()
+        except Exception as e:
+            log.warning("세션 상태 저장 실패", exc_info=e)
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_file = f"{self.path}.{os.getpid()}.{id(context)}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_file, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+데이터셋 변화 감지
+현재/이전 데이터(report_data.TableData)를 키 컬럼 해시 색인으로 한 번에 조인하여
+추가/삭제된 행과 숫자 컬럼이 바뀐 행을 변경 목록(ChangeSet)으로 정리
+
+데이터셋별 키/비교 컬럼/항목별 임계값은 DEFAULT_RULES에 정의하고, JSON 파일로 덮어쓸 수 있음:
+    {
+      "ev_subsidy": {
+        "thresholds": {"*": {"abs": 1}, "출고잔여대수_전체": {"abs": 10, "pct": 0.05}}
+      },
+      "kg_mobility": {"key": ["시도", "지역구분", "세부차종", "모델명"]}
+    }
+"""
+
+import json
+
+from csv_stream import SCHEMAS
+from metrics import METRICS
+
+# 항목별 임계값을 지정하지 않은 컬럼에 쓰는 기본값 이름
+DEFAULT_THRESHOLD = "*"
+
+
+class Threshold:
+    """변화로 볼 최소 크기 - |변화| >= min_abs 이고 |변화| / |이전| >= min_pct (이전 값이 0이면 비율은 보지 않음)
+
+    설정 파일에서는 {"abs": ..., "pct": ...}로 지정.
+    """
+
+    __slots__ = ("min_abs", "min_pct")
+
+    def __init__(self, min_abs: int | float = 1, min_pct: float = 0.0):
+        self.min_abs = min_abs
+        self.min_pct = min_pct
+
+    def exceeded(self, prev: int, current: int) -> bool:
+        diff = abs(current - prev)
+        if diff == 0 or diff < self.min_abs:
+            return False
+        return prev == 0 or diff / abs(prev) >= self.min_pct
+
+    def to_dict(self) -> dict:
+        return {"abs": self.min_abs, "pct": self.min_pct}
+
+
+class DiffRules:
+    """데이터셋 하나의 비교 규칙
+
+    key: 행을 맞출 키 컬럼, fields: 비교할 숫자 컬럼 (기본: 스키마의 숫자 컬럼 전체),
+    thresholds: 컬럼별 Threshold ("*"는 나머지 컬럼 기본값)
+    """
+
+    def __init__(self, dataset: str, key: list[str], fields: list[str] | None = None,
+                 thresholds: dict[str, Threshold] | None = None):
+        schema = SCHEMAS[dataset]
+        self.dataset = dataset
+        self.key = tuple(key)
+        self.fields = list(fields) if fields is not None else list(schema.numeric)
+        self.thresholds = thresholds or {}
+        unknown = [c for c in (*self.key, *self.fields) if c not in schema.columns]
+        if unknown:
+            raise ValueError(f"[{dataset}] 스키마에 없는 컬럼: {', '.join(unknown)}")
+        non_numeric = [c for c in self.fields if c not in schema.numeric]
+        if non_numeric:
+            raise ValueError(f"[{dataset}] 숫자 컬럼이 아님: {', '.join(non_numeric)}")
+
+    def threshold(self, field: str) -> Threshold:
+        return self.thresholds.get(field) or self.thresholds.get(DEFAULT_THRESHOLD) or Threshold()
+
+    def updated(self, config: dict) -> "DiffRules":
+        """설정(dict)으로 일부 항목을 바꾼 새 규칙"""
+        thresholds = dict(self.thresholds)
+        for field, value in config.get("thresholds", {}).items():
+            thresholds[field] = Threshold(value.get("abs", 1), value.get("pct", 0.0))
+        return DiffRules(self.dataset, config.get("key", self.key), config.get("fields", self.fields), thresholds)
+
+    def to_dict(self) -> dict:
+        """설정 파일과 같은 형식 (보고서 재사용 판단 등에 사용)"""
+        return {
+            "key": list(self.key),
+            "fields": self.fields,
+            "thresholds": {field: threshold.to_dict() for field, threshold in self.thresholds.items()},
+        }
+
+
+DEFAULT_RULES = {
+    # 접수현황: 지역/차종별 행, 26컬럼 중 숫자 20컬럼 전체 비교
+    "ev_subsidy": DiffRules("ev_subsidy", ["시도", "지역구분", "차종구분"]),
+    # KG 모빌리티: 지역/차종/모델별 행, 국비/지방비/보조금 비교
+    "kg_mobility": DiffRules("kg_mobility", ["시도", "지역구분", "세부차종", "제조사", "모델명"]),
+}
+
+
+def load_rules(path: str | None = None) -> dict[str, DiffRules]:
+    """기본 규칙에 JSON 설정 파일을 덮어쓴 데이터셋별 규칙 (path가 없으면 기본 규칙)"""
+    if not path:
+        return dict(DEFAULT_RULES)
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    unknown = [name for name in config if name not in DEFAULT_RULES]
+    if unknown:
+        raise ValueError(f"알 수 없는 데이터셋: {', '.join(unknown)}")
+    return {name: rules.updated(config.get(name, {})) for name, rules in DEFAULT_RULES.items()}
+
+
+class FieldChange:
+    """행 하나의 숫자 컬럼 변화"""
+
+    __slots__ = ("key", "field", "prev", "current")
+
+    def __init__(self, key: tuple, field: str, prev: int, current: int):
+        self.key = key
+        self.field = field
+        self.prev = prev
+        self.current = current
+
+    @property
+    def diff(self) -> int:
+        return self.current - self.prev
+
+
+class ChangeSet:
+    """두 데이터의 변경 목록 - added/removed: 추가/삭제된 행(dict), modified: 바뀐 숫자 컬럼 목록"""
+
+    def __init__(self, rules: DiffRules):
+        self.rules = rules
+        self.added: list[dict] = []
+        self.removed: list[dict] = []
+        self.modified: list[FieldChange] = []
+
+    @property
+    def dataset(self) -> str:
+        return self.rules.dataset
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    def modified_rows(self) -> int:
+        return len({change.key for change in self.modified})
+
+    def key_dict(self, key: tuple) -> dict:
+        return dict(zip(self.rules.key, key))
+
+    def summary_text(self) -> str:
+        return (f"{self.dataset}: 추가 {len(self.added)}행, 삭제 {len(self.removed)}행, "
+                f"변경 {self.modified_rows()}행 ({len(self.modified)}항목)")
+
+    def to_dict(self) -> dict:
+        """JSON 직렬화용 (알림/외부 도구)"""
+        return {
+            "dataset": self.dataset,
+            "key": list(self.rules.key),
+            "added": self.added,
+            "removed": self.removed,
+            "modified": [
+                {**self.key_dict(c.key), "field": c.field, "prev": c.prev, "current": c.current, "diff": c.diff}
+                for c in self.modified
+            ],
+        }
+
+
+def _keyed_rows(table, key: tuple[str, ...]):
+    """(색인 키, 행 번호) - 같은 키가 여러 번 나오면 등장 순번을 붙여 각각 맞춤"""
+    seen: dict[tuple, int] = {}
+    for i, key_values in enumerate(zip(*(table.column(c) for c in key))):
+        count = seen.get(key_values, 0)
+        seen[key_values] = count + 1
+        yield (key_values, count), i
+
+
+def _row_dict(table, i: int) -> dict:
+    return {name: table.columns[name][i] for name in table.schema.columns}
+
+
+def diff_tables(current, prev, rules: DiffRules) -> ChangeSet:
+    """현재/이전 데이터 비교 (TableData 두 개, 이전 데이터 해시 색인 한 번 + 현재 데이터 한 번 순회)
+
+    숫자로 읽을 수 없는 값은 비교에서 제외.
+    추가/삭제 행은 현재 데이터 순서, 이전 데이터 순서로 정리.
+    """
+    with METRICS.span("report.diff", dataset=rules.dataset):
+        return _diff_tables(current, prev, rules)
+
+
+def _diff_tables(current, prev, rules: DiffRules) -> ChangeSet:
+    changes = ChangeSet(rules)
+    prev_index = dict(_keyed_rows(prev, rules.key))
+    matched = bytearray(len(prev))
+    columns = [(field, rules.threshold(field), current.numbers(field), prev.numbers(field))
+               for field in rules.fields]
+
+    for index_key, i in _keyed_rows(current, rules.key):
+        j = prev_index.get(index_key)
+        if j is None:
+            changes.added.append(_row_dict(current, i))
+            continue
+        matched[j] = 1
+        for field, threshold, (values, valid), (prev_values, prev_valid) in columns:
+            if (values[i] != prev_values[j] and valid[i] and prev_valid[j]
+                    and threshold.exceeded(prev_values[j], values[i])):
+                changes.modified.append(FieldChange(index_key[0], field, prev_values[j], values[i]))
+
+    changes.removed = [_row_dict(prev, j) for j in range(len(prev)) if not matched[j]]
+    return changes
@@ -2,310 +2,1016 @@
 """
 ev.or.kr 케이지모빌리티 보조금 데이터 크롤링 스크립트
 전기승용 + 전기화물 차량의 전체 지역 보조금 데이터를 CSV로 저장
+(--years/--manufacturers로 연도 × 차종 × 제조사 매트릭스를 한 번에 크롤링하여 제조사별 CSV로도 저장)
 """
 
+import argparse
 import asyncio
-import csv
-import random
+import json
 import os
-import traceback
-from playwright.async_api import async_playwright, Page, BrowserContext
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+from browser_session import SessionCache
+from page_profile import DEFAULT_PROFILE, PROFILES, new_profiled_context
+from popup_fetch import KeepAliveHTTPPool, PopupFetcher, PopupRequestTemplate
+from crawl_journal import CrawlJournal
+from metrics import METRICS
+from region_catalog import RegionCatalog
+from region_state import RegionStateStore
+from run_log import add_logging_arguments, configure_from_args, flush_logs, get_logger, region_outcome
+from site_fixtures import SiteFixtures, add_fixture_arguments, fixtures_from_args
+from snapshot_io import add_snapshot_arguments, configure_snapshots, write_snapshot
+from table_extract import extract_rows
+from throttle import AdaptivePacer, CircuitBreaker, CircuitOpenError
+
+log = get_logger("kg")
+
+# 한국 시간대 (UTC+9)
+KST = timezone(timedelta(hours=9))
 
 # 스크립트 위치 기준 경로 설정
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 
-# 재시도 설정
+# 재시도 설정 (재시도 간 대기는 AdaptivePacer의 오류 백오프로 결정)
 MAX_RETRIES = 3
-RETRY_DELAY_SEC = 5
 TABLE_LOAD_TIMEOUT_MS = 15000
+POPUP_TIMEOUT_MS = 15000
+
+# 지역별 차종 보조금 팝업 링크
+REGION_LINK_SELECTOR = "a[onclick*='psPopupLocalCarModelPrice']"
+
+# 크롤링 기준년도 (기본값 - --years로 여러 연도 지정 가능)
+CRAWL_YEAR = "2026"
+
+# 차종 탭
+VEHICLE_CATEGORIES = ["전기승용", "전기화물"]
+
+# 제조사 필터 기본값 (None이면 전체 제조사)와 표기 별칭
+DEFAULT_MANUFACTURERS = ["케이지모빌리티"]
+MANUFACTURER_ALIASES = {
+    "케이지모빌리티": ["케이지모빌리티", "KG모빌리티"],
+}
+
+# 연도/제조사 매트릭스 크롤링 시 제조사별 CSV 저장 위치 (data/model_subsidy/<연도>/<제조사>.csv)
+MATRIX_DIR = os.path.join(DATA_DIR, "model_subsidy")
+
+# 팝업 동시 처리 설정
+# 팝업 요청 간 최소 간격은 기존 순차 크롤링의 최소 간격(대기 0.8 + 0.8 + 0.2초)과 같게 두어 최대 요청 속도는 그대로 유지.
+# 기존에는 지역마다 평균 대기 약 2.65초(0.8~1.5초 2회 + 0.2~0.5초)에 팝업 열기/추출 시간이 더해졌지만,
+# 작업자 풀은 응답을 기다리는 동안 다음 팝업을 시작하므로 지역당 시간이 이 간격에 가까워짐
+# (팝업 응답 1.5~2초 기준 지역당 4.2~4.7초 → 1.8초, 약 2.3~2.6배). 응답이 느려지거나 오류가 나면 limiter가 간격을 늘림.
+POPUP_CONCURRENCY = 4
+POPUP_MIN_INTERVAL_SEC = 1.8
+
+# 페이지/팝업 요청 간격 결정 기록 (실행마다 새로 작성)
+PACING_LOG_PATH = os.path.join(DATA_DIR, "pacing_crawl_ev_subsidy.jsonl")
+
+# 회로 차단기 설정
+# 최근 BREAKER_WINDOW개 팝업 요청 중 절반 이상이 실패했거나 BREAKER_SLOW_SECONDS보다 느리면
+# BREAKER_COOLDOWN_SECONDS초 동안 새 팝업을 멈추고, 차단이 BREAKER_MAX_TRIPS번을 넘으면 크롤링 중단
+BREAKER_WINDOW = 12
+BREAKER_MIN_SAMPLES = 6
+BREAKER_MAX_ERROR_RATE = 0.5
+BREAKER_SLOW_SECONDS = 12.0
+BREAKER_COOLDOWN_SECONDS = 60.0
+BREAKER_MAX_TRIPS = 2
+# 시험 요청의 결과를 기다리는 최대 시간 (페이싱 대기 + 팝업/표 대기 포함, 넘으면 다시 차단)
+BREAKER_PROBE_TIMEOUT_SECONDS = 60.0
+
+# 오류 예산: 재시도 후에도 실패한 지역이 조회 대상의 20%(최소 3개)를 넘으면 남은 지역은 다음 실행으로 미룸
+ERROR_BUDGET_RATIO = 0.2
+ERROR_BUDGET_MIN = 3
+
+# 일부 지역을 끝내 조회하지 못한 실행의 기록 (CSV는 덮어쓰지 않고, 다음 --resume 실행이 성공하면 삭제)
+PARTIAL_MARKER_FILE = os.path.join(DATA_DIR, "kg_crawl_partial.json")
+# 중단된 실행의 남은 지역을 다시 시도하기까지 대기 (데몬 모드의 다음 회차 앞당김)
+DEFERRED_RETRY_MINUTES = 15
+
+
+class PartialCrawlError(RuntimeError):
+    """일부 지역을 조회하지 못해 CSV를 저장하지 않은 실행 (완료 지역은 저널에 남아 --resume으로 이어서 진행)"""
+
+    def __init__(self, missing: list[str], reason: str, retry_after: float = DEFERRED_RETRY_MINUTES * 60):
+        super().__init__(f"{len(missing)}개 지역 미완료 ({reason}) - CSV 저장 생략, 부분 결과 기록: {PARTIAL_MARKER_FILE}")
+        self.missing = missing
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def new_pacer() -> AdaptivePacer:
+    """요청 간 최소 간격 POPUP_MIN_INTERVAL_SEC초를 보장하는 페이싱 컨트롤러"""
+    return AdaptivePacer("crawl_ev_subsidy", POPUP_MIN_INTERVAL_SEC, log_path=PACING_LOG_PATH)
+
+
+def new_breaker() -> CircuitBreaker:
+    """팝업 요청 오류율/지연을 감시하는 회로 차단기"""
+    return CircuitBreaker("kg_popup", BREAKER_WINDOW, BREAKER_MIN_SAMPLES, BREAKER_MAX_ERROR_RATE,
+                          BREAKER_SLOW_SECONDS, BREAKER_COOLDOWN_SECONDS, BREAKER_MAX_TRIPS,
+                          BREAKER_PROBE_TIMEOUT_SECONDS)
 
 
 async def wait_for_table_content(page: Page, description: str = "") -> bool:
     """테이블 콘텐츠 로드 대기 - 지역 링크가 있는 행이 나타날 때까지"""
     try:
-        print(f"[{description}] 테이블 로드 대기 중...")
+        log.debug(f"[{description}] 테이블 로드 대기 중...")
         await page.wait_for_function(
             """
-            () => {
+            (linkSelector) => {
                 const rows = document.querySelectorAll('table tbody tr');
                 if (rows.length === 0) return false;
-                const linksFound = document.querySelectorAll("a[onclick*='psPopupLocalCarModelPrice']");
-                return linksFound.length > 0;
+                return document.querySelectorAll(linkSelector).length > 0;
             }
             """,
+            arg=REGION_LINK_SELECTOR,
             timeout=TABLE_LOAD_TIMEOUT_MS
         )
         row_count = await page.eval_on_selector_all("table tbody tr", "rows => rows.length")
-        print(f"[{description}] 테이블 로드 완료 ({row_count}행 발견)")
+        log.debug(f"[{description}] 테이블 로드 완료 ({row_count}행 발견)")
         return True
     except Exception as e:
-        print(f"[{description}] 테이블 로드 대기 실패: {e}")
+        log.warning(f"[{description}] 테이블 로드 대기 실패: {e}")
         return False
 
 
-async def extract_kg_mobility_data(popup: Page, sido: str, district: str, vehicle_category: str) -> list[dict]:
-    """팝업 테이블에서 케이지모빌리티 데이터 추출"""
-    results = []
+def manufacturer_name(manufacturer: str) -> str:
+    """제조사 표기 통일 (별칭은 대표 이름으로)"""
+    manufacturer = manufacturer.strip()
+    for name, aliases in MANUFACTURER_ALIASES.items():
+        if any(alias in manufacturer for alias in aliases):
+            return name
+    return manufacturer
 
-    await popup.wait_for_load_state("load")
-    await asyncio.sleep(random.uniform(0.8, 1.5))
 
-    rows = await popup.query_selector_all("table tbody tr")
+def build_subsidy_records(rows: list[tuple[list[str], list[str]]], sido: str, district: str, vehicle_category: str,
+                          manufacturers: list[str] | None = DEFAULT_MANUFACTURERS) -> list[dict]:
+    """팝업 테이블 행(셀 목록)을 CSV 레코드로 변환 (manufacturers가 None이면 전체 제조사)"""
+    results = []
 
-    for row in rows:
-        cells = await row.query_selector_all("td")
+    for cells, _ in rows:
         if len(cells) < 6:
             continue
 
-        vehicle_type = await cells[0].inner_text()
-        manufacturer = await cells[1].inner_text()
-        manufacturer = manufacturer.strip()
+        vehicle_type, manufacturer, model, national_subsidy, local_subsidy, total_subsidy = cells[:6]
 
-        # 케이지모빌리티 필터링
-        if "케이지모빌리티" not in manufacturer and "KG모빌리티" not in manufacturer:
+        # 제조사 필터링
+        if manufacturers is not None and manufacturer_name(manufacturer) not in manufacturers:
             continue
 
-        model = await cells[2].inner_text()
-        national_subsidy = await cells[3].inner_text()
-        local_subsidy = await cells[4].inner_text()
-        total_subsidy = await cells[5].inner_text()
-
         results.append({
             "시도": sido,
             "지역구분": district,
             "세부차종": vehicle_category,
-            "제조사": manufacturer.strip(),
-            "모델명": model.strip(),
-            "국비(만원)": national_subsidy.strip().replace(",", ""),
-            "지방비(만원)": local_subsidy.strip().replace(",", ""),
-            "보조금(만원)": total_subsidy.strip().replace(",", ""),
+            "제조사": manufacturer,
+            "모델명": model,
+            "국비(만원)": national_subsidy.replace(",", ""),
+            "지방비(만원)": local_subsidy.replace(",", ""),
+            "보조금(만원)": total_subsidy.replace(",", ""),
         })
 
     return results
 
 
-async def get_region_links(page: Page, vehicle_category: str = "") -> list[tuple[str, str, str]]:
-    """지역 링크 정보 수집 (지역코드, 시도, 지역구분) - 재시도 로직 포함"""
+async def extract_subsidy_data(popup: Page, sido: str, district: str, vehicle_category: str,
+                               manufacturers: list[str] | None = DEFAULT_MANUFACTURERS) -> list[dict]:
+    """팝업 테이블에서 제조사 필터에 맞는 데이터 추출"""
+    await popup.wait_for_load_state("load")
+
+    rows = await extract_rows(popup.locator("table tbody tr"))
+    return build_subsidy_records(rows, sido, district, vehicle_category, manufacturers)
+
+
+async def mark_region_links(page: Page):
+    """현재 지역 링크에 표시를 남김 (탭 전환 후 새로 그려진 링크와 구분)"""
+    await page.evaluate("(selector) => document.querySelectorAll(selector).forEach(a => a.dataset.staleTab = '1')",
+                        REGION_LINK_SELECTOR)
+
+
+async def wait_for_tab_applied(page: Page, description: str = "") -> bool:
+    """탭 전환 반영 대기 - mark_region_links 이후 새로 그려진 지역 링크가 나타날 때까지"""
+    try:
+        await page.wait_for_function(
+            "(selector) => Array.from(document.querySelectorAll(selector)).some(a => !a.dataset.staleTab)",
+            arg=REGION_LINK_SELECTOR,
+            timeout=TABLE_LOAD_TIMEOUT_MS,
+        )
+        return True
+    except Exception as e:
+        log.warning(f"[{description}] 탭 전환 대기 실패: {e}")
+        return False
+
+
+@METRICS.timed("kg.get_region_links")
+async def get_region_links(page: Page, vehicle_category: str = "",
+                           limiter: AdaptivePacer | None = None) -> list[tuple[str, str, str]]:
+    """지역 링크 정보 수집 (지역코드, 시도, 지역구분) - 재시도 로직 포함
+
+    재시도는 서버 요청 없이 테이블 콘텐츠를 다시 기다리며, 실패는 limiter에 오류로 기록.
+    """
 
     for attempt in range(MAX_RETRIES):
         if attempt > 0:
-            print(f"[{vehicle_category}] 재시도 {attempt}/{MAX_RETRIES-1} ({RETRY_DELAY_SEC}초 대기 후)...")
-            await asyncio.sleep(RETRY_DELAY_SEC)
+            log.info(f"[{vehicle_category}] 재시도 {attempt}/{MAX_RETRIES-1}...")
 
         content_loaded = await wait_for_table_content(page, vehicle_category)
         if not content_loaded:
-            print(f"[{vehicle_category}] 테이블 로드 실패 - 재시도 예정")
+            log.warning(f"[{vehicle_category}] 테이블 로드 실패 - 재시도 예정")
+            if limiter is not None:
+                limiter.record(ok=False)
             continue
 
-        rows = await page.query_selector_all("table tbody tr")
+        rows = await extract_rows(page.locator("table tbody tr"), REGION_LINK_SELECTOR)
         region_info = []
 
-        for row in rows:
-            cells = await row.query_selector_all("td")
-            if len(cells) >= 3:
-                sido = await cells[0].inner_text()
-                district = await cells[1].inner_text()
+        for cells, onclick_args in rows:
+            if len(cells) >= 3 and onclick_args:
+                # psPopupLocalCarModelPrice('연도','지역코드','지역명')
+                region_code = onclick_args[1] if len(onclick_args) >= 2 else ""
+                region_info.append((region_code, cells[0], cells[1]))
 
-                link = await row.query_selector("a[onclick*='psPopupLocalCarModelPrice']")
-                if link:
-                    onclick = await link.get_attribute("onclick")
-                    if onclick:
-                        parts = onclick.split("'")
-                        region_code = parts[3] if len(parts) >= 4 else ""
-                        region_info.append((region_code, sido.strip(), district.strip()))
-
-        print(f"[{vehicle_category}] 시도 {attempt+1}: {len(region_info)}개 지역 발견")
+        log.info(f"[{vehicle_category}] 시도 {attempt+1}: {len(region_info)}개 지역 발견")
 
         if len(region_info) > 0:
             return region_info
 
-        print(f"[{vehicle_category}] 지역 없음 - 재시도 예정")
+        log.warning(f"[{vehicle_category}] 지역 없음 - 재시도 예정")
 
     raise RuntimeError(f"[{vehicle_category}] {MAX_RETRIES}회 시도 후에도 지역을 찾지 못함 - 크롤링 중단")
 
 
-async def crawl_vehicle_type(page: Page, context: BrowserContext, vehicle_category: str, tab_text: str) -> list[dict]:
-    """특정 차종(전기승용/전기화물)의 전체 지역 데이터 크롤링"""
-    all_data = []
-
-    # 해당 탭 클릭
-    print(f"\n[{vehicle_category}] 탭 선택 중...")
-    await page.click(f"text={tab_text}")
-    await asyncio.sleep(random.uniform(1.5, 2.5))
+async def open_region_popup(page: Page, context: BrowserContext, region_code: str, district: str,
+                            trigger_lock: asyncio.Lock, year: str = CRAWL_YEAR) -> Page:
+    """지역 팝업 열기 - 여러 작업자가 동시에 열어도 팝업이 섞이지 않도록 트리거 구간만 직렬화"""
+    async with trigger_lock:
+        async with context.expect_page(timeout=POPUP_TIMEOUT_MS) as popup_info:
+            await page.evaluate(
+                "([year, code, name]) => psPopupLocalCarModelPrice(year, code, name)",
+                [year, region_code, district],
+            )
+        return await popup_info.value
 
-    region_links = await get_region_links(page, vehicle_category)
-    region_count = len(region_links)
-    print(f"[{vehicle_category}] 총 {region_count}개 지역 크롤링 시작")
 
-    for i, (region_code, sido, district) in enumerate(region_links):
-        print(f"  [{i+1}/{region_count}] {sido} {district} 조회 중...", end=" ", flush=True)
+async def crawl_region(page: Page, context: BrowserContext, region: tuple[str, str, str], vehicle_category: str,
+                       limiter: AdaptivePacer, trigger_lock: asyncio.Lock,
+                       fetcher: PopupFetcher | None = None, year: str = CRAWL_YEAR,
+                       manufacturers: list[str] | None = DEFAULT_MANUFACTURERS,
+                       breaker: CircuitBreaker | None = None) -> tuple[list[dict], int]:
+    """단일 지역 팝업 크롤링 (재시도 포함) - (데이터, 재시도 횟수) 반환
 
-        try:
-            # 팝업 대기 설정
-            async with context.expect_page(timeout=15000) as popup_info:
-                # 해당 지역 조회 버튼 클릭
-                await page.click(f"a[onclick*=\"psPopupLocalCarModelPrice('{page.url.split('year1=')[-1][:4] if 'year1=' in page.url else '2026'}','{region_code}'\"]")
+    fetcher가 주어지면 브라우저 팝업 대신 HTTP로 직접 조회.
+    재시도 전 대기는 따로 두지 않고 limiter가 오류 후 늘어난 요청 간격으로 대기.
+    breaker가 주어지면 시도마다 결과를 기록하고, 차단 중이면 풀릴 때까지 대기 (중단되면 CircuitOpenError).
+    """
+    region_code, sido, district = region
 
-            popup = await popup_info.value
-            await asyncio.sleep(random.uniform(0.8, 1.5))
-
-            # 데이터 추출
-            data = await extract_kg_mobility_data(popup, sido, district, vehicle_category)
+    for attempt in range(MAX_RETRIES):
+        if breaker is not None:
+            await breaker.acquire()
+        # 모든 작업자가 공유하는 요청 간격 (최소 간격 보장, 응답 지연/오류 시 늘어남)
+        await limiter.acquire("재시도" if attempt else "팝업")
 
-            # 차종 검증
-            validated_data = [d for d in data if vehicle_category in d.get("세부차종", "")]
-            if len(validated_data) != len(data):
-                print(f"  경고: {len(data) - len(validated_data)}건 차종 불일치로 제외")
+        popup = None
+        start = time.monotonic()
+        try:
+            with limiter.measure():
+                if fetcher is not None:
+                    with METRICS.span("kg.fetch", category=vehicle_category):
+                        rows = await fetcher.fetch_rows(year, region_code, district)
+                    data = build_subsidy_records(rows, sido, district, vehicle_category, manufacturers)
+                else:
+                    with METRICS.span("kg.popup_open", category=vehicle_category):
+                        popup = await open_region_popup(page, context, region_code, district, trigger_lock, year)
+                    with METRICS.span("kg.extract", category=vehicle_category):
+                        data = await extract_subsidy_data(popup, sido, district, vehicle_category, manufacturers)
+            if breaker is not None:
+                breaker.record(ok=True, latency=time.monotonic() - start)
+            return data, attempt
+        except Exception as e:
+            if breaker is not None:
+                breaker.record(ok=False)
+            if attempt == MAX_RETRIES - 1:
+                raise
+            METRICS.add("kg.retries", category=vehicle_category)
+            log.info(f"  [{sido} {district}] {type(e).__name__}: {e} - 재시도 {attempt + 1}/{MAX_RETRIES - 1}")
+        finally:
+            if popup is not None:
+                try:
+                    await popup.close()
+                except Exception:
+                    pass
+
+
+@METRICS.timed("kg.fetch_prepare")
+async def prepare_popup_fetcher(page: Page, context: BrowserContext, region: tuple[str, str, str], vehicle_category: str,
+                                limiter: AdaptivePacer, trigger_lock: asyncio.Lock, popup_origin: str | None = None,
+                                record_dir: str | None = None, year: str = CRAWL_YEAR,
+                                manufacturers: list[str] | None = DEFAULT_MANUFACTURERS
+                                ) -> tuple[PopupFetcher | None, list[dict]]:
+    """직접 조회 모드 준비 - (fetcher, 첫 지역 데이터) 반환
+
+    첫 지역 팝업만 브라우저로 열어 팝업 요청(URL/본문/헤더)과 세션 쿠키를 확보하고,
+    같은 지역을 HTTP로 다시 조회해 브라우저 결과와 같을 때만 fetcher를 반환.
+    다르면 None을 반환하여 브라우저 모드로 진행.
+    """
+    region_code, sido, district = region
+
+    await limiter.acquire("직접 조회 준비")
+    async with context.expect_event(
+        "request",
+        predicate=lambda r: r.is_navigation_request() and r.frame != page.main_frame,
+        timeout=POPUP_TIMEOUT_MS,
+    ) as request_info:
+        popup = await open_region_popup(page, context, region_code, district, trigger_lock, year)
+    try:
+        request = await request_info.value
+        headers = await request.all_headers()
+        browser_data = await extract_subsidy_data(popup, sido, district, vehicle_category, manufacturers)
+    finally:
+        await popup.close()
 
-            all_data.extend(validated_data)
-            print(f"케이지모빌리티 {len(validated_data)}건")
+    try:
+        template = PopupRequestTemplate(request.method, request.url, request.post_data, headers,
+                                        year, region_code, district)
+    except ValueError as e:
+        log.warning(f"[{year} {vehicle_category}] 직접 조회 모드 사용 불가 - 브라우저 모드로 진행: {e}")
+        return None, browser_data
+
+    cookies = await context.cookies(request.url)
+    cookie_header = "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+    pool = KeepAliveHTTPPool(popup_origin or template.origin, POPUP_CONCURRENCY, {"Cookie": cookie_header})
+    fetcher = PopupFetcher(template, pool, record_dir)
+
+    # 브라우저 결과와 HTTP 조회 결과 비교 (CSV 출력 동일성 보장)
+    await limiter.acquire("직접 조회 확인")
+    try:
+        with limiter.measure():
+            fetched_data = build_subsidy_records(await fetcher.fetch_rows(year, region_code, district),
+                                                 sido, district, vehicle_category, manufacturers)
+    except Exception as e:
+        fetched_data = None
+        log.warning(f"[{year} {vehicle_category}] 직접 조회 확인 실패 ({type(e).__name__}: {e})")
+
+    if fetched_data != browser_data:
+        log.warning(f"[{year} {vehicle_category}] 직접 조회 결과가 브라우저 결과와 다름 - 브라우저 모드로 진행")
+        fetcher.close()
+        return None, browser_data
+
+    log.info(f"[{year} {vehicle_category}] 직접 조회 모드 사용: {template.method} {template.origin}{template.path}")
+    return fetcher, browser_data
+
+
+class CrawlLane:
+    """매트릭스의 (연도, 차종) 한 칸 - 해당 연도/탭이 선택된 전용 페이지와 지역 목록, 결과를 보관
+
+    팝업 내용은 페이지에서 선택된 차종 탭에 따라 달라지므로 칸마다 페이지를 따로 둠.
+    context: 페이지가 속한 컨텍스트 (칸마다 따로 두면 다른 칸과 팝업 감지가 겹치지 않음)
+    """
+
+    def __init__(self, year: str, vehicle_category: str, page: Page, context: BrowserContext):
+        self.year = year
+        self.vehicle_category = vehicle_category
+        self.page = page
+        self.context = context
+        self.label = f"{year} {vehicle_category}"
+        self.region_links: list[tuple[str, str, str]] = []
+        self.results: list[list[dict]] = []
+        self.region_state: RegionStateStore | None = None
+        self.fetcher: PopupFetcher | None = None
+        # 지역 카탈로그로 시작한 경우 실제 지역 표를 읽는 작업 (reconcile_region_catalog에서 확인)
+        self.region_check: asyncio.Task | None = None
+        # 끝내 조회하지 못한 지역 번호 (실패 또는 회로 차단기 중단으로 미룬 지역)
+        self.missing: list[int] = []
+
+    def rows(self) -> list[dict]:
+        """지역 목록 순서대로 합친 결과"""
+        all_data = []
+        for region_data in self.results:
+            all_data.extend(region_data)
+        return all_data
+
+
+async def load_region_links(page: Page, label: str, limiter: AdaptivePacer,
+                            clicked_at: float) -> list[tuple[str, str, str]]:
+    """탭 선택 후 지역 표가 뜨기를 기다려 지역 링크 수집 (탭 응답 시간은 limiter에 기록)"""
+    content_loaded = await wait_for_table_content(page, label)
+    limiter.record(time.monotonic() - clicked_at, ok=content_loaded)
+    return await get_region_links(page, label, limiter)
+
+
+@METRICS.timed("kg.open_lane")
+async def open_lane(context: BrowserContext, year: str, vehicle_category: str, limiter: AdaptivePacer,
+                    catalog: RegionCatalog | None = None) -> CrawlLane:
+    """컨텍스트에 새 페이지를 열어 연도/차종 탭을 선택하고 지역 목록까지 수집
+
+    고정 대기 없이 단계마다 화면 준비 신호(연도 선택 요소, 선택된 연도 값, 지역 링크 행)를 기다리며,
+    서버 요청이 생기는 단계(접속/연도 선택/탭 선택)는 limiter의 요청 간격을 따름.
+    catalog에 이 칸의 지역 목록이 있으면 탭 전환이 반영된 것(새로 그려진 첫 지역 링크)만 확인하고
+    그 목록으로 바로 반환하며, 실제 지역 표 전체(행 수/해시)는 lane.region_check 작업으로 뒤에서 읽음.
+    (팝업 내용은 선택된 탭에 따라 다르므로 탭 전환 전에 팝업을 열면 이전 탭의 차종 결과가 섞임)
+    """
+    page = await context.new_page()
+    lane = CrawlLane(year, vehicle_category, page, context)
+
+    # 메인 페이지 접속 (networkidle 대신 연도 선택 요소 표시를 기준으로 대기)
+    log.info(f"[{lane.label}] 메인 페이지 접속 중...")
+    await limiter.acquire("페이지 접속")
+    with limiter.measure():
+        await page.goto("https://ev.or.kr/nportal/buySupprt/initPsLocalCarPirceAction.do", wait_until="domcontentloaded")
+        await page.wait_for_selector("select#year1", timeout=30000)
+
+    log.info(f"[{lane.label}] 기준년도: {year}년 선택")
+    await limiter.acquire("연도 선택")
+    with limiter.measure():
+        await page.select_option("select#year1", year)
+        # 연도 변경으로 페이지가 다시 로드되어도 선택 값이 반영된 뒤 진행
+        await page.wait_for_function(
+            "(year) => { const select = document.querySelector('select#year1'); return select && select.value === year; }",
+            arg=year,
+            timeout=30000,
+        )
 
-            # 팝업 닫기
-            await popup.close()
+    cached = catalog.lookup(year, vehicle_category) if catalog is not None else None
+    if cached:
+        await mark_region_links(page)
+
+    log.info(f"[{lane.label}] 탭 선택 중...")
+    await limiter.acquire("탭 선택")
+    start = time.monotonic()
+    await page.click(f"text={vehicle_category}")
+
+    if cached and not await wait_for_tab_applied(page, lane.label):
+        # 탭 전환을 확인하지 못하면 카탈로그 목록으로 시작하지 않고 지역 표를 끝까지 읽음
+        cached = None
+    if cached:
+        log.info(f"[{lane.label}] 지역 카탈로그의 {len(cached)}개 지역으로 시작 (지역 표는 뒤에서 확인)")
+        lane.region_links = cached
+        lane.region_check = asyncio.create_task(load_region_links(page, lane.label, limiter, start))
+    else:
+        lane.region_links = await load_region_links(page, lane.label, limiter, start)
+        if catalog is not None:
+            catalog.store(year, vehicle_category, lane.region_links)
+    lane.results = [[] for _ in lane.region_links]
+    return lane
+
+
+@METRICS.timed("kg.crawl_lanes")
+async def crawl_lanes(lanes: list[CrawlLane], limiter: AdaptivePacer | None = None, fetch_mode: bool = False, popup_origin: str | None = None, record_dir: str | None = None,
+                      journal: CrawlJournal | None = None,
+                      manufacturers: list[str] | None = DEFAULT_MANUFACTURERS,
+                      breaker: CircuitBreaker | None = None):
+    """여러 (연도, 차종) 칸의 지역 팝업을 하나의 작업자 풀로 크롤링 (팝업 작업자 풀 + 공유 페이싱 컨트롤러/회로 차단기)
+
+    POPUP_CONCURRENCY개의 팝업을 동시에 처리하되, 팝업 요청 간격은 limiter가 응답 지연/오류에 맞춰 조절.
+    팝업 열기는 컨텍스트 단위로 직렬화하므로 칸마다 컨텍스트가 다르면 칸끼리는 서로 기다리지 않음.
+    작업 순서는 칸을 번갈아 섞어 한 칸이 끝날 때까지 다른 칸이 기다리지 않게 함.
+    결과는 완료 순서와 무관하게 칸별 지역 목록 순서대로 lane.results에 저장.
+    fetch_mode이면 칸마다 첫 지역만 브라우저로 열고 나머지는 HTTP로 직접 조회
+    (popup_origin: 팝업 조회 대상 변경 - 로컬 대역 서버 등, record_dir: 응답 녹화 디렉터리).
+    lane.region_state가 있으면 접수현황 공고 내용이 그대로인 지역은 이전 결과를 재사용 (증분 크롤링).
+    journal이 주어지면 지역별 결과를 즉시 기록하고, 저널에 완료로 남은 지역은 건너뜀 (재개).
+    breaker(없으면 새로 생성)가 오류율/지연으로 차단되면 새 팝업을 멈췄다가 재개하고,
+    중단되거나 실패 지역이 오류 예산을 넘으면 남은 지역은 조회하지 않고 lane.missing에 남김.
+    """
+    own_limiter = limiter is None
+    if own_limiter:
+        limiter = new_pacer()
+    own_breaker = breaker is None
+    if own_breaker:
+        breaker = new_breaker()
+    # 팝업은 컨텍스트 단위로 감지하므로 같은 컨텍스트의 칸끼리 트리거 잠금을 공유
+    trigger_locks: dict[int, asyncio.Lock] = {}
+    for lane in lanes:
+        trigger_locks.setdefault(id(lane.context), asyncio.Lock())
+
+    pending_by_lane: list[list[int]] = []
+    for lane in lanes:
+        pending = list(range(len(lane.region_links)))
+        # 저널에서 재개한 지역도 새로 조회한 지역과 같이 요약 지문과 함께 기록되도록 먼저 로드
+        if lane.region_state is not None:
+            await lane.region_state.load_summaries()
+
+        # 재개: 이전 실행 저널에서 완료된 지역은 저장된 결과 사용
+        if journal is not None:
+            remaining = []
+            for i in pending:
+                region_code, sido, district = lane.region_links[i]
+                journaled = journal.completed_rows(lane.year, lane.vehicle_category, region_code)
+                if journaled is None:
+                    remaining.append(i)
+                else:
+                    lane.results[i] = journaled
+                    if lane.region_state is not None:
+                        lane.region_state.record(region_code, sido, district, lane.vehicle_category, journaled)
+            METRICS.add("kg.regions", len(pending) - len(remaining), source="journal")
+            if len(remaining) != len(pending):
+                log.info(f"[{lane.label}] 저널에서 완료 지역 {len(pending) - len(remaining)}개 재개")
+            pending = remaining
+
+        # 증분 크롤링: 재사용 가능한 지역은 이전 결과로 채우고 나머지만 조회
+        if lane.region_state is not None:
+            remaining = []
+            for i in pending:
+                region_code, sido, district = lane.region_links[i]
+                cached = lane.region_state.lookup(region_code, sido, district, lane.vehicle_category)
+                if cached is None:
+                    remaining.append(i)
+                else:
+                    lane.results[i] = cached
+            METRICS.add("kg.regions", len(pending) - len(remaining), source="cached")
+            log.info(f"[{lane.label}] 변경 없는 지역 {len(pending) - len(remaining)}개는 이전 결과 재사용")
+            pending = remaining
+
+        pending_by_lane.append(pending)
+
+    fetch_count = sum(len(pending) for pending in pending_by_lane)
+    done_count = 0
+    error_budget = max(ERROR_BUDGET_MIN, int(fetch_count * ERROR_BUDGET_RATIO))
+    failed_regions: set[tuple[int, int]] = set()
+    log.info(f"[{len(lanes)}개 칸] 총 {fetch_count}개 지역 크롤링 시작 (동시 팝업 {POPUP_CONCURRENCY}개)")
+
+    def record_result(lane: CrawlLane, i: int, data: list[dict]):
+        region_code, sido, district = lane.region_links[i]
+        METRICS.add("kg.regions", source="fetched")
+        METRICS.add("kg.rows", len(data), category=lane.vehicle_category)
+        lane.results[i] = data
+        if lane.region_state is not None:
+            lane.region_state.record(region_code, sido, district, lane.vehicle_category, data)
+        if journal is not None:
+            journal.append(lane.year, lane.vehicle_category, region_code, sido, district, rows=data)
+
+    async def prepare_fetcher(lane: CrawlLane, pending: list[int]):
+        """칸의 첫 지역으로 직접 조회 준비 (칸마다 동시에 진행)"""
+        nonlocal done_count
+        first = pending[0]
+        _, sido, district = lane.region_links[first]
+        start = time.monotonic()
+        try:
+            lane.fetcher, first_data = await prepare_popup_fetcher(
+                lane.page, lane.context, lane.region_links[first], lane.vehicle_category, limiter,
+                trigger_locks[id(lane.context)], popup_origin, record_dir, lane.year, manufacturers,
+            )
+        except Exception as e:
+            log.warning(f"[{lane.label}] 직접 조회 준비 실패 - 브라우저 모드로 진행", exc_info=e)
+            return
+        pending.pop(0)
+        record_result(lane, first, first_data)
+        done_count += 1
+        region_outcome(log, f"  [{done_count}/{fetch_count}] {lane.label} {sido} {district}: {len(first_data)}건",
+                       lane.label, sido, district, "ok", len(first_data), time.monotonic() - start,
+                       done=done_count, total=fetch_count)
+
+    if fetch_mode:
+        await asyncio.gather(*(prepare_fetcher(lane, pending)
+                               for lane, pending in zip(lanes, pending_by_lane) if pending))
+
+    async def run_pool(tasks: list[tuple[int, int]]) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+        """작업자 풀로 (칸 번호, 지역 번호) 목록 처리 - (실패한 작업, 차단기 중단으로 미룬 작업) 반환"""
+        nonlocal done_count
+        queue: asyncio.Queue[tuple[int, int]] = asyncio.Queue()
+        for task in tasks:
+            queue.put_nowait(task)
+        failed: list[tuple[int, int]] = []
+        deferred: list[tuple[int, int]] = []
+
+        async def worker():
+            nonlocal done_count
+            while True:
+                try:
+                    lane_index, i = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                lane = lanes[lane_index]
+                region_code, sido, district = lane.region_links[i]
+                start = time.monotonic()
+                try:
+                    data, retries = await crawl_region(lane.page, lane.context, lane.region_links[i],
+                                                       lane.vehicle_category, limiter,
+                                                       trigger_locks[id(lane.context)],
+                                                       lane.fetcher, lane.year, manufacturers, breaker)
+                except CircuitOpenError:
+                    # 크롤링 중단 - 이 지역과 대기 중인 지역은 조회하지 않고 미룸
+                    deferred.append((lane_index, i))
+                    while not queue.empty():
+                        deferred.append(queue.get_nowait())
+                    return
+                except Exception as e:
+                    done_count += 1
+                    failed.append((lane_index, i))
+                    if journal is not None:
+                        journal.append(lane.year, lane.vehicle_category, region_code, sido, district,
+                                       error=f"{type(e).__name__}: {e}")
+                    region_outcome(log, f"  [{done_count}/{fetch_count}] 오류 발생: {lane.label} {sido} {district}",
+                                   lane.label, sido, district, "failed", latency=time.monotonic() - start,
+                                   retries=MAX_RETRIES - 1, done=done_count, total=fetch_count, exc=e)
+                    failed_regions.add((lane_index, i))
+                    if len(failed_regions) > error_budget:
+                        breaker.abort(f"실패 지역 {len(failed_regions)}개 - 오류 예산 {error_budget}개 초과")
+                    continue
+
+                # 차종 검증
+                validated_data = [d for d in data if lane.vehicle_category in d.get("세부차종", "")]
+                if len(validated_data) != len(data):
+                    log.warning(f"  [{lane.label} {sido} {district}] {len(data) - len(validated_data)}건 차종 불일치로 제외")
+
+                record_result(lane, i, validated_data)
+                done_count += 1
+                retry_text = f" (재시도 {retries}회)" if retries else ""
+                region_outcome(log, f"  [{done_count}/{fetch_count}] {lane.label} {sido} {district}: "
+                                    f"{len(validated_data)}건{retry_text}",
+                               lane.label, sido, district, "ok", len(validated_data), time.monotonic() - start,
+                               retries, done=done_count, total=fetch_count)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(POPUP_CONCURRENCY, len(tasks)))]
+        await asyncio.gather(*workers)
+        return sorted(failed), deferred
+
+    # 칸을 번갈아 가며 작업 순서 구성 (칸1 지역1, 칸2 지역1, 칸1 지역2, ...)
+    tasks = [
+        (lane_index, pending[k])
+        for k in range(max((len(p) for p in pending_by_lane), default=0))
+        for lane_index, pending in enumerate(pending_by_lane)
+        if k < len(pending)
+    ]
 
+    try:
+        failed, deferred = await run_pool(tasks)
+
+        # 마지막으로 실패한 지역만 한 번 더 시도 (중단되지 않았을 때만, 차단 중이면 풀릴 때까지 대기 후 진행)
+        if failed and not breaker.aborted:
+            log.info(f"실패 지역 {len(failed)}개 재시도 (요청 간격 {limiter.interval:.1f}초)...")
+            done_count -= len(failed)
+            failed, retry_deferred = await run_pool(failed)
+            deferred.extend(retry_deferred)
+    finally:
+        for lane in lanes:
+            if lane.fetcher is not None:
+                lane.fetcher.close()
+                lane.fetcher = None
+        if own_limiter:
+            limiter.print_summary()
+            limiter.close()
+        if own_breaker:
+            breaker.print_summary()
+
+    if failed:
+        METRICS.add("kg.regions", len(failed), source="failed")
+        names = ", ".join(f"{lanes[l].label} {lanes[l].region_links[i][1]} {lanes[l].region_links[i][2]}"
+                          for l, i in failed)
+        log.error(f"실패 지역 {len(failed)}개: {names}")
+    if deferred:
+        METRICS.add("kg.regions", len(deferred), source="deferred")
+        log.error(f"크롤링 중단으로 {len(deferred)}개 지역 미조회 ({breaker.reason}) - 다음 실행으로 미룸")
+    for lane_index, i in sorted(failed + deferred):
+        lanes[lane_index].missing.append(i)
+
+
+@METRICS.timed("kg.reconcile_regions")
+async def reconcile_region_catalog(lanes: list[CrawlLane], catalog: RegionCatalog, limiter: AdaptivePacer,
+                                   fetch_mode: bool = False, popup_origin: str | None = None,
+                                   record_dir: str | None = None, journal: CrawlJournal | None = None,
+                                   manufacturers: list[str] | None = DEFAULT_MANUFACTURERS,
+                                   breaker: CircuitBreaker | None = None):
+    """카탈로그로 시작한 칸의 실제 지역 표 확인
+
+    행 수/해시가 카탈로그와 같으면 그대로 두고, 다르면 카탈로그를 갱신한 뒤 새로 생긴 지역만 추가 조회하고
+    사라진 지역의 결과는 제외. 지역 표를 끝내 읽지 못하면 카탈로그 목록의 결과를 그대로 사용.
+    lane.missing도 새 지역 목록 기준으로 맞춤.
+    """
+    extra_lanes: list[tuple[CrawlLane, CrawlLane]] = []
+    for lane in lanes:
+        if lane.region_check is None:
+            continue
+        try:
+            fresh = await lane.region_check
         except Exception as e:
-            print(f"오류 발생: {sido} {district}")
-            print(f"  에러 타입: {type(e).__name__}")
-            print(f"  에러 메시지: {str(e)}")
-            print(f"  스택 트레이스:")
-            print(traceback.format_exc())
-            # 열린 팝업이 있으면 닫기
-            try:
-                pages = context.pages
-                for p in pages[1:]:
-                    await p.close()
-            except Exception:
-                pass
+            log.warning(f"[{lane.label}] 지역 표 확인 실패 - 카탈로그 목록 그대로 사용", exc_info=e)
             continue
+        finally:
+            lane.region_check = None
 
-    return all_data
-
-
-async def crawl_all_regions(page: Page, context: BrowserContext, vehicle_category: str) -> list[dict]:
-    """전체 지역 크롤링 (개선된 버전)"""
-    all_data = []
+        if not catalog.store(lane.year, lane.vehicle_category, fresh):
+            METRICS.add("kg.region_catalog", result="valid")
+            continue
+        METRICS.add("kg.region_catalog", result="stale")
+
+        previous = dict(zip(lane.region_links, lane.results))
+        missing = {lane.region_links[i] for i in lane.missing}
+        added = [region for region in fresh if region not in previous]
+        removed = len(set(previous) - set(fresh))
+        log.warning(f"[{lane.label}] 지역 목록이 카탈로그와 다름 - 갱신 (추가 {len(added)}개, 삭제 {removed}개)")
+        lane.region_links = fresh
+        lane.results = [previous.get(region, []) for region in fresh]
+        lane.missing = [i for i, region in enumerate(fresh) if region in missing]
+        if added:
+            extra = CrawlLane(lane.year, lane.vehicle_category, lane.page, lane.context)
+            extra.region_links = added
+            extra.results = [[] for _ in added]
+            extra.region_state = lane.region_state
+            extra_lanes.append((lane, extra))
+
+    if extra_lanes:
+        await crawl_lanes([extra for _, extra in extra_lanes], limiter, fetch_mode, popup_origin, record_dir,
+                          journal, manufacturers, breaker)
+        for lane, extra in extra_lanes:
+            index = {region: i for i, region in enumerate(lane.region_links)}
+            for region, data in zip(extra.region_links, extra.results):
+                lane.results[index[region]] = data
+            lane.missing = sorted(lane.missing + [index[extra.region_links[i]] for i in extra.missing])
+
+
+@METRICS.timed("kg.crawl_all_regions")
+async def crawl_all_regions(page: Page, context: BrowserContext, vehicle_category: str,
+                            limiter: AdaptivePacer | None = None, fetch_mode: bool = False,
+                            popup_origin: str | None = None, record_dir: str | None = None,
+                            region_state: RegionStateStore | None = None,
+                            journal: CrawlJournal | None = None, year: str = CRAWL_YEAR,
+                            manufacturers: list[str] | None = DEFAULT_MANUFACTURERS) -> list[dict]:
+    """이미 연도/탭이 선택된 페이지 하나의 전체 지역 크롤링 (crawl_lanes의 한 칸짜리 실행)
+
+    조회하지 못한 지역이 있으면 줄어든 결과 대신 PartialCrawlError 발생.
+    """
+    lane = CrawlLane(year, vehicle_category, page, context)
+    lane.region_links = await get_region_links(page, vehicle_category, limiter)
+    lane.results = [[] for _ in lane.region_links]
+    lane.region_state = region_state
+    await crawl_lanes([lane], limiter, fetch_mode, popup_origin, record_dir, journal, manufacturers)
+    if lane.missing:
+        raise PartialCrawlError([f"{lane.label} {lane.region_links[i][1]} {lane.region_links[i][2]}"
+                                 for i in lane.missing], "실패 지역")
+    return lane.rows()
+
+
+def write_partial_marker(lanes: list[CrawlLane], reason: str, breaker: CircuitBreaker, retry_after: float):
+    """조회하지 못한 지역과 수집 현황을 부분 결과 기록 파일에 저장 (임시 파일 작성 후 교체)"""
+    now = datetime.now(KST)
+    marker = {
+        "created_at": now.isoformat(timespec="seconds"),
+        "reason": reason,
+        "retry_after": (now + timedelta(seconds=retry_after)).isoformat(timespec="seconds"),
+        "total_regions": sum(len(lane.region_links) for lane in lanes),
+        "collected_regions": sum(len(lane.region_links) - len(lane.missing) for lane in lanes),
+        "collected_rows": sum(len(lane.rows()) for lane in lanes),
+        "missing": [
+            {"year": lane.year, "category": lane.vehicle_category, "region_code": lane.region_links[i][0],
+             "sido": lane.region_links[i][1], "district": lane.region_links[i][2]}
+            for lane in lanes for i in lane.missing
+        ],
+        "breaker": {"state": breaker.state, "trips": breaker.trips, "paused": round(breaker.paused, 1)},
+    }
+    os.makedirs(os.path.dirname(PARTIAL_MARKER_FILE), exist_ok=True)
+    tmp_file = f"{PARTIAL_MARKER_FILE}.{os.getpid()}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(marker, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_file, PARTIAL_MARKER_FILE)
+
+
+async def crawl_with_browser(browser: Browser, fetch_mode: bool = False, popup_origin: str | None = None,
+                             record_dir: str | None = None, profile: str = DEFAULT_PROFILE,
+                             incremental: bool = False, summary_source=None, resume: bool = False,
+                             years: list[str] | None = None, categories: list[str] | None = None,
+                             manufacturers: list[str] | None = DEFAULT_MANUFACTURERS,
+                             session: SessionCache | None = None, fixtures: SiteFixtures | None = None,
+                             refresh_regions: bool = False) -> list[dict]:
+    """이미 실행 중인 브라우저로 (연도 × 차종) 매트릭스 크롤링 후 CSV 저장 (통합 실행기에서 사용)
+
+    칸마다 별도 컨텍스트를 사용하므로 다른 크롤러와 같은 브라우저에서 동시에 실행 가능하고,
+    칸끼리도 쿠키/팝업 감지가 섞이지 않음.
+    모든 칸의 페이지를 먼저 준비한 뒤 지역 팝업은 하나의 작업자 풀과 공유 속도 제한으로 함께 처리.
+    팝업 하나의 결과는 제조사 필터(manufacturers, None이면 전체)에 맞는 행만 남겨 제조사별로 나눠 저장.
+    incremental이면 지역별 상태 저장소로 변경 없는 지역을 건너뜀
+    (기본 연도/케이지모빌리티 칸만 해당, summary_source: 접수현황 크롤링 결과 awaitable, 없으면 저장된 접수현황 CSV 사용).
+    지역별 결과는 저널에 바로 기록되며, resume이면 이전 실행 저널의 완료 지역을 건너뜀.
+    session을 넘기면 저장된 쿠키/세션으로 컨텍스트를 시작하고 지역 목록 확보 후 다시 저장.
+    fixtures를 넘기면 ev.or.kr 응답을 녹화하거나 로컬 대역 서버의 녹화본으로 재생 (직접 조회도 같은 대상 사용).
+    지역 카탈로그에 목록이 있는 칸은 지역 표를 기다리지 않고 바로 팝업 조회를 시작하며,
+    지역 표가 카탈로그와 다르면 끝난 뒤 바뀐 지역만 맞춤 (refresh_regions이면 카탈로그 목록을 쓰지 않음).
+    사이트 오류가 이어져 회로 차단기가 크롤링을 중단하는 등 끝내 조회하지 못한 지역이 있으면 줄어든 CSV를 저장하지 않고
+    부분 결과 기록(PARTIAL_MARKER_FILE)을 남긴 뒤 PartialCrawlError 발생 (저널은 남겨 --resume으로 이어서 진행).
+    반환값은 기본 연도의 케이지모빌리티 결과 (kg_mobility_subsidy.csv 내용).
+    """
+    years = years or [CRAWL_YEAR]
+    categories = categories or VEHICLE_CATEGORIES
+    if fixtures is not None:
+        popup_origin = popup_origin or fixtures.replay_origin
+        record_dir = record_dir or fixtures.record_dir
+    matrix_mode = years != [CRAWL_YEAR] or manufacturers != DEFAULT_MANUFACTURERS
+
+    # 전체 칸에서 공유하는 페이지/팝업 요청 간격 (실행 끝에 대기 시간 합계 출력)
+    limiter = new_pacer()
+    breaker = new_breaker()
+    # 이전 KG CSV를 덮어쓰기 전에 로드해야 하므로 크롤링 시작 전에 생성
+    # (상태 저장소의 이전 결과는 KG CSV이므로 제조사 필터가 기본값일 때만 사용)
+    region_state = None
+    if incremental:
+        if CRAWL_YEAR in years and manufacturers == DEFAULT_MANUFACTURERS:
+            region_state = RegionStateStore(CRAWL_YEAR, summary_source)
+        else:
+            log.info("증분 크롤링은 기본 연도/케이지모빌리티 크롤링에만 적용 - 전체 지역 조회")
+    journal = CrawlJournal(resume=resume)
+    catalog = RegionCatalog(refresh=refresh_regions)
+
+    lanes: list[CrawlLane] = []
+    contexts: list[BrowserContext] = []
+    try:
+        # 칸별 컨텍스트/페이지 준비(연도/탭 선택, 지역 목록 수집)는 동시에 진행하되 동시 페이지 수는 제한
+        cells = [(year, vehicle_category) for year in years for vehicle_category in categories]
+        page_slots = asyncio.Semaphore(POPUP_CONCURRENCY)
+
+        async def open_cell(year: str, vehicle_category: str) -> CrawlLane:
+            async with page_slots:
+                context = await new_profiled_context(browser, profile, setup=fixtures.attach if fixtures else None,
+                                                     **(session.context_kwargs() if session else {}))
+                contexts.append(context)
+                return await open_lane(context, year, vehicle_category, limiter, catalog)
+
+        opened = await asyncio.gather(*(open_cell(*cell) for cell in cells), return_exceptions=True)
+        for (year, vehicle_category), lane in zip(cells, opened):
+            if isinstance(lane, BaseException):
+                if not matrix_mode:
+                    raise lane
+                log.error(f"[{year} {vehicle_category}] 칸 준비 실패 - 건너뜀", exc_info=lane)
+                continue
+            if year == CRAWL_YEAR:
+                lane.region_state = region_state
+            lanes.append(lane)
+        if session and lanes:
+            await session.save(lanes[0].context)
+
+        await crawl_lanes(lanes, limiter, fetch_mode, popup_origin, record_dir, journal, manufacturers, breaker)
+        await reconcile_region_catalog(lanes, catalog, limiter, fetch_mode, popup_origin, record_dir, journal,
+                                       manufacturers, breaker)
+    finally:
+        for lane in lanes:
+            if lane.region_check is not None:
+                lane.region_check.cancel()
+        await asyncio.gather(*(context.close() for context in contexts), return_exceptions=True)
+        catalog.save()
+        journal.close()
+        limiter.print_summary()
+        limiter.close()
+        breaker.print_summary()
+
+    missing = [f"{lane.label} {lane.region_links[i][1]} {lane.region_links[i][2]}"
+               for lane in lanes for i in lane.missing]
+    if missing:
+        reason = breaker.reason if breaker.aborted else f"재시도 후 실패 지역 {len(missing)}개"
+        retry_after = DEFERRED_RETRY_MINUTES * 60
+        write_partial_marker(lanes, reason, breaker, retry_after)
+        raise PartialCrawlError(missing, reason, retry_after)
+
+    kg_results = []
+    for lane in lanes:
+        if lane.year == CRAWL_YEAR:
+            kg_results.extend(row for row in lane.rows() if manufacturer_name(row["제조사"]) == "케이지모빌리티")
+
+    if CRAWL_YEAR in years and (manufacturers is None or "케이지모빌리티" in manufacturers):
+        save_kg_csv(kg_results)
+    if matrix_mode:
+        for year in years:
+            year_lanes = [lane for lane in lanes if lane.year == year]
+            if not year_lanes:
+                continue
+            year_rows = []
+            for lane in year_lanes:
+                year_rows.extend(lane.rows())
+            save_manufacturer_csvs(year, year_rows)
+
+    # CSV 저장까지 끝났으므로 저널과 이전 부분 결과 기록은 더 이상 필요 없음
+    journal.discard()
+    if os.path.exists(PARTIAL_MARKER_FILE):
+        os.remove(PARTIAL_MARKER_FILE)
+    if region_state is not None:
+        region_state.save()
+        stats = region_state.stats
+        log.info(f"증분 크롤링: 재사용 {stats['cached']}개, 조회 {stats['fetched']}개 (내용 변경 {stats['changed']}개)")
+    return kg_results
+
+
+@METRICS.timed("kg.csv_write")
+def _write_subsidy_csv(output_file: str, rows: list[dict], sidecars: list[str] | None = None):
+    """보조금 레코드 CSV 저장 (BOM 포함 UTF-8 - 엑셀 호환, 임시 파일에 쓴 뒤 교체)
+
+    sidecars: 함께 저장할 보조 파일 형식 (없으면 --snapshot-formats 설정)
+    """
+    fieldnames = ["시도", "지역구분", "세부차종", "제조사", "모델명", "국비(만원)", "지방비(만원)", "보조금(만원)"]
+    write_snapshot(output_file, fieldnames, [[row.get(name, "") for name in fieldnames] for row in rows],
+                   sidecars=sidecars)
 
-    region_links = await get_region_links(page, vehicle_category)
-    region_count = len(region_links)
-    print(f"[{vehicle_category}] 총 {region_count}개 지역 크롤링 시작")
 
-    for i, (region_code, sido, district) in enumerate(region_links):
-        print(f"  [{i+1}/{region_count}] {sido} {district} 조회 중...", end=" ", flush=True)
+def save_manufacturer_csvs(year: str, rows: list[dict]):
+    """한 연도의 결과를 제조사별 CSV로 나눠 저장 (data/model_subsidy/<연도>/<제조사>.csv)"""
+    by_manufacturer: dict[str, list[dict]] = {}
+    for row in rows:
+        by_manufacturer.setdefault(manufacturer_name(row["제조사"]), []).append(row)
 
-        try:
-            # 팝업 대기 설정
-            async with context.expect_page(timeout=15000) as popup_info:
-                # 해당 지역 조회 버튼 클릭 (JavaScript evaluate 사용)
-                await page.evaluate(f"psPopupLocalCarModelPrice('2026','{region_code}','{district}')")
+    year_dir = os.path.join(MATRIX_DIR, year)
+    for manufacturer, manufacturer_rows in sorted(by_manufacturer.items()):
+        filename = re.sub(r'[\\/:*?"<>|\s]+', "_", manufacturer) + ".csv"
+        # 제조사별 CSV는 보고서/이력에서 읽지 않으므로 보조 파일 없이 저장
+        _write_subsidy_csv(os.path.join(year_dir, filename), manufacturer_rows, sidecars=[])
+    log.info(f"[{year}] 제조사 {len(by_manufacturer)}곳, {len(rows)}건 저장: {year_dir}")
 
-            popup = await popup_info.value
-            await asyncio.sleep(random.uniform(0.8, 1.5))
 
-            # 데이터 추출
-            data = await extract_kg_mobility_data(popup, sido, district, vehicle_category)
+def save_kg_csv(all_results: list[dict]):
+    """KG 모빌리티 데이터를 CSV로 저장하고 요약 출력"""
+    output_file = os.path.join(DATA_DIR, "kg_mobility_subsidy.csv")
+    _write_subsidy_csv(output_file, all_results)
 
-            # 차종 검증
-            validated_data = [d for d in data if vehicle_category in d.get("세부차종", "")]
-            if len(validated_data) != len(data):
-                print(f"  경고: {len(data) - len(validated_data)}건 차종 불일치로 제외")
+    # 결과 요약
+    log.info("=" * 60)
+    log.info("크롤링 완료!")
+    log.info("=" * 60)
 
-            all_data.extend(validated_data)
-            print(f"케이지모빌리티 {len(validated_data)}건")
+    passenger_count = len([r for r in all_results if r["세부차종"] == "전기승용"])
+    cargo_count = len([r for r in all_results if r["세부차종"] == "전기화물"])
 
-            # 팝업 닫기
-            await popup.close()
+    log.info(f"전기승용: {passenger_count}건")
+    log.info(f"전기화물: {cargo_count}건")
+    log.info(f"총 데이터: {len(all_results)}건")
+    log.info(f"저장 파일: {output_file} (utf-8-sig 인코딩)")
 
-        except Exception as e:
-            print(f"오류 발생: {sido} {district}")
-            print(f"  에러 타입: {type(e).__name__}")
-            print(f"  에러 메시지: {str(e)}")
-            print(f"  스택 트레이스:")
-            print(traceback.format_exc())
-            # 열린 팝업이 있으면 닫기
-            try:
-                pages = context.pages
-                for p in pages[1:]:
-                    await p.close()
-            except Exception:
-                pass
-            continue
 
-        await asyncio.sleep(random.uniform(0.2, 0.5))
+def parse_list_arg(value: str | None) -> list[str] | None:
+    """쉼표 구분 인자 목록 (없으면 None)"""
+    if not value:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()]
 
-    return all_data
 
+def parse_manufacturers_arg(value: str | None) -> list[str] | None:
+    """--manufacturers 인자 ('all'이면 None = 전체 제조사)"""
+    if value is None:
+        return DEFAULT_MANUFACTURERS
+    if value.strip().lower() == "all":
+        return None
+    return [manufacturer_name(name) for name in parse_list_arg(value) or []]
 
-async def main():
-    print("=" * 60)
-    print("ev.or.kr 케이지모빌리티 보조금 데이터 크롤링")
-    print("=" * 60)
 
-    all_results = []
+async def main(fetch_mode: bool = False, popup_origin: str | None = None, record_dir: str | None = None,
+               profile: str = DEFAULT_PROFILE, incremental: bool = False, resume: bool = False,
+               years: list[str] | None = None, categories: list[str] | None = None,
+               manufacturers: list[str] | None = DEFAULT_MANUFACTURERS, session: SessionCache | None = None,
+               fixtures: SiteFixtures | None = None, refresh_regions: bool = False):
+    log.info("=" * 60)
+    log.info("ev.or.kr 차종별 보조금 데이터 크롤링")
+    log.info("=" * 60)
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context()
-        page = await context.new_page()
-
-        # 메인 페이지 접속
-        print("\n메인 페이지 접속 중...")
-        await page.goto("https://ev.or.kr/nportal/buySupprt/initPsLocalCarPirceAction.do")
-        await page.wait_for_load_state("networkidle")
-        await asyncio.sleep(random.uniform(1.5, 2.5))
-
-        # 2026년 선택
-        print("기준년도: 2026년 선택")
-        await page.select_option("select#year1", "2026")
-        await asyncio.sleep(random.uniform(1.5, 2.5))
-
-        print("\n[전기승용] 탭 선택 중...")
-        await page.click("text=전기승용")
-        content_loaded = await wait_for_table_content(page, "전기승용")
-        if not content_loaded:
-            print("[전기승용] 콘텐츠 대기 실패 - 폴백 대기 사용")
-            await asyncio.sleep(5)
-        await asyncio.sleep(random.uniform(0.5, 1.0))
-        passenger_data = await crawl_all_regions(page, context, "전기승용")
-        all_results.extend(passenger_data)
-
-        print("\n[전기화물] 탭 선택 중...")
-        await page.click("text=전기화물")
-        content_loaded = await wait_for_table_content(page, "전기화물")
-        if not content_loaded:
-            print("[전기화물] 콘텐츠 대기 실패 - 폴백 대기 사용")
-            await asyncio.sleep(5)
-        await asyncio.sleep(random.uniform(0.5, 1.0))
-        cargo_data = await crawl_all_regions(page, context, "전기화물")
-        all_results.extend(cargo_data)
-
-        await browser.close()
-
-    # CSV 저장 (BOM 포함 UTF-8 - 엑셀 호환)
-    output_file = os.path.join(DATA_DIR, "kg_mobility_subsidy.csv")
-    fieldnames = ["시도", "지역구분", "세부차종", "제조사", "모델명", "국비(만원)", "지방비(만원)", "보조금(만원)"]
-
-    # data 폴더 자동 생성
-    os.makedirs(DATA_DIR, exist_ok=True)
-
-    with open(output_file, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_results)
-
-    # 결과 요약
-    print("\n" + "=" * 60)
-    print("크롤링 완료!")
-    print("=" * 60)
-
-    passenger_count = len([r for r in all_results if r["세부차종"] == "전기승용"])
-    cargo_count = len([r for r in all_results if r["세부차종"] == "전기화물"])
-
-    print(f"전기승용: {passenger_count}건")
-    print(f"전기화물: {cargo_count}건")
-    print(f"총 데이터: {len(all_results)}건")
-    print(f"\n저장 파일: {output_file} (utf-8-sig 인코딩)")
+        with METRICS.span("browser.launch"):
+            browser = await p.chromium.launch(headless=True)
+        try:
+            await crawl_with_browser(browser, fetch_mode, popup_origin, record_dir, profile, incremental,
+                                     resume=resume, years=years, categories=categories,
+                                     manufacturers=manufacturers, session=session, fixtures=fixtures,
+                                     refresh_regions=refresh_regions)
+        finally:
+            await browser.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="ev.or.kr 차종별 보조금 데이터 크롤링 (기본: 케이지모빌리티)")
+    parser.add_argument("--fetch", action="store_true",
+                        help="지역 팝업을 브라우저 대신 HTTP로 직접 조회 (브라우저는 지역 목록/세션 확보에만 사용)")
+    parser.add_argument("--popup-origin", help="직접 조회 대상 변경 (예: 로컬 대역 서버 http://127.0.0.1:8765)")
+    parser.add_argument("--record-popups", metavar="DIR", help="직접 조회한 팝업 응답을 녹화할 디렉터리")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default=DEFAULT_PROFILE,
+                        help="리소스 차단 프로필 (lean: 이미지/폰트/스타일시트/분석 스크립트 차단)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="접수현황 공고 내용이 바뀌지 않은 지역은 이전 결과 재사용 (data/kg_region_state.json)")
+    parser.add_argument("--resume", action="store_true",
+                        help="중단된 이전 실행의 저널(data/kg_crawl_journal.jsonl)에서 완료 지역을 건너뛰고 이어서 크롤링")
+    parser.add_argument("--years", help=f"크롤링 연도 (쉼표 구분, 기본: {CRAWL_YEAR})")
+    parser.add_argument("--categories", help=f"차종 탭 (쉼표 구분, 기본: {','.join(VEHICLE_CATEGORIES)})")
+    parser.add_argument("--manufacturers",
+                        help="제조사 필터 (쉼표 구분 또는 all, 기본: 케이지모빌리티) - 기본값이 아니면 제조사별 CSV도 저장")
+    parser.add_argument("--session-cache", action="store_true",
+                        help="브라우저 쿠키/세션을 저장해 두고 다음 실행에서 재사용 (data/browser_state.json)")
+    parser.add_argument("--refresh-regions", action="store_true",
+                        help="지역 카탈로그(data/kg_region_catalog.json)를 쓰지 않고 지역 표에서 다시 수집")
+    add_fixture_arguments(parser)
+    add_snapshot_arguments(parser)
+    add_logging_arguments(parser)
+    args = parser.parse_args()
+    configure_from_args(args)
+    configure_snapshots(args)
+    fixtures = fixtures_from_args(args)
+    status = "failed"
+    try:
+        asyncio.run(main(args.fetch, args.popup_origin, args.record_popups, args.profile, args.incremental,
+                         args.resume, parse_list_arg(args.years), parse_list_arg(args.categories),
+                         parse_manufacturers_arg(args.manufacturers), SessionCache() if args.session_cache else None,
+                         fixtures, args.refresh_regions))
+        status = "ok"
+    except PartialCrawlError as e:
+        status = "partial"
+        log.error(f"{e} - --resume으로 남은 지역을 이어서 크롤링")
+        raise SystemExit(2)
+    finally:
+        if fixtures is not None:
+            fixtures.close()
+        METRICS.write_run_summary("crawl_ev_subsidy", status)
+        flush_logs()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+KG 크롤링 진행 저널 (체크포인트/재개용)
+지역 팝업 하나가 끝날 때마다 결과를 JSON Lines로 추가 기록하여,
+크롤링이 중간에 중단되어도 다음 실행에서 완료된 지역을 건너뛸 수 있게 함
+"""
+
+import json
+import os
+
+from run_log import get_logger
+
+log = get_logger("crawl_journal")
+
+# 스크립트 위치 기준 경로 설정
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+JOURNAL_FILE = os.path.join(DATA_DIR, "kg_crawl_journal.jsonl")
+
+
+class CrawlJournal:
+    """지역별 크롤링 결과 저널
+
+    Args:
+        resume: True면 기존 저널의 완료 지역을 불러와 이어서 기록, False면 새로 시작
+    """
+
+    def __init__(self, path: str = JOURNAL_FILE, resume: bool = False):
+        self.path = path
+        self.completed: dict[tuple[str, str, str], list[dict]] = {}
+
+        if resume and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 중단 시점에 잘린 마지막 줄
+                        continue
+                    key = (entry["year"], entry["category"], entry["region_code"])
+                    if entry.get("status") == "ok":
+                        self.completed[key] = entry.get("rows", [])
+                    else:
+                        self.completed.pop(key, None)
+            log.info(f"저널에서 완료 지역 {len(self.completed)}개 불러옴: {path}")
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def completed_rows(self, year: str, category: str, region_code: str) -> list[dict] | None:
+        """이전 실행에서 완료된 지역의 결과 (없으면 None)"""
+        return self.completed.get((year, category, region_code))
+
+    def append(self, year: str, category: str, region_code: str, sido: str, district: str,
+               rows: list[dict] | None = None, error: str | None = None):
+        """지역 결과 한 줄 기록 (error가 있으면 실패로 기록)"""
+        entry = {
+            "year": year,
+            "category": category,
+            "region_code": region_code,
+            "sido": sido,
+            "district": district,
+            "status": "failed" if error else "ok",
+        }
+        if error:
+            entry["error"] = error
+        else:
+            entry["rows"] = rows or []
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def discard(self):
+        """크롤링이 정상 완료되어 CSV가 저장된 뒤 저널 삭제"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
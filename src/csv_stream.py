@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+CSV 스트리밍 읽기 + 스키마 검증
+파일 앞부분 바이트로 인코딩을 한 번만 판별하고, 행을 하나씩(또는 컬럼 묶음으로) 읽으면서
+데이터셋별 컬럼 구성(접수현황 26컬럼, KG 모빌리티 8컬럼)과 숫자 컬럼 형식을 검증
+"""
+
+import codecs
+import csv
+import logging
+import os
+from typing import Iterator
+
+from run_log import event, get_logger
+
+log = get_logger("csv_stream")
+
+# 인코딩 판별에 사용할 파일 앞부분 크기
+SNIFF_BYTES = 64 * 1024
+
+# 오류 내용을 보관할 최대 건수 (건수는 모두 셈)
+MAX_KEPT_ISSUES = 50
+
+_EV_NUMERIC = [
+    f"{group}_{part}"
+    for group in ["민간공고대수", "접수대수", "출고대수", "출고잔여대수"]
+    for part in ["전체", "우선순위", "법인기관", "택시", "일반"]
+]
+
+
+class SchemaError(ValueError):
+    """CSV 헤더가 스키마와 맞지 않음"""
+
+
+class Schema:
+    """데이터셋 CSV 컬럼 구성 - columns: 헤더 순서, numeric: 정수여야 하는 컬럼 (빈 값 허용)"""
+
+    def __init__(self, name: str, columns: list[str], numeric: list[str]):
+        self.name = name
+        self.columns = columns
+        self.numeric = numeric
+
+
+SCHEMAS = {
+    "ev_subsidy": Schema(
+        "ev_subsidy",
+        ["시도", "지역구분", "차종구분", "공고파일", "접수방법"] + _EV_NUMERIC + ["비고"],
+        _EV_NUMERIC,
+    ),
+    "kg_mobility": Schema(
+        "kg_mobility",
+        ["시도", "지역구분", "세부차종", "제조사", "모델명", "국비(만원)", "지방비(만원)", "보조금(만원)"],
+        ["국비(만원)", "지방비(만원)", "보조금(만원)"],
+    ),
+}
+
+
+def sniff_encoding(prefix: bytes) -> str:
+    """파일 앞부분 바이트로 인코딩 판별 (BOM > UTF-8 > CP949)"""
+    if prefix.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # 앞부분만 잘라 읽으므로 마지막 글자가 잘려 있어도 오류로 보지 않음
+        codecs.getincrementaldecoder("utf-8")().decode(prefix, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def sniff_file_encoding(filepath: str) -> str:
+    with open(filepath, "rb") as f:
+        return sniff_encoding(f.read(SNIFF_BYTES))
+
+
+def _is_int(value: str) -> bool:
+    try:
+        int(value)
+        return True
+    except ValueError:
+        return False
+
+
+class CsvStream:
+    """스키마 기준 CSV 스트림
+
+    행은 항상 스키마 컬럼 순서로 정렬해 돌려주며(파일 헤더 순서와 무관), 첫 줄들의 '#' 주석은 건너뜀.
+    컬럼 수가 다른 행은 건너뛰고, 숫자 컬럼에 정수가 아닌 값이 있는 행은 그대로 돌려주되
+    둘 다 issues에 기록.
+
+    사용 예:
+        stream = CsvStream(path, SCHEMAS["ev_subsidy"])
+        for row in stream:
+            ...
+        stream.print_issues()
+    """
+
+    def __init__(self, filepath: str, schema: Schema):
+        self.filepath = filepath
+        self.schema = schema
+        self.encoding = sniff_file_encoding(filepath)
+        self.header: list[str] = []
+        self.issue_count = 0
+        self.issues: list[str] = []
+        self.rows_read = 0
+
+    def _issue(self, line: int, message: str):
+        self.issue_count += 1
+        if len(self.issues) < MAX_KEPT_ISSUES:
+            self.issues.append(f"{line}행: {message}")
+
+    def __iter__(self) -> Iterator[list[str]]:
+        with open(self.filepath, "r", encoding=self.encoding, newline="") as f:
+            reader = csv.reader(f)
+            for record in reader:
+                if record and not record[0].startswith("#"):
+                    self.header = record
+                    break
+            else:
+                return
+
+            missing = [c for c in self.schema.columns if c not in self.header]
+            if missing:
+                raise SchemaError(f"[{self.schema.name}] {self.filepath}: 필수 컬럼 없음: {', '.join(missing)}")
+
+            width = len(self.header)
+            index = [self.header.index(c) for c in self.schema.columns]
+            numeric = [(i, c) for i, c in enumerate(self.schema.columns) if c in self.schema.numeric]
+            for record in reader:
+                if not record:
+                    continue
+                line = reader.line_num
+                if len(record) != width:
+                    self._issue(line, f"컬럼 수 {len(record)}개 (헤더 {width}개) - 건너뜀")
+                    continue
+                row = [record[i] for i in index]
+                for i, column in numeric:
+                    value = row[i]
+                    if value and not _is_int(value):
+                        self._issue(line, f"{column} 값이 정수가 아님: {value!r}")
+                self.rows_read += 1
+                yield row
+
+    def iter_dicts(self) -> Iterator[dict]:
+        columns = self.schema.columns
+        for row in self:
+            yield dict(zip(columns, row))
+
+    def iter_batches(self, size: int = 4096) -> Iterator[dict[str, list[str]]]:
+        """컬럼 단위 묶음 (컬럼 이름 → 값 목록)으로 읽기"""
+        columns = self.schema.columns
+        batch = [[] for _ in columns]
+        count = 0
+        for row in self:
+            for values, value in zip(batch, row):
+                values.append(value)
+            count += 1
+            if count == size:
+                yield dict(zip(columns, batch))
+                batch = [[] for _ in columns]
+                count = 0
+        if count:
+            yield dict(zip(columns, batch))
+
+    def print_issues(self):
+        """검증 오류 요약 기록 (없으면 기록 없음)"""
+        if not self.issue_count:
+            return
+        name = os.path.basename(self.filepath)
+        more = f"\n  ... 외 {self.issue_count - len(self.issues)}건" if self.issue_count > len(self.issues) else ""
+        event(log, "csv_issues", f"[{self.schema.name}] {name}: 형식 오류 {self.issue_count}건\n"
+              + "\n".join(f"  {issue}" for issue in self.issues) + more, logging.WARNING,
+              schema=self.schema.name, file=name, issues=self.issue_count)
@@ -5,14 +5,29 @@ ev.or.kr 전기차 보조금 데이터 크롤러
 숫자 데이터는 분리된 컬럼으로 저장
 """
 
-from playwright.sync_api import sync_playwright
-import csv
-import re
-import random
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+import argparse
+import asyncio
+import functools
+import logging
 import urllib.robotparser
 import urllib.request
 import urllib.error
 import os
+import time
+from typing import Awaitable, Callable
+
+from browser_session import SessionCache
+from metrics import METRICS
+from number_columns import BREAKDOWN_GROUPS, SUM_CHECKED_GROUPS, Breakdown, parse_breakdowns
+from page_profile import DEFAULT_PROFILE, PROFILES, new_profiled_context
+from run_log import add_logging_arguments, configure_from_args, event, flush_logs, get_logger
+from site_fixtures import SiteFixtures, add_fixture_arguments, fixtures_from_args
+from snapshot_io import add_snapshot_arguments, configure_snapshots, write_snapshot
+from table_extract import extract_rows
+from throttle import AdaptivePacer
+
+log = get_logger("ev")
 
 URL = "https://ev.or.kr/nportal/buySupprt/initSubsidyPaymentCheckAction.do"
 
@@ -28,7 +43,25 @@ VEHICLE_TYPES = ['전기승용', '전기화물']
 # 출처 정보
 DATA_SOURCE = "데이터 출처: 환경부 무공해차 통합누리집(ev.or.kr)"
 
+# 재시도 설정 (재시도 간 대기는 AdaptivePacer의 오류 백오프로 결정)
+MAX_RETRIES = 3
+
+# 페이지 요청(접속, 차종 탭 클릭) 간 최소 간격과 간격 결정 기록 (실행마다 새로 작성)
+PAGE_MIN_INTERVAL_SEC = 1.0
+PACING_LOG_PATH = os.path.join(DATA_DIR, "pacing_ev_crawler.jsonl")
+
+# 확장된 헤더 (숫자 데이터 분리)
+FINAL_HEADERS = [
+    '시도', '지역구분', '차종구분', '공고파일', '접수방법',
+    '민간공고대수_전체', '민간공고대수_우선순위', '민간공고대수_법인기관', '민간공고대수_택시', '민간공고대수_일반',
+    '접수대수_전체', '접수대수_우선순위', '접수대수_법인기관', '접수대수_택시', '접수대수_일반',
+    '출고대수_전체', '출고대수_우선순위', '출고대수_법인기관', '출고대수_택시', '출고대수_일반',
+    '출고잔여대수_전체', '출고잔여대수_우선순위', '출고잔여대수_법인기관', '출고잔여대수_택시', '출고잔여대수_일반',
+    '비고'
+]
 
+
+@METRICS.timed("ev.robots_txt")
 def check_robots_txt():
     """
     robots.txt를 확인하여 크롤링 허용 여부를 체크합니다.
@@ -41,7 +74,7 @@ def check_robots_txt():
     robots_url = "https://ev.or.kr/robots.txt"
     target_path = "/nportal/buySupprt/initSubsidyPaymentCheckAction.do"
 
-    print(f"robots.txt 확인 중: {robots_url}")
+    log.info(f"robots.txt 확인 중: {robots_url}")
 
     try:
         # robots.txt 접근 시도
@@ -60,54 +93,42 @@ def check_robots_txt():
         is_allowed = rp.can_fetch('*', target_path)
 
         if is_allowed:
-            print(f"  → robots.txt 확인 완료: 크롤링 허용됨")
+            log.info(f"  → robots.txt 확인 완료: 크롤링 허용됨")
         else:
-            print(f"  → 경고: robots.txt에서 해당 경로가 Disallow되어 있습니다.")
-            print(f"     경로: {target_path}")
+            log.warning(f"  → robots.txt에서 해당 경로가 Disallow되어 있습니다. 경로: {target_path}")
 
         return is_allowed
 
     except urllib.error.HTTPError as e:
         if e.code == 404:
-            print(f"  → robots.txt 없음 (404): 크롤링 제한 없음으로 간주")
+            log.info(f"  → robots.txt 없음 (404): 크롤링 제한 없음으로 간주")
         else:
-            print(f"  → robots.txt 접근 오류 (HTTP {e.code}): 크롤링 계속 진행")
+            log.warning(f"  → robots.txt 접근 오류 (HTTP {e.code}): 크롤링 계속 진행")
         return True
 
     except urllib.error.URLError as e:
-        print(f"  → robots.txt 접근 불가 ({e.reason}): 크롤링 계속 진행")
+        log.warning(f"  → robots.txt 접근 불가 ({e.reason}): 크롤링 계속 진행")
         return True
 
     except Exception as e:
-        print(f"  → robots.txt 확인 중 오류 ({type(e).__name__}): 크롤링 계속 진행")
+        log.warning(f"  → robots.txt 확인 중 오류 ({type(e).__name__}): 크롤링 계속 진행")
         return True
 
 
-def parse_numbers(text):
-    """
-    '10500 (1600) (0) (0) (8900)' 형태의 텍스트를 파싱하여 숫자 리스트 반환
-    [전체, 우선순위, 법인기관, 택시, 일반]
-    """
-    if not text or text.strip() == '':
-        return ['', '', '', '', '']
-
-    # 숫자 추출 (괄호 포함)
-    numbers = re.findall(r'[\d,]+', text)
-
-    if not numbers:
-        return ['', '', '', '', '']
-
-    # 숫자에서 콤마 제거
-    numbers = [n.replace(',', '') for n in numbers]
-
-    # 5개 값으로 패딩
-    while len(numbers) < 5:
-        numbers.append('')
-
-    return numbers[:5]
+def check_breakdown_totals(rows: list[list[str]], breakdowns: dict[str, Breakdown]):
+    """전체 = 우선순위 + 법인기관 + 택시 + 일반 검사 (불일치 행은 그대로 두고 경고만 기록)"""
+    for group in SUM_CHECKED_GROUPS:
+        mismatches = breakdowns[group].total_mismatches()
+        if not mismatches:
+            continue
+        METRICS.add("ev.total_mismatch", len(mismatches), group=group)
+        regions = ", ".join(f"{rows[i][0]} {rows[i][1]}" for i in mismatches[:5])
+        log.warning(f"{group} 전체와 세부 합계 불일치 {len(mismatches)}행: {regions}"
+                    + (" 외" if len(mismatches) > 5 else ""))
 
 
-def extract_table_data(page):
+@METRICS.timed("ev.extract_table_data")
+async def extract_table_data(page: Page):
     """
     현재 페이지의 테이블에서 데이터를 추출하여 리스트로 반환
     """
@@ -115,196 +136,252 @@ def extract_table_data(page):
     tables = page.locator('table')
     main_table = tables.nth(1)
 
-    # 데이터 행 추출
-    data_rows = main_table.locator('tbody tr')
-    row_count = data_rows.count()
-    print(f"  테이블 행 수: {row_count}")
+    # 데이터 행 일괄 추출 (셀 텍스트는 공백 정리된 상태로 반환)
+    rows = await extract_rows(main_table.locator('tbody tr'))
+    log.debug(f"  테이블 행 수: {len(rows)}")
 
-    data = []
-    for i in range(row_count):
-        row = data_rows.nth(i)
-        cells = row.locator('td')
-        cell_count = cells.count()
+    # 데이터가 있는 행만 처리 (최소 10개 컬럼 필요)
+    # 원본 구조: [시도, 지역, 차종, 공고파일, 접수방법, 민간공고대수, 접수대수, 출고대수, 출고잔여대수, 비고]
+    raw_rows = [raw_data for raw_data, _ in rows if raw_data and len(raw_data) >= 10]
 
-        if cell_count == 0:
-            continue
+    # 민간공고대수/접수대수/출고대수/출고잔여대수 열을 각각 한 번에 파싱
+    breakdowns = {group: parse_breakdowns([raw_data[5 + g] for raw_data in raw_rows])
+                  for g, group in enumerate(BREAKDOWN_GROUPS)}
+    check_breakdown_totals(raw_rows, breakdowns)
 
-        raw_data = []
-        for j in range(cell_count):
-            text = cells.nth(j).inner_text().strip()
-            text = re.sub(r'\s+', ' ', text)
-            raw_data.append(text)
-
-        # 데이터가 있는 행만 처리 (최소 10개 컬럼 필요)
-        if len(raw_data) >= 10:
-            # 원본 구조: [시도, 지역, 차종, 공고파일, 접수방법, 민간공고대수, 접수대수, 출고대수, 출고잔여대수, 비고]
-            parsed_row = raw_data[:5]  # 시도, 지역, 차종, 공고파일, 접수방법
-
-            # 민간공고대수 파싱
-            parsed_row.extend(parse_numbers(raw_data[5]))
-            # 접수대수 파싱
-            parsed_row.extend(parse_numbers(raw_data[6]))
-            # 출고대수 파싱
-            parsed_row.extend(parse_numbers(raw_data[7]))
-            # 출고잔여대수 파싱
-            parsed_row.extend(parse_numbers(raw_data[8]))
-
-            # 비고
-            parsed_row.append(raw_data[9] if len(raw_data) > 9 else '')
-
-            # 민간공고대수_전체에 숫자가 있는 행만 저장
-            if parsed_row[5] and parsed_row[5].strip():
-                data.append(parsed_row)
+    data = []
+    has_total = breakdowns[BREAKDOWN_GROUPS[0]].valid[0]
+    for i, raw_data in enumerate(raw_rows):
+        # 민간공고대수_전체에 숫자가 있는 행만 저장
+        if not has_total[i]:
+            continue
+        parsed_row = raw_data[:5]  # 시도, 지역, 차종, 공고파일, 접수방법
+        for group in BREAKDOWN_GROUPS:
+            parsed_row.extend(breakdowns[group].texts(i))
+        parsed_row.append(raw_data[9])  # 비고
+        data.append(parsed_row)
 
     return data
 
 
-def crawl_ev_subsidy():
-    # robots.txt 확인
-    check_robots_txt()
-    print()
+async def scrape_vehicle_type(context: BrowserContext, vtype: str, pacer: AdaptivePacer,
+                              screenshot: bool = False) -> list[list[str]]:
+    """
+    주어진 브라우저 컨텍스트에 새 페이지를 열어 차종 탭 하나의 테이블 데이터를 수집 (재시도 포함)
+    고정 대기 없이 화면 준비 신호를 기다리며, 요청 간격은 여러 차종이 공유하는 pacer가 응답 지연/오류에 맞춰 조절
+    """
+    page = await context.new_page()
+    try:
+        log.info(f"[{vtype}] 페이지 접속 중: {URL}")
+        # networkidle 대신 DOM 준비 + 차종 탭 링크 표시를 기준으로 대기
+        await pacer.acquire("페이지 접속")
+        with METRICS.span("ev.navigate", category=vtype), pacer.measure():
+            await page.goto(URL, timeout=60000, wait_until='domcontentloaded')
+            await page.get_by_role("link", name=vtype, exact=True).wait_for(timeout=30000)
+
+        # 스크린샷 저장 (선택)
+        if screenshot:
+            await page.screenshot(path=SCREENSHOT_PATH, full_page=True)
+            log.info(f"스크린샷 저장: {SCREENSHOT_PATH}")
+        log.debug(f"페이지 타이틀: {await page.title()}")
+
+        for attempt in range(MAX_RETRIES):
+            if attempt > 0:
+                log.info(f"[{vtype}] 재시도 {attempt}/{MAX_RETRIES-1} (요청 간격 {pacer.interval:.1f}초)...")
+
+            log.info(f"[{vtype}] 버튼 클릭 중...")
+
+            await pacer.acquire("재시도" if attempt else "탭 클릭")
+            button = page.get_by_role("link", name=vtype, exact=True)
+            start = time.monotonic()
+            await button.click()
+
+            # 콘텐츠 기반 대기: 테이블에 해당 차종 데이터가 로드될 때까지 대기
+            try:
+                with METRICS.span("ev.tab_load", category=vtype):
+                    await page.wait_for_function(
+                        """
+                        (expectedType) => {
+                            const table = document.querySelectorAll('table')[1];
+                            if (!table) return false;
+                            const rows = table.querySelectorAll('tbody tr');
+                            if (rows.length === 0) return false;
+                            // 첫 번째 행의 차종구분 컬럼(3번째) 확인
+                            const cell = rows[0].querySelector('td:nth-child(3)');
+                            return cell && cell.textContent.includes(expectedType);
+                        }
+                        """,
+                        arg=vtype,
+                        timeout=15000
+                    )
+                pacer.record(time.monotonic() - start)
+            except Exception as e:
+                log.warning(f"[{vtype}] 콘텐츠 로드 대기 실패: {e}")
+                pacer.record(time.monotonic() - start, ok=False)
+                # 폴백: 네트워크가 잠잠해질 때까지 대기
+                await page.wait_for_load_state('networkidle')
+
+            log.debug(f"[{vtype}] 데이터 추출 중...")
+            data = await extract_table_data(page)
+            log.debug(f"[{vtype}] 추출된 행: {len(data)}개")
+
+            # 데이터 유효성 검증: 차종구분이 예상값과 일치하는지 확인
+            validated_data = []
+            mismatch_count = 0
+            for row in data:
+                차종구분 = row[2] if len(row) > 2 else ""
+                if vtype in 차종구분:
+                    validated_data.append(row)
+                else:
+                    mismatch_count += 1
+
+            if mismatch_count > 0:
+                log.warning(f"[{vtype}] {mismatch_count}개 행이 차종 불일치로 제외됨")
+
+            log.info(f"[{vtype}] 검증된 행: {len(validated_data)}개")
+            METRICS.add("ev.rows", len(validated_data), category=vtype)
+
+            if len(validated_data) > 0:
+                return validated_data
+            elif attempt < MAX_RETRIES - 1:
+                log.warning(f"[{vtype}] 데이터 없음 - 재시도 예정")
+                pacer.record(ok=False)
+            else:
+                log.error(f"[{vtype}] {MAX_RETRIES}회 시도 후에도 데이터 없음")
+        return []
+    finally:
+        await page.close()
+
+
+async def scrape_subsidy_table(new_context: Callable[[], Awaitable[BrowserContext]], screenshot: bool = False,
+                               session: SessionCache | None = None,
+                               vehicle_types: list[str] | None = None) -> list[list[str]]:
+    """
+    접수현황 페이지에서 차종별 테이블 데이터를 수집
+    차종마다 new_context()로 만든 별도 컨텍스트에서 동시에 수집하고, 요청 간격은 하나의 AdaptivePacer로 공유
+    (차종이 늘어도 탭 클릭/대기가 차례로 쌓이지 않음). 결과는 vehicle_types 순서로 합침.
+    스크린샷과 세션 저장은 첫 번째 차종 컨텍스트에서만 수행.
+    """
+    vehicle_types = vehicle_types or VEHICLE_TYPES
+    pacer = AdaptivePacer("ev_crawler", PAGE_MIN_INTERVAL_SEC, log_path=PACING_LOG_PATH)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    async def scrape_in_context(index: int, vtype: str) -> list[list[str]]:
+        context = await new_context()
         try:
-            page = browser.new_page()
-
-            print(f"페이지 접속 중: {URL}")
-            page.goto(URL, timeout=60000)
-            page.wait_for_load_state('networkidle')
-            page.wait_for_timeout(int(random.uniform(1.5, 3.0) * 1000))
-
-            # 스크린샷 저장
-            page.screenshot(path=SCREENSHOT_PATH, full_page=True)
-            print(f"스크린샷 저장: {SCREENSHOT_PATH}")
-            print(f"페이지 타이틀: {page.title()}")
-
-            # 확장된 헤더 (숫자 데이터 분리)
-            final_headers = [
-                '시도', '지역구분', '차종구분', '공고파일', '접수방법',
-                '민간공고대수_전체', '민간공고대수_우선순위', '민간공고대수_법인기관', '민간공고대수_택시', '민간공고대수_일반',
-                '접수대수_전체', '접수대수_우선순위', '접수대수_법인기관', '접수대수_택시', '접수대수_일반',
-                '출고대수_전체', '출고대수_우선순위', '출고대수_법인기관', '출고대수_택시', '출고대수_일반',
-                '출고잔여대수_전체', '출고잔여대수_우선순위', '출고잔여대수_법인기관', '출고잔여대수_택시', '출고잔여대수_일반',
-                '비고'
-            ]
-
-            # 전체 데이터 저장 리스트
-            all_data = []
-
-            # 차종별 데이터 수집
-            for vtype in VEHICLE_TYPES:
-                MAX_RETRIES = 3
-                RETRY_DELAY_SEC = 5
-
-                for attempt in range(MAX_RETRIES):
-                    if attempt > 0:
-                        print(f"[{vtype}] 재시도 {attempt}/{MAX_RETRIES-1} ({RETRY_DELAY_SEC}초 대기 후)...")
-                        page.wait_for_timeout(RETRY_DELAY_SEC * 1000)
-
-                    print(f"\n[{vtype}] 버튼 클릭 중...")
-
-                    button = page.get_by_role("link", name=vtype, exact=True)
-                    button.click()
-
-                    # 콘텐츠 기반 대기: 테이블에 해당 차종 데이터가 로드될 때까지 대기
-                    try:
-                        page.wait_for_function(
-                            """
-                            (expectedType) => {
-                                const table = document.querySelectorAll('table')[1];
-                                if (!table) return false;
-                                const rows = table.querySelectorAll('tbody tr');
-                                if (rows.length === 0) return false;
-                                // 첫 번째 행의 차종구분 컬럼(3번째) 확인
-                                const cell = rows[0].querySelector('td:nth-child(3)');
-                                return cell && cell.textContent.includes(expectedType);
-                            }
-                            """,
-                            arg=vtype,
-                            timeout=15000
-                        )
-                    except Exception as e:
-                        print(f"[{vtype}] 콘텐츠 로드 대기 실패: {e}")
-                        # 폴백: 기존 networkidle 대기
-                        page.wait_for_load_state('networkidle')
-                        page.wait_for_timeout(3000)
-
-                    page.wait_for_timeout(int(random.uniform(0.5, 1.0) * 1000))
-
-                    print(f"[{vtype}] 데이터 추출 중...")
-                    data = extract_table_data(page)
-                    print(f"[{vtype}] 추출된 행: {len(data)}개")
-
-                    # 데이터 유효성 검증: 차종구분이 예상값과 일치하는지 확인
-                    validated_data = []
-                    mismatch_count = 0
-                    for row in data:
-                        차종구분 = row[2] if len(row) > 2 else ""
-                        if vtype in 차종구분:
-                            validated_data.append(row)
-                        else:
-                            mismatch_count += 1
-
-                    if mismatch_count > 0:
-                        print(f"[{vtype}] 경고: {mismatch_count}개 행이 차종 불일치로 제외됨")
-
-                    print(f"[{vtype}] 검증된 행: {len(validated_data)}개")
-
-                    if len(validated_data) > 0:
-                        all_data.extend(validated_data)
-                        break
-                    elif attempt < MAX_RETRIES - 1:
-                        print(f"[{vtype}] 데이터 없음 - 재시도 예정")
-                    else:
-                        print(f"[{vtype}] 경고: {MAX_RETRIES}회 시도 후에도 데이터 없음")
-
-            print(f"\n전체 데이터: {len(all_data)}행")
-
-            # 데이터 미리보기
-            if all_data:
-                print("\n데이터 미리보기 (처음 5행):")
-                for idx, row in enumerate(all_data[:5]):
-                    print(f"  행 {idx+1}: 시도={row[0]}, 지역={row[1]}, 차종={row[2]}")
-                    print(f"         민간공고대수: 전체={row[5]}, 우선={row[6]}, 법인={row[7]}, 택시={row[8]}, 일반={row[9]}")
-                    print(f"         출고잔여대수: 전체={row[20]}, 우선={row[21]}, 법인={row[22]}, 택시={row[23]}, 일반={row[24]}")
-
-            # data 폴더 자동 생성
-            os.makedirs(os.path.dirname(CSV_PATH), exist_ok=True)
-
-            # CSV 저장 (출처 정보 포함, BOM 포함 UTF-8로 엑셀 호환)
-            with open(CSV_PATH, 'w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.writer(f)
-                # 출처 정보를 첫 번째 행에 추가
-                writer.writerow([f"# {DATA_SOURCE}"])
-                writer.writerow(final_headers)
-                writer.writerows(all_data)
-
-            print(f"\nCSV 저장 완료: {CSV_PATH}")
-            print(f"총 {len(all_data)}행 x {len(final_headers)}열")
-
-            # 차종별 집계
-            print("\n차종별 데이터 행 수:")
-            vehicle_counts = {}
-            for row in all_data:
-                vtype = row[2]
-                vehicle_counts[vtype] = vehicle_counts.get(vtype, 0) + 1
-            for v, c in sorted(vehicle_counts.items()):
-                print(f"  {v}: {c}행")
-
-            # 시도별 집계
-            print("\n시도별 데이터 행 수:")
-            province_counts = {}
-            for row in all_data:
-                province = row[0]
-                province_counts[province] = province_counts.get(province, 0) + 1
-            for p, c in sorted(province_counts.items()):
-                print(f"  {p}: {c}행")
-
-            return final_headers, all_data
+            rows = await scrape_vehicle_type(context, vtype, pacer, screenshot and index == 0)
+            if session and index == 0:
+                await session.save(context)
+            return rows
         finally:
-            browser.close()
+            await context.close()
+
+    try:
+        results = await asyncio.gather(*(scrape_in_context(i, vtype) for i, vtype in enumerate(vehicle_types)),
+                                       return_exceptions=True)
+    finally:
+        pacer.print_summary()
+        pacer.close()
+
+    all_data = []
+    for vtype, result in zip(vehicle_types, results):
+        if isinstance(result, BaseException):
+            log.error(f"[{vtype}] 수집 실패", exc_info=result)
+            raise result
+        all_data.extend(result)
+    return all_data
+
+
+@METRICS.timed("ev.csv_write")
+def save_subsidy_csv(all_data: list[list[str]]):
+    """수집 데이터를 CSV로 저장하고 요약 출력"""
+    log.info(f"전체 데이터: {len(all_data)}행")
+
+    # 데이터 미리보기 (--log-level debug)
+    if all_data and log.isEnabledFor(logging.DEBUG):
+        log.debug("데이터 미리보기 (처음 5행):")
+        for idx, row in enumerate(all_data[:5]):
+            log.debug(f"  행 {idx+1}: 시도={row[0]}, 지역={row[1]}, 차종={row[2]}")
+            log.debug(f"         민간공고대수: 전체={row[5]}, 우선={row[6]}, 법인={row[7]}, 택시={row[8]}, 일반={row[9]}")
+            log.debug(f"         출고잔여대수: 전체={row[20]}, 우선={row[21]}, 법인={row[22]}, 택시={row[23]}, 일반={row[24]}")
+
+    # CSV 저장 (출처 정보를 첫 번째 행에 포함, BOM 포함 UTF-8로 엑셀 호환)
+    # 임시 파일에 쓴 뒤 교체하므로 중간에 중단되어도 이전 CSV가 그대로 남음
+    write_snapshot(CSV_PATH, FINAL_HEADERS, all_data, comment=f"# {DATA_SOURCE}")
+
+    # 차종별/시도별 집계 (JSON 로그에는 필드로, 콘솔에는 요약 한 줄)
+    vehicle_counts = {}
+    province_counts = {}
+    for row in all_data:
+        vehicle_counts[row[2]] = vehicle_counts.get(row[2], 0) + 1
+        province_counts[row[0]] = province_counts.get(row[0], 0) + 1
+
+    event(log, "csv_saved", f"CSV 저장 완료: {CSV_PATH} ({len(all_data)}행 x {len(FINAL_HEADERS)}열, 차종별 "
+          + ", ".join(f"{v} {c}행" for v, c in sorted(vehicle_counts.items())) + ")",
+          path=CSV_PATH, rows=len(all_data), by_category=vehicle_counts, by_province=province_counts)
+    for p, c in sorted(province_counts.items()):
+        log.debug(f"  {p}: {c}행")
+
+
+async def crawl_with_browser(browser: Browser, profile: str = DEFAULT_PROFILE, screenshot: bool = False,
+                             session: SessionCache | None = None, fixtures: SiteFixtures | None = None):
+    """
+    이미 실행 중인 브라우저로 접수현황 크롤링 (통합 실행기에서 사용)
+    차종마다 별도 컨텍스트를 사용하므로 다른 크롤러와 동시에 실행 가능
+    스크린샷 저장 시에는 화면이 온전하도록 full 프로필 사용
+    session을 넘기면 저장된 쿠키/세션으로 컨텍스트를 시작하고 끝날 때 다시 저장
+    fixtures를 넘기면 ev.or.kr 응답을 녹화하거나 로컬 대역 서버의 녹화본으로 재생
+    """
+    if fixtures is not None and fixtures.replaying:
+        log.info("녹화 재생 중 - robots.txt 확인 생략")
+    else:
+        # robots.txt 확인 (동기 urllib 호출이므로 스레드에서 실행)
+        await asyncio.to_thread(check_robots_txt)
+
+    new_context = functools.partial(new_profiled_context, browser, "full" if screenshot else profile,
+                                    setup=fixtures.attach if fixtures else None,
+                                    **(session.context_kwargs() if session else {}))
+    all_data = await scrape_subsidy_table(new_context, screenshot, session)
+
+    save_subsidy_csv(all_data)
+    return FINAL_HEADERS, all_data
+
+
+async def crawl_ev_subsidy_async(profile: str = DEFAULT_PROFILE, screenshot: bool = False,
+                                 session: SessionCache | None = None, fixtures: SiteFixtures | None = None):
+    async with async_playwright() as p:
+        with METRICS.span("browser.launch"):
+            browser = await p.chromium.launch(headless=True)
+        try:
+            return await crawl_with_browser(browser, profile, screenshot, session, fixtures)
+        finally:
+            await browser.close()
+
+
+def crawl_ev_subsidy(profile: str = DEFAULT_PROFILE, screenshot: bool = False, session: SessionCache | None = None,
+                     fixtures: SiteFixtures | None = None):
+    return asyncio.run(crawl_ev_subsidy_async(profile, screenshot, session, fixtures))
 
 
 if __name__ == "__main__":
-    crawl_ev_subsidy()
+    parser = argparse.ArgumentParser(description="ev.or.kr 전기차 보조금 접수현황 크롤링")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default=DEFAULT_PROFILE,
+                        help="리소스 차단 프로필 (lean: 이미지/폰트/스타일시트/분석 스크립트 차단)")
+    parser.add_argument("--screenshot", action="store_true", help=f"페이지 스크린샷 저장 ({SCREENSHOT_PATH})")
+    parser.add_argument("--session-cache", action="store_true",
+                        help="브라우저 쿠키/세션을 저장해 두고 다음 실행에서 재사용 (data/browser_state.json)")
+    add_fixture_arguments(parser)
+    add_snapshot_arguments(parser)
+    add_logging_arguments(parser)
+    args = parser.parse_args()
+    configure_from_args(args)
+    configure_snapshots(args)
+    fixtures = fixtures_from_args(args)
+    status = "failed"
+    try:
+        crawl_ev_subsidy(args.profile, args.screenshot, SessionCache() if args.session_cache else None, fixtures)
+        status = "ok"
+    finally:
+        if fixtures is not None:
+            fixtures.close()
+        METRICS.write_run_summary("ev_crawler", status)
+        flush_logs()
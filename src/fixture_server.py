@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+녹화된 ev.or.kr 응답을 제공하는 로컬 대역(stand-in) HTTP 서버
+popup_fetch.save_fixture로 녹화한 디렉터리(index.jsonl + *.body)를 그대로 재생
+실제 서버처럼 응답마다 지연(latency ± jitter)을 줄 수 있음
+
+사용법: python src/fixture_server.py <녹화 디렉터리> [--port 8765] [--latency-ms 300] [--jitter-ms 100]
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from popup_fetch import fixture_key
+
+
+def load_fixture_index(fixture_dir: str) -> dict[str, dict]:
+    """index.jsonl을 키 → 항목 딕셔너리로 로드 (같은 키는 마지막 기록 우선)"""
+    index = {}
+    index_file = os.path.join(fixture_dir, "index.jsonl")
+    if not os.path.exists(index_file):
+        return index
+    with open(index_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                index[entry["key"]] = entry
+    return index
+
+
+def build_path_index(index: dict[str, dict]) -> dict[str, dict]:
+    """쿼리 제외 경로 → GET 항목 (정확히 일치하는 녹화가 없는 정적 파일/페이지 GET 요청에만 사용)"""
+    by_path = {}
+    for entry in index.values():
+        if entry["method"] == "GET":
+            by_path[entry["target"].split("?")[0]] = entry
+    return by_path
+
+
+def make_handler(fixture_dir: str, index: dict[str, dict], latency_ms: float = 0, jitter_ms: float = 0,
+                 stats: dict[str, int] | None = None):
+    """녹화 재생 핸들러 - 정확히 일치하는 녹화 우선, 없으면 404
+
+    쿼리/본문이 없는 GET 요청(정적 파일, 페이지 이동)만 같은 경로의 녹화로 대체.
+    지역 팝업처럼 한 경로를 쿼리/본문으로 구분하는 요청은 대체하지 않음 (다른 지역 응답을 재생하지 않도록).
+    stats가 주어지면 hit/fallback/miss 건수를 누적.
+    """
+    by_path = build_path_index(index)
+    stats = stats if stats is not None else {}
+    stats_lock = threading.Lock()
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _count(self, outcome: str):
+            with stats_lock:
+                stats[outcome] = stats.get(outcome, 0) + 1
+
+        def _serve(self, body: bytes | None):
+            if latency_ms or jitter_ms:
+                time.sleep(max(0.0, latency_ms + random.uniform(-jitter_ms, jitter_ms)) / 1000)
+
+            entry = index.get(fixture_key(self.command, self.path, body))
+            if entry is not None:
+                self._count("hit")
+            else:
+                fallback_allowed = self.command == "GET" and "?" not in self.path and not body
+                entry = by_path.get(self.path) if fallback_allowed else None
+                self._count("fallback" if entry is not None else "miss")
+            if entry is None:
+                payload = f"녹화된 응답 없음: {self.command} {self.path}".encode("utf-8")
+                self.send_response(404)
+                self.send_header("Content-Type", "text/plain; charset=utf-8")
+            else:
+                with open(os.path.join(fixture_dir, f"{entry['key']}.body"), "rb") as f:
+                    payload = f.read()
+                self.send_response(entry.get("status", 200))
+                self.send_header("Content-Type", entry.get("content_type") or "text/html")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            self._serve(None)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            self._serve(self.rfile.read(length) if length else None)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+def start_fixture_server(fixture_dir: str, port: int = 0, latency_ms: float = 0,
+                         jitter_ms: float = 0) -> tuple[ThreadingHTTPServer, str]:
+    """백그라운드 스레드로 서버 시작 - (서버, 기준 URL) 반환 (응답 건수 통계는 server.stats)"""
+    stats: dict[str, int] = {}
+    handler = make_handler(fixture_dir, load_fixture_index(fixture_dir), latency_ms, jitter_ms, stats)
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.stats = stats
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화된 ev.or.kr 응답 재생 서버")
+    parser.add_argument("fixture_dir", help="녹화 디렉터리 (index.jsonl 포함)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="응답 지연 (밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="응답 지연 편차 (± 밀리초)")
+    args = parser.parse_args()
+
+    index = load_fixture_index(args.fixture_dir)
+    handler = make_handler(args.fixture_dir, index, args.latency_ms, args.jitter_ms)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), handler)
+    print(f"녹화 응답 {len(index)}건 제공: http://127.0.0.1:{args.port} (지연 {args.latency_ms:g}±{args.jitter_ms:g}ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
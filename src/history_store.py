@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+크롤링 스냅샷 이력 저장소 (SQLite)
+ev_subsidy_data / kg_mobility_subsidy 의 매 실행 결과를 시각별로 누적 저장하고,
+특정 스냅샷 또는 기간의 데이터를 빠르게 조회하는 API 제공
+
+- 스냅샷은 추가만 가능 (append-only)
+- 내용이 같은 스냅샷은 행 데이터를 한 번만 저장하고 참조 (content_id)
+- 숫자 컬럼은 INTEGER, 긴 텍스트 컬럼(비고 등)은 texts 테이블에 한 번만 저장
+- 숫자 컬럼 값이 정수로 그대로 되돌릴 수 없는 텍스트이면('1,000', '-' 등) 원문을 raw_numbers에 따로 저장
+
+사용법:
+  python src/history_store.py append     # 현재 data/*.csv를 스냅샷으로 추가
+  python src/history_store.py backfill   # git 이력의 data/*.csv를 스냅샷으로 가져오기
+  python src/history_store.py list [ev_subsidy|kg_mobility]
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import os
+import sqlite3
+import subprocess
+from datetime import datetime, timedelta, timezone
+
+from csv_stream import SCHEMAS, sniff_file_encoding
+from snapshot_io import read_columns
+
+# 한국 시간대 (UTC+9)
+KST = timezone(timedelta(hours=9))
+
+# 스크립트 위치 기준 경로 설정
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+HISTORY_DB = os.path.join(DATA_DIR, "history.sqlite")
+
+# 데이터셋 정의 (컬럼 구성은 csv_stream.SCHEMAS)
+# interned: texts 테이블로 분리할 긴 텍스트 컬럼, key: 지역 조회용 인덱스
+DATASETS = {
+    "ev_subsidy": {
+        "table": "ev_subsidy_rows",
+        "csv": os.path.join(DATA_DIR, "ev_subsidy_data.csv"),
+        "prev_csv": os.path.join(DATA_DIR, "ev_subsidy_data_prev.csv"),
+        "columns": SCHEMAS["ev_subsidy"].columns,
+        "numeric": SCHEMAS["ev_subsidy"].numeric,
+        "interned": ["공고파일", "접수방법", "비고"],
+        "key": ["시도", "지역구분", "차종구분"],
+    },
+    "kg_mobility": {
+        "table": "kg_mobility_rows",
+        "csv": os.path.join(DATA_DIR, "kg_mobility_subsidy.csv"),
+        "prev_csv": os.path.join(DATA_DIR, "kg_mobility_subsidy_prev.csv"),
+        "columns": SCHEMAS["kg_mobility"].columns,
+        "numeric": SCHEMAS["kg_mobility"].numeric,
+        "interned": [],
+        "key": ["시도", "지역구분", "세부차종", "모델명"],
+    },
+}
+
+
+def _q(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def parse_csv_text(text: str) -> tuple[list[str], list[list[str]]]:
+    """CSV 텍스트를 (헤더, 행 목록)으로 파싱 (BOM, '#' 출처 주석 줄 제거)"""
+    reader = csv.reader(io.StringIO(text.lstrip("\ufeff")))
+    rows = [row for row in reader if row and not row[0].startswith("#")]
+    return (rows[0], rows[1:]) if rows else ([], [])
+
+
+def read_csv_file(filepath: str) -> tuple[list[str], list[list[str]]]:
+    """CSV 파일을 (헤더, 행 목록)으로 읽기 (CSV와 맞는 컬럼 형식 보조 파일이 있으면 그 파일 사용)"""
+    columnar = read_columns(filepath)
+    if columnar is not None:
+        header, columns = columnar
+        return header, [list(row) for row in zip(*columns)]
+    with open(filepath, "r", encoding=sniff_file_encoding(filepath), newline="") as f:
+        return parse_csv_text(f.read())
+
+
+def rows_digest(header: list[str], rows: list[list[str]]) -> str:
+    """행 순서와 무관한 데이터 내용 해시 (정렬된 행 기준)"""
+    digest = hashlib.sha256()
+    digest.update("\x1f".join(header).encode("utf-8"))
+    for line in sorted("\x1f".join(row) for row in rows):
+        digest.update(b"\x1e")
+        digest.update(line.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def dataset_digest(dataset: str, header: list[str], rows: list[list[str]]) -> str:
+    """데이터셋 컬럼 순서로 정렬한 뒤 계산한 내용 해시 (스냅샷 digest와 비교 가능)"""
+    columns = DATASETS[dataset]["columns"]
+    index = [header.index(c) for c in columns]
+    return rows_digest(columns, [[row[i] if i < len(row) else "" for i in index] for row in rows])
+
+
+def csv_digest(dataset: str, filepath: str | None = None) -> str | None:
+    """CSV 파일의 내용 해시 (스냅샷 digest와 비교 가능, 파일이 없으면 None)"""
+    filepath = filepath or DATASETS[dataset]["csv"]
+    if not os.path.exists(filepath):
+        return None
+    header, rows = read_csv_file(filepath)
+    return dataset_digest(dataset, header, rows)
+
+
+def _to_int(value: str) -> int | None:
+    value = (value or "").strip().replace(",", "")
+    if not value:
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        return None
+    # SQLite INTEGER(64비트) 범위를 넘으면 값 없음 (원문은 raw_numbers에 저장)
+    return number if -2 ** 63 <= number < 2 ** 63 else None
+
+
+def _number_text(number: int | None) -> str:
+    """INTEGER 컬럼 값을 CSV 문자열로 ('' = 값 없음)"""
+    return "" if number is None else str(number)
+
+
+def _format_time(taken_at: datetime | str | None) -> str:
+    if taken_at is None:
+        taken_at = datetime.now(KST)
+    if isinstance(taken_at, str):
+        taken_at = datetime.fromisoformat(taken_at)
+    if taken_at.tzinfo is None:
+        taken_at = taken_at.replace(tzinfo=KST)
+    return taken_at.astimezone(KST).isoformat(timespec="seconds")
+
+
+class HistoryStore:
+    """스냅샷 이력 저장소
+
+    사용 예:
+        with HistoryStore() as store:
+            store.append_snapshot("ev_subsidy", header, rows)
+            rows = store.load_snapshot("ev_subsidy")
+            cols = store.load_columns("ev_subsidy", ["시도", "출고잔여대수_전체"], start="2026-02-01")
+    """
+
+    def __init__(self, path: str = HISTORY_DB):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self._text_ids: dict[str, int] = {}
+        self._create_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _create_schema(self):
+        statements = [
+            """
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY,
+                dataset TEXT NOT NULL,
+                taken_at TEXT NOT NULL,
+                row_count INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                content_id INTEGER,
+                source TEXT NOT NULL,
+                UNIQUE (dataset, taken_at)
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS snapshots_digest ON snapshots (dataset, digest)",
+            "CREATE TABLE IF NOT EXISTS texts (id INTEGER PRIMARY KEY, text TEXT NOT NULL UNIQUE)",
+            """
+            CREATE TABLE IF NOT EXISTS raw_numbers (
+                content_id INTEGER NOT NULL,
+                row_no INTEGER NOT NULL,
+                column_name TEXT NOT NULL,
+                text_id INTEGER NOT NULL,
+                PRIMARY KEY (content_id, row_no, column_name)
+            ) WITHOUT ROWID
+            """,
+        ]
+        for spec in DATASETS.values():
+            columns = ", ".join(
+                f"{_q(c)} INTEGER" if c in spec["numeric"] or c in spec["interned"] else f"{_q(c)} TEXT"
+                for c in spec["columns"]
+            )
+            statements.append(
+                f"CREATE TABLE IF NOT EXISTS {spec['table']} ("
+                f"content_id INTEGER NOT NULL, row_no INTEGER NOT NULL, {columns}, "
+                f"PRIMARY KEY (content_id, row_no)) WITHOUT ROWID"
+            )
+            key_columns = ", ".join(_q(c) for c in spec["key"])
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {spec['table']}_key ON {spec['table']} ({key_columns}, content_id)"
+            )
+        with self.conn:
+            for statement in statements:
+                self.conn.execute(statement)
+
+    def _text_id(self, text: str) -> int:
+        text_id = self._text_ids.get(text)
+        if text_id is None:
+            self.conn.execute("INSERT OR IGNORE INTO texts (text) VALUES (?)", (text,))
+            text_id = self.conn.execute("SELECT id FROM texts WHERE text = ?", (text,)).fetchone()[0]
+            self._text_ids[text] = text_id
+        return text_id
+
+    def append_snapshot(self, dataset: str, header: list[str], rows: list[list[str]],
+                        taken_at: datetime | str | None = None, source: str = "crawl") -> int:
+        """스냅샷 추가 - 스냅샷 id 반환 (같은 시각의 스냅샷이 이미 있으면 기존 id 반환)"""
+        spec = DATASETS[dataset]
+        missing = [c for c in spec["columns"] if c not in header]
+        if missing:
+            raise ValueError(f"[{dataset}] 필수 컬럼 없음: {', '.join(missing)}")
+        index = [header.index(c) for c in spec["columns"]]
+        ordered = [[row[i] if i < len(row) else "" for i in index] for row in rows]
+
+        taken_at = _format_time(taken_at)
+        digest = dataset_digest(dataset, spec["columns"], ordered)
+
+        with self.conn:
+            existing = self.conn.execute(
+                "SELECT id FROM snapshots WHERE dataset = ? AND taken_at = ?", (dataset, taken_at)
+            ).fetchone()
+            if existing:
+                return existing[0]
+
+            same_content = self.conn.execute(
+                "SELECT content_id FROM snapshots WHERE dataset = ? AND digest = ? LIMIT 1", (dataset, digest)
+            ).fetchone()
+            cursor = self.conn.execute(
+                "INSERT INTO snapshots (dataset, taken_at, row_count, digest, content_id, source) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (dataset, taken_at, len(ordered), digest, same_content[0] if same_content else None, source),
+            )
+            snapshot_id = cursor.lastrowid
+            if same_content:
+                return snapshot_id
+
+            self.conn.execute("UPDATE snapshots SET content_id = ? WHERE id = ?", (snapshot_id, snapshot_id))
+            converters = []
+            for c in spec["columns"]:
+                if c in spec["numeric"]:
+                    converters.append(_to_int)
+                elif c in spec["interned"]:
+                    converters.append(self._text_id)
+                else:
+                    converters.append(str)
+            numeric_index = [i for i, c in enumerate(spec["columns"]) if c in spec["numeric"]]
+            raw_numbers = []
+
+            def convert_row(row_no: int, row: list[str]) -> list:
+                values = [convert(value) for convert, value in zip(converters, row)]
+                for i in numeric_index:
+                    if row[i] != _number_text(values[i]):
+                        raw_numbers.append((snapshot_id, row_no, spec["columns"][i], self._text_id(row[i])))
+                return [snapshot_id, row_no] + values
+
+            placeholders = ", ".join("?" * (len(spec["columns"]) + 2))
+            self.conn.executemany(
+                f"INSERT INTO {spec['table']} VALUES ({placeholders})",
+                (convert_row(row_no, row) for row_no, row in enumerate(ordered)),
+            )
+            self.conn.executemany("INSERT INTO raw_numbers VALUES (?, ?, ?, ?)", raw_numbers)
+        return snapshot_id
+
+    def import_csv(self, dataset: str, filepath: str | None = None, taken_at: datetime | str | None = None,
+                   source: str = "csv") -> int | None:
+        """CSV 파일을 스냅샷으로 추가 (파일이 없으면 None)"""
+        filepath = filepath or DATASETS[dataset]["csv"]
+        if not os.path.exists(filepath):
+            return None
+        header, rows = read_csv_file(filepath)
+        return self.append_snapshot(dataset, header, rows, taken_at, source)
+
+    def list_snapshots(self, dataset: str, start: str | None = None, end: str | None = None) -> list[dict]:
+        """기간 내 스냅샷 목록 (시각 오름차순)"""
+        sql = "SELECT id, taken_at, row_count, digest, content_id, source FROM snapshots WHERE dataset = ?"
+        params = [dataset]
+        if start:
+            sql += " AND taken_at >= ?"
+            params.append(_format_time(start))
+        if end:
+            sql += " AND taken_at <= ?"
+            params.append(_format_time(end))
+        sql += " ORDER BY taken_at"
+        keys = ["id", "taken_at", "row_count", "digest", "content_id", "source"]
+        return [dict(zip(keys, row)) for row in self.conn.execute(sql, params)]
+
+    def _select_columns(self, spec: dict, columns: list[str]) -> tuple[str, str]:
+        """(SELECT 절, JOIN 절) - interned 컬럼은 texts와 조인"""
+        selects, joins = [], []
+        for i, c in enumerate(columns):
+            if c not in spec["columns"]:
+                raise ValueError(f"알 수 없는 컬럼: {c}")
+            if c in spec["interned"]:
+                joins.append(f"LEFT JOIN texts t{i} ON t{i}.id = r.{_q(c)}")
+                selects.append(f"t{i}.text")
+            else:
+                selects.append(f"r.{_q(c)}")
+        return ", ".join(selects), " ".join(joins)
+
+    def load_snapshot(self, dataset: str, snapshot_id: int | None = None, at: datetime | str | None = None,
+                      as_text: bool = False) -> list[dict]:
+        """스냅샷 행 로드 (snapshot_id > at 시각 이전 최신 > 최신 순으로 선택)
+
+        as_text이면 CSV와 같은 문자열 값(숫자 없음은 '', 정수가 아니던 숫자 컬럼 값은 원문)으로 반환.
+        """
+        spec = DATASETS[dataset]
+        if snapshot_id is not None:
+            found = self.conn.execute(
+                "SELECT content_id FROM snapshots WHERE id = ? AND dataset = ?", (snapshot_id, dataset)
+            ).fetchone()
+        elif at is not None:
+            found = self.conn.execute(
+                "SELECT content_id FROM snapshots WHERE dataset = ? AND taken_at <= ? ORDER BY taken_at DESC LIMIT 1",
+                (dataset, _format_time(at)),
+            ).fetchone()
+        else:
+            found = self.conn.execute(
+                "SELECT content_id FROM snapshots WHERE dataset = ? ORDER BY taken_at DESC LIMIT 1", (dataset,)
+            ).fetchone()
+        if not found:
+            return []
+
+        select, joins = self._select_columns(spec, spec["columns"])
+        cursor = self.conn.execute(
+            f"SELECT {select} FROM {spec['table']} r {joins} WHERE r.content_id = ? ORDER BY r.row_no", (found[0],)
+        )
+        rows = []
+        for values in cursor:
+            if as_text:
+                values = ["" if v is None else str(v) for v in values]
+            rows.append(dict(zip(spec["columns"], values)))
+        if as_text:
+            for row_no, column, text in self.conn.execute(
+                "SELECT n.row_no, n.column_name, t.text FROM raw_numbers n JOIN texts t ON t.id = n.text_id "
+                "WHERE n.content_id = ?", (found[0],)
+            ):
+                rows[row_no][column] = text
+        return rows
+
+    def latest_digest(self, dataset: str) -> str | None:
+        """가장 최근 스냅샷의 내용 해시 (스냅샷이 없으면 None)"""
+        latest = self.conn.execute(
+            "SELECT digest FROM snapshots WHERE dataset = ? ORDER BY taken_at DESC LIMIT 1", (dataset,)
+        ).fetchone()
+        return latest[0] if latest else None
+
+    def load_previous(self, dataset: str, current_digest: str | None = None, as_text: bool = True) -> list[dict]:
+        """현재 데이터 직전 스냅샷 로드
+
+        최신 스냅샷이 현재 데이터(current_digest)와 같으면 그 이전 스냅샷, 아니면 최신 스냅샷.
+        """
+        latest = self.conn.execute(
+            "SELECT id, digest FROM snapshots WHERE dataset = ? ORDER BY taken_at DESC LIMIT 2", (dataset,)
+        ).fetchall()
+        if not latest:
+            return []
+        if current_digest is not None and latest[0][1] == current_digest:
+            if len(latest) < 2:
+                return []
+            return self.load_snapshot(dataset, latest[1][0], as_text=as_text)
+        return self.load_snapshot(dataset, latest[0][0], as_text=as_text)
+
+    def load_columns(self, dataset: str, columns: list[str], start: str | None = None,
+                     end: str | None = None) -> dict[str, list]:
+        """기간 내 모든 스냅샷의 지정 컬럼을 컬럼 단위 리스트로 로드
+
+        반환 딕셔너리에는 요청 컬럼과 함께 snapshot_id, taken_at 컬럼이 포함되며
+        스냅샷 시각, 행 순서로 정렬됨.
+        """
+        spec = DATASETS[dataset]
+        select, joins = self._select_columns(spec, columns)
+        sql = (
+            f"SELECT s.id, s.taken_at, {select} FROM snapshots s "
+            f"JOIN {spec['table']} r ON r.content_id = s.content_id {joins} WHERE s.dataset = ?"
+        )
+        params = [dataset]
+        if start:
+            sql += " AND s.taken_at >= ?"
+            params.append(_format_time(start))
+        if end:
+            sql += " AND s.taken_at <= ?"
+            params.append(_format_time(end))
+        sql += " ORDER BY s.taken_at, r.row_no"
+
+        names = ["snapshot_id", "taken_at"] + columns
+        result = {name: [] for name in names}
+        appenders = [result[name].append for name in names]
+        for values in self.conn.execute(sql, params):
+            for append, value in zip(appenders, values):
+                append(value)
+        return result
+
+    def bootstrap_from_prev(self, dataset: str, before: datetime | str | None = None):
+        """이력이 비어 있으면 기존 *_prev.csv를 첫 스냅샷으로 등록 (이전 방식에서 전환 시 비교 기준 유지)
+
+        before가 주어지면 그보다 앞선 시각으로 기록하여 이번 스냅샷과 겹치지 않게 함.
+        """
+        if self.list_snapshots(dataset):
+            return
+        prev_csv = DATASETS[dataset]["prev_csv"]
+        if os.path.exists(prev_csv):
+            taken_at = datetime.fromtimestamp(os.path.getmtime(prev_csv), KST)
+            if before is not None:
+                taken_at = min(taken_at, datetime.fromisoformat(_format_time(before)) - timedelta(seconds=1))
+            self.import_csv(dataset, prev_csv, taken_at, source="prev_csv")
+
+
+def append_current(path: str = HISTORY_DB, taken_at: datetime | str | None = None) -> dict[str, int | None]:
+    """현재 data/*.csv를 이력에 추가 - 데이터셋별 스냅샷 id"""
+    taken_at = _format_time(taken_at)
+    with HistoryStore(path) as store:
+        result = {}
+        for dataset in DATASETS:
+            store.bootstrap_from_prev(dataset, before=taken_at)
+            result[dataset] = store.import_csv(dataset, taken_at=taken_at, source="crawl")
+        return result
+
+
+def current_digests() -> dict[str, str | None]:
+    """현재 data/*.csv의 데이터셋별 내용 해시"""
+    return {dataset: csv_digest(dataset) for dataset in DATASETS}
+
+
+def latest_digests(path: str = HISTORY_DB) -> dict[str, str | None]:
+    """이력에 마지막으로 저장된 데이터셋별 내용 해시 (이력이 없으면 None)"""
+    if not os.path.exists(path):
+        return dict.fromkeys(DATASETS)
+    with HistoryStore(path) as store:
+        return {dataset: store.latest_digest(dataset) for dataset in DATASETS}
+
+
+def backfill_from_git(path: str = HISTORY_DB) -> int:
+    """git 커밋 이력의 data/*.csv를 스냅샷으로 가져오기 (커밋 시각 기준) - 추가된 스냅샷 수"""
+    added = 0
+    with HistoryStore(path) as store:
+        for dataset, spec in DATASETS.items():
+            relpath = os.path.relpath(spec["csv"], BASE_DIR).replace(os.sep, "/")
+            log = subprocess.run(
+                ["git", "log", "--reverse", "--format=%H %cI", "--", relpath],
+                cwd=BASE_DIR, capture_output=True, text=True, check=True,
+            ).stdout.split()
+            existing = {s["taken_at"] for s in store.list_snapshots(dataset)}
+            for commit, committed_at in zip(log[::2], log[1::2]):
+                taken_at = _format_time(committed_at)
+                if taken_at in existing:
+                    continue
+                content = subprocess.run(
+                    ["git", "show", f"{commit}:{relpath}"], cwd=BASE_DIR, capture_output=True, check=True,
+                ).stdout.decode("utf-8-sig", errors="replace")
+                header, rows = parse_csv_text(content)
+                try:
+                    store.append_snapshot(dataset, header, rows, taken_at, source=f"git:{commit[:10]}")
+                    added += 1
+                except ValueError as e:
+                    print(f"  {commit[:10]} 건너뜀: {e}")
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 스냅샷 이력 저장소")
+    parser.add_argument("command", choices=["append", "backfill", "list"])
+    parser.add_argument("dataset", nargs="?", choices=sorted(DATASETS))
+    parser.add_argument("--db", default=HISTORY_DB)
+    args = parser.parse_args()
+
+    if args.command == "append":
+        for dataset, snapshot_id in append_current(args.db).items():
+            print(f"{dataset}: 스냅샷 {snapshot_id}")
+    elif args.command == "backfill":
+        print(f"git 이력에서 스냅샷 {backfill_from_git(args.db)}개 추가")
+    else:
+        with HistoryStore(args.db) as store:
+            for dataset in [args.dataset] if args.dataset else DATASETS:
+                snapshots = store.list_snapshots(dataset)
+                print(f"[{dataset}] 스냅샷 {len(snapshots)}개")
+                for s in snapshots:
+                    shared = "" if s["content_id"] == s["id"] else f" (= #{s['content_id']})"
+                    print(f"  #{s['id']} {s['taken_at']} {s['row_count']}행 {s['source']}{shared}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+실행 단계별 시간 측정 / 카운터
+크롤러와 보고서 생성의 구간(브라우저 실행, 페이지 접속, 팝업, 추출, 대기, CSV 저장 등) 소요 시간과
+건수를 모아 실행 요약(JSON Lines)과 Prometheus textfile 형식으로 기록
+"""
+
+import functools
+import inspect
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+
+# 스크립트 위치 기준 경로 설정
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+METRICS_DIR = os.path.join(BASE_DIR, "metrics")
+RUN_SUMMARY_PATH = os.path.join(METRICS_DIR, "run_summary.jsonl")
+
+# Prometheus 메트릭 이름 접두어
+PROMETHEUS_PREFIX = "ev_subsidy"
+
+
+def _key(name: str, labels: dict) -> tuple:
+    return (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+
+def _prometheus_name(name: str) -> str:
+    return PROMETHEUS_PREFIX + "_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _prometheus_labels(labels: tuple, **extra) -> str:
+    pairs = list(labels) + sorted(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+
+class Metrics:
+    """구간 시간(span)과 카운터 모음
+
+    구간은 (이름, 라벨)별로 횟수/합계/최대 시간을 누적. 동시에 실행되는 작업자의 구간은 각각 더해지므로
+    구간 합계가 실행 전체 시간보다 클 수 있음.
+
+    사용 예:
+        with METRICS.span("kg.popup", category="전기승용"):
+            ...
+        METRICS.add("kg.rows", len(rows))
+        METRICS.write_run_summary("run_all")
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """새 실행 시작 (누적 값 초기화)"""
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.spans: dict[tuple, list[float]] = {}
+        self.counters: dict[tuple, float] = {}
+
+    def observe(self, name: str, seconds: float, **labels):
+        """구간 시간 한 건 기록"""
+        stats = self.spans.get(_key(name, labels))
+        if stats is None:
+            self.spans[_key(name, labels)] = [1, seconds, seconds]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    @contextmanager
+    def span(self, name: str, **labels):
+        """블록 실행 시간을 구간으로 기록 (예외가 나면 '<이름>.errors' 카운터도 증가)"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.add(f"{name}.errors", **labels)
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def add(self, name: str, value: float = 1, **labels):
+        """카운터 증가"""
+        key = _key(name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def timed(self, name: str):
+        """함수 전체 실행 시간을 구간으로 기록하는 데코레이터 (일반/비동기 함수 모두 지원)"""
+        def decorator(func):
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def summary(self, command: str, status: str = "ok") -> dict:
+        """실행 요약 (JSON 직렬화 가능)"""
+        return {
+            "command": command,
+            "status": status,
+            "started_at": round(self.started_at, 3),
+            "duration": round(time.perf_counter() - self._started, 3),
+            "spans": [
+                {"name": name, "labels": dict(labels), "count": count,
+                 "total": round(total, 4), "max": round(longest, 4)}
+                for (name, labels), (count, total, longest) in sorted(self.spans.items())
+            ],
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters.items())
+            ],
+        }
+
+    def write_run_summary(self, command: str, status: str = "ok", path: str = RUN_SUMMARY_PATH) -> dict:
+        """실행 요약 한 줄을 JSONL 파일에 추가"""
+        summary = self.summary(command, status)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(summary, ensure_ascii=False) + "\n")
+        return summary
+
+    def write_prometheus(self, path: str, command: str, status: str = "ok"):
+        """Prometheus textfile 형식으로 저장 (수집기가 쓰다 만 파일을 읽지 않도록 임시 파일 후 교체)"""
+        run = (("command", command),)
+        lines = [
+            f"# TYPE {PROMETHEUS_PREFIX}_run_timestamp_seconds gauge",
+            f"{PROMETHEUS_PREFIX}_run_timestamp_seconds{_prometheus_labels(run)} {self.started_at:.3f}",
+            f"# TYPE {PROMETHEUS_PREFIX}_run_duration_seconds gauge",
+            f"{PROMETHEUS_PREFIX}_run_duration_seconds{_prometheus_labels(run)} {time.perf_counter() - self._started:.3f}",
+            f"# TYPE {PROMETHEUS_PREFIX}_run_success gauge",
+            f"{PROMETHEUS_PREFIX}_run_success{_prometheus_labels(run)} {1 if status == 'ok' else 0}",
+        ]
+
+        for metric, index in [("span_seconds_total", 1), ("span_count_total", 0), ("span_seconds_max", 2)]:
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}_{metric} {'gauge' if metric.endswith('max') else 'counter'}")
+            for (name, labels), stats in sorted(self.spans.items()):
+                lines.append(f"{PROMETHEUS_PREFIX}_{metric}{_prometheus_labels(run + labels, span=name)} {stats[index]:g}")
+
+        typed = set()
+        for (name, labels), value in sorted(self.counters.items()):
+            metric = _prometheus_name(name) + "_total"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_prometheus_labels(run + labels)} {value:g}")
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_file = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_file, path)
+
+
+# 프로세스 전체에서 공유하는 기본 메트릭 모음
+METRICS = Metrics()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+숫자 열 일괄 파싱
+접수현황 표의 '10500 (1600) (0) (0) (8900)' 형태 셀을 열 단위로 한 번에 파싱하여
+[전체, 우선순위, 법인기관, 택시, 일반] 항목별 정수 배열과 값 유무 마스크로 변환하고,
+보고서용 CSV 숫자 열도 같은 방식으로 (정수 배열, 유효 여부)로 변환
+"""
+
+import re
+from array import array
+
+# 세부 대수 항목 (셀 안의 숫자 순서)
+BREAKDOWN_PARTS = ["전체", "우선순위", "법인기관", "택시", "일반"]
+
+# 세부 대수가 있는 원본 열 (CSV 컬럼 이름 앞부분)
+BREAKDOWN_GROUPS = ["민간공고대수", "접수대수", "출고대수", "출고잔여대수"]
+
+# 전체 = 우선순위 + 법인기관 + 택시 + 일반 이 성립해야 하는 열
+# (출고잔여대수는 사이트에서 항목 간 재배정을 반영해 전체를 따로 계산하므로 제외)
+SUM_CHECKED_GROUPS = ["민간공고대수", "접수대수", "출고대수"]
+
+# 셀 한 줄 전체를 한 번에 매칭: 숫자/콤마 토큰 최대 5개 (나머지 텍스트는 무시)
+# 토큰 규칙은 기존 셀 단위 파싱(re.findall(r'[\d,]+'))과 같음 - 콤마만 있는 토큰은 값 없는 항목 하나가 됨
+_BREAKDOWN_LINE = re.compile(r"^[^\d,\n]*" + r"(?:([\d,]+)[^\d,\n]*)?" * len(BREAKDOWN_PARTS) + r"[^\n]*$",
+                             re.MULTILINE)
+
+# int64 배열에 담을 수 있는 범위
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+class Breakdown:
+    """원본 셀 열 하나(예: 민간공고대수 열 전체)의 파싱 결과
+
+    values[k], valid[k]: 항목 k(BREAKDOWN_PARTS 순서)의 정수 배열과 값 유무 마스크 (값이 없으면 0/0)
+    tokens[k]: 항목 k의 원본 숫자 문자열 (콤마 제거, 값이 없으면 '')
+    """
+
+    __slots__ = ("values", "valid", "tokens")
+
+    def __init__(self, values: list[array], valid: list[bytearray], tokens: list[tuple[str, ...]]):
+        self.values = values
+        self.valid = valid
+        self.tokens = tokens
+
+    def __len__(self) -> int:
+        return len(self.values[0])
+
+    def texts(self, i: int) -> list[str]:
+        """행 i의 항목별 CSV 문자열 (값이 없으면 '')"""
+        return [tokens[i] for tokens in self.tokens]
+
+    def total_mismatches(self) -> list[int]:
+        """전체가 나머지 항목의 합과 다른 행 번호 (항목이 모두 있는 행만 검사)"""
+        total, *parts = self.values
+        total_valid, *parts_valid = self.valid
+        mismatches = []
+        for i, (value, *row) in enumerate(zip(total, *parts)):
+            if value != sum(row) and total_valid[i] and all(valid[i] for valid in parts_valid):
+                mismatches.append(i)
+        return mismatches
+
+
+def parse_breakdowns(cells: list[str]) -> Breakdown:
+    """'10500 (1600) (0) (0) (8900)' 형태 셀 목록을 한 번에 파싱
+
+    열 전체를 줄 단위로 이어 붙여 정규식 한 번으로 훑고, 토큰의 콤마는 그 뒤에 제거.
+    숫자가 5개보다 적으면 나머지 항목은 값 없음, 많으면 앞의 5개만 사용.
+    """
+    if any("\n" in cell for cell in cells):
+        cells = [cell.replace("\n", " ") for cell in cells]
+    if not cells:
+        return Breakdown([array("q") for _ in BREAKDOWN_PARTS], [bytearray() for _ in BREAKDOWN_PARTS],
+                         [() for _ in BREAKDOWN_PARTS])
+
+    # 행마다 항목 5개 문자열 (없는 항목은 '') → 항목별 열로 바꿔 한 번에 정수 변환
+    text = "\n".join(cells)
+    matches = _BREAKDOWN_LINE.findall(text)
+    if "," in text:
+        matches = [tuple(token.replace(",", "") for token in match) for match in matches]
+    parts = list(zip(*matches))
+    return Breakdown([parse_int_column(tokens)[0] for tokens in parts],
+                     [bytearray(map(bool, tokens)) for tokens in parts], parts)
+
+
+def parse_int_column(values: list[str] | tuple[str, ...]) -> tuple[array, bytearray]:
+    """숫자 문자열 열 → (정수 배열, 유효 여부)
+
+    빈 값은 0(유효), 정수로 읽을 수 없는 값은 0(무효).
+    열 안에서 같은 값이 많으므로(0, 작은 대수 등) 고유 값만 정수로 바꾸고 나머지는 사전 조회.
+    """
+    lookup: dict[str, int | None] = {}
+    for value in dict.fromkeys(values):
+        try:
+            number = int(value or 0)
+        except ValueError:
+            number = None
+        lookup[value] = number if number is None or _INT64_MIN <= number <= _INT64_MAX else None
+
+    numbers = list(map(lookup.__getitem__, values))
+    if None not in lookup.values():
+        return array("q", numbers), bytearray(b"\x01") * len(values)
+    return array("q", [number or 0 for number in numbers]), bytearray(number is not None for number in numbers)
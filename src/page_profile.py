@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Playwright 페이지 로드 프로필
+스크래핑에 필요 없는 리소스(이미지, 폰트, 스타일시트, 분석 스크립트)를 요청 단계에서 차단
+"""
+
+from typing import Awaitable, Callable
+
+from playwright.async_api import Browser, BrowserContext, Route
+
+# 분석/광고 스크립트 URL 키워드 (스크립트 유형 전체를 막으면 사이트 기능이 동작하지 않으므로 URL로 구분)
+ANALYTICS_URL_KEYWORDS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "gtag/js",
+    "wcs.naver.net",
+    "analytics",
+)
+
+
+class PageProfile:
+    """리소스 차단 프로필
+
+    Args:
+        name: 프로필 이름
+        blocked_resource_types: 차단할 Playwright resource_type 목록 (image, font, stylesheet, media 등)
+        blocked_url_keywords: URL에 포함되면 차단할 키워드 목록
+    """
+
+    def __init__(self, name: str, blocked_resource_types: set[str] | None = None,
+                 blocked_url_keywords: tuple[str, ...] = ()):
+        self.name = name
+        self.blocked_resource_types = set(blocked_resource_types or ())
+        self.blocked_url_keywords = tuple(blocked_url_keywords)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.blocked_resource_types:
+            return True
+        return any(keyword in url for keyword in self.blocked_url_keywords)
+
+
+PROFILES = {
+    # 모든 리소스 로드 (스크린샷 저장 등 화면 확인용)
+    "full": PageProfile("full"),
+    # 테이블 추출에 필요한 문서/스크립트/XHR만 로드
+    "lean": PageProfile(
+        "lean",
+        {"image", "font", "stylesheet", "media", "texttrack", "eventsource", "manifest"},
+        ANALYTICS_URL_KEYWORDS,
+    ),
+}
+
+DEFAULT_PROFILE = "lean"
+
+
+async def apply_profile(context: BrowserContext, profile_name: str = DEFAULT_PROFILE) -> dict[str, int]:
+    """컨텍스트에 리소스 차단 라우트 등록 - 차단 건수 통계 딕셔너리 반환
+
+    차단하지 않는 요청은 route.fallback()으로 넘기므로 다른 라우트(HAR 재생 등)와 함께 사용 가능.
+    """
+    profile = PROFILES[profile_name]
+    stats = {"allowed": 0, "blocked": 0}
+    if not profile.blocked_resource_types and not profile.blocked_url_keywords:
+        return stats
+
+    async def handle(route: Route):
+        request = route.request
+        if profile.should_block(request.resource_type, request.url):
+            stats["blocked"] += 1
+            await route.abort()
+        else:
+            stats["allowed"] += 1
+            await route.fallback()
+
+    await context.route("**/*", handle)
+    return stats
+
+
+async def new_profiled_context(browser: Browser, profile_name: str = DEFAULT_PROFILE,
+                               setup: Callable[[BrowserContext], Awaitable] | None = None,
+                               **kwargs) -> BrowserContext:
+    """프로필이 적용된 새 브라우저 컨텍스트 생성
+
+    setup은 프로필 라우트보다 먼저 등록할 라우트(녹화/재생 등)를 설정하는 함수로,
+    나중에 등록한 라우트가 먼저 실행되므로 차단할 리소스는 setup 라우트까지 가지 않음.
+    """
+    context = await browser.new_context(**kwargs)
+    if setup is not None:
+        await setup(context)
+    await apply_profile(context, profile_name)
+    return context
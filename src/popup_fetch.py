@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+KG 팝업 직접 HTTP 조회 모듈
+브라우저로 한 번 확인한 팝업 요청을 템플릿으로 만들어, 나머지 지역 팝업은
+keep-alive HTTP 연결 풀로 직접 조회하고 경량 HTML 테이블 파서로 파싱
+"""
+
+import asyncio
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import re
+import threading
+import zlib
+from html.parser import HTMLParser
+from urllib.parse import quote, unquote_plus, urlsplit
+
+# 테이블 셀 텍스트 정리 (table_extract.TABLE_ROWS_JS와 동일한 공백 규칙)
+_WHITESPACE_RE = re.compile(r"[\s\ufeff]+")
+_ONCLICK_ARG_RE = re.compile(r"'([^']*)'")
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+# innerText에서 줄바꿈으로 처리되는 요소 (공백 한 칸으로 치환)
+_BREAK_TAGS = {
+    "br", "p", "div", "li", "ul", "ol", "dl", "dt", "dd", "h1", "h2", "h3", "h4", "h5", "h6",
+    "section", "article", "header", "footer", "table", "tr", "hr",
+}
+_SKIP_TAGS = {"script", "style", "template", "noscript"}
+
+# 템플릿 복제 시 제외할 헤더 (연결/쿠키는 풀에서 직접 설정)
+_EXCLUDED_HEADERS = {"host", "cookie", "content-length", "connection", "accept-encoding"}
+
+
+class TableRowParser(HTMLParser):
+    """'table tbody tr' 행의 td 텍스트와 onclick 인자를 수집하는 HTML 파서
+
+    브라우저처럼 thead/tfoot 밖의 tr은 암묵적 tbody 행으로 취급.
+    """
+
+    def __init__(self, link_keyword: str = ""):
+        super().__init__(convert_charrefs=True)
+        self.link_keyword = link_keyword
+        self.rows: list[tuple[list[str], list[str]]] = []
+        self._section_stack: list[str] = []
+        self._skip_depth = 0
+        self._row: tuple[list[str], list[str]] | None = None
+        self._cell: list[str] | None = None
+
+    def _finish_cell(self):
+        if self._cell is not None and self._row is not None:
+            text = _WHITESPACE_RE.sub(" ", "".join(self._cell)).strip()
+            self._row[0].append(text)
+        self._cell = None
+
+    def _finish_row(self):
+        self._finish_cell()
+        if self._row is not None:
+            self.rows.append(self._row)
+        self._row = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if tag in ("thead", "tbody", "tfoot"):
+            self._section_stack.append(tag)
+        elif tag == "tr":
+            self._finish_row()
+            in_body = not self._section_stack or self._section_stack[-1] == "tbody"
+            self._row = ([], []) if in_body else None
+        elif tag in ("td", "th"):
+            self._finish_cell()
+            if tag == "td" and self._row is not None:
+                self._cell = []
+        elif tag == "a" and self._row is not None and not self._row[1]:
+            onclick = dict(attrs).get("onclick") or ""
+            if onclick and self.link_keyword in onclick:
+                self._row[1].extend(_ONCLICK_ARG_RE.findall(onclick))
+
+        if tag in _BREAK_TAGS and self._cell is not None:
+            self._cell.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if tag in ("td", "th"):
+            self._finish_cell()
+        elif tag == "tr":
+            self._finish_row()
+        elif tag in ("thead", "tbody", "tfoot"):
+            self._finish_row()
+            if self._section_stack:
+                self._section_stack.pop()
+        elif tag == "table":
+            self._finish_row()
+            self._section_stack.clear()
+        elif tag in _BREAK_TAGS and self._cell is not None:
+            self._cell.append(" ")
+
+    def handle_data(self, data):
+        if self._cell is not None and not self._skip_depth:
+            self._cell.append(data)
+
+    def close(self):
+        super().close()
+        self._finish_row()
+
+
+def parse_table_rows(html: str, link_keyword: str = "") -> list[tuple[list[str], list[str]]]:
+    """HTML 문서의 테이블 행을 table_extract.extract_rows와 같은 형식으로 파싱"""
+    parser = TableRowParser(link_keyword)
+    parser.feed(html)
+    parser.close()
+    return parser.rows
+
+
+def decode_body(body: bytes, content_type: str = "") -> str:
+    """Content-Type 또는 <meta charset>에서 인코딩을 찾아 본문 디코딩"""
+    match = re.search(r"charset=([\w-]+)", content_type or "", re.IGNORECASE)
+    charset = match.group(1) if match else None
+    if not charset:
+        meta = _META_CHARSET_RE.search(body[:2048])
+        charset = meta.group(1).decode("ascii") if meta else "utf-8"
+    try:
+        return body.decode(charset)
+    except (LookupError, UnicodeDecodeError):
+        return body.decode("utf-8", errors="replace")
+
+
+def _split_pairs(raw: str) -> list[list[str]]:
+    return [pair.split("=", 1) if "=" in pair else [pair, ""] for pair in raw.split("&") if pair]
+
+
+def _decode_value(value: str) -> list[tuple[str, str]]:
+    """URL 인코딩 값을 가능한 인코딩별로 디코딩 - [(인코딩, 값), ...]"""
+    decoded = []
+    for encoding in ("utf-8", "cp949"):
+        try:
+            decoded.append((encoding, unquote_plus(value, encoding=encoding, errors="strict")))
+        except UnicodeDecodeError:
+            continue
+    return decoded
+
+
+class PopupRequestTemplate:
+    """브라우저가 보낸 팝업 요청에서 연도/지역코드/지역명 파라미터를 치환 가능하게 만든 템플릿"""
+
+    def __init__(self, method: str, url: str, post_data: str | None, headers: dict[str, str],
+                 year: str, region_code: str, district: str):
+        parts = urlsplit(url)
+        self.method = method
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self.path = parts.path
+        self.headers = {k: v for k, v in headers.items() if k.lower() not in _EXCLUDED_HEADERS}
+        self.encoding = "utf-8"
+
+        sample = {"year": year, "region_code": region_code, "district": district}
+        self.query = self._templatize(parts.query, sample)
+        self.body = self._templatize(post_data, sample) if post_data else None
+
+        placeholders = {name for pairs in (self.query, self.body or []) for _, name in pairs if name}
+        if "region_code" not in placeholders:
+            raise ValueError(f"팝업 요청에서 지역코드 파라미터를 찾지 못함: {url} {post_data or ''}")
+
+    def _templatize(self, raw: str, sample: dict[str, str]) -> list[tuple[str, str | None]]:
+        """[(원본 'k=v', 치환할 파라미터 이름 또는 None), ...]"""
+        pairs = []
+        for key, value in _split_pairs(raw):
+            placeholder = None
+            for encoding, decoded in _decode_value(value):
+                for name, sample_value in sample.items():
+                    if decoded == sample_value:
+                        placeholder = name
+                        if name == "district":
+                            self.encoding = encoding
+                        break
+                if placeholder:
+                    break
+            pairs.append((f"{key}={value}" if placeholder is None else key, placeholder))
+        return pairs
+
+    def _render_pairs(self, pairs: list[tuple[str, str | None]], values: dict[str, str]) -> str:
+        rendered = []
+        for raw, name in pairs:
+            if name is None:
+                rendered.append(raw)
+            else:
+                rendered.append(f"{raw}={quote(values[name], safe='', encoding=self.encoding)}")
+        return "&".join(rendered)
+
+    def render(self, year: str, region_code: str, district: str) -> tuple[str, str, bytes | None]:
+        """(메서드, 경로+쿼리, 본문) 생성"""
+        values = {"year": year, "region_code": region_code, "district": district}
+        target = self.path
+        query = self._render_pairs(self.query, values)
+        if query:
+            target += "?" + query
+        body = self._render_pairs(self.body, values).encode("ascii") if self.body is not None else None
+        return self.method, target, body
+
+
+def fixture_key(method: str, target: str, body: bytes | None) -> str:
+    """녹화 파일 조회 키 (출처(origin) 제외 - 다른 호스트에서 재생 가능)"""
+    digest = hashlib.sha1(f"{method.upper()} {target}\n".encode("utf-8") + (body or b"")).hexdigest()
+    return digest[:20]
+
+
+def save_fixture(record_dir: str, method: str, target: str, body: bytes | None,
+                 status: int, content_type: str, payload: bytes):
+    """응답 본문을 녹화 디렉터리에 저장하고 index.jsonl에 요청 정보 기록"""
+    os.makedirs(record_dir, exist_ok=True)
+    key = fixture_key(method, target, body)
+    with open(os.path.join(record_dir, f"{key}.body"), "wb") as f:
+        f.write(payload)
+    entry = {"key": key, "method": method.upper(), "target": target, "status": status, "content_type": content_type}
+    with open(os.path.join(record_dir, "index.jsonl"), "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+class KeepAliveHTTPPool:
+    """keep-alive 연결을 재사용하는 HTTP 클라이언트 풀 (http.client 기반, 스레드에서 실행)"""
+
+    def __init__(self, origin: str, size: int, headers: dict[str, str] | None = None, timeout: float = 15.0):
+        parts = urlsplit(origin)
+        self._https = parts.scheme == "https"
+        self._host = parts.netloc
+        self._timeout = timeout
+        self._headers = dict(headers or {})
+        self._idle: list[http.client.HTTPConnection] = []
+        self._idle_lock = threading.Lock()
+        self._semaphore = asyncio.Semaphore(size)
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._https:
+            return http.client.HTTPSConnection(self._host, timeout=self._timeout)
+        return http.client.HTTPConnection(self._host, timeout=self._timeout)
+
+    @staticmethod
+    def _exchange(conn: http.client.HTTPConnection, method: str, target: str, body: bytes | None,
+                  headers: dict[str, str]) -> tuple[http.client.HTTPResponse, bytes]:
+        """요청 한 번 보내고 응답 본문까지 읽어 압축 해제"""
+        conn.request(method, target, body=body, headers=headers)
+        response = conn.getresponse()
+        payload = response.read()
+        encoding = (response.getheader("Content-Encoding") or "").lower()
+        if encoding == "gzip":
+            payload = gzip.decompress(payload)
+        elif encoding == "deflate":
+            payload = zlib.decompress(payload)
+        return response, payload
+
+    def _request_blocking(self, method: str, target: str, body: bytes | None,
+                          headers: dict[str, str]) -> tuple[int, str, bytes]:
+        with self._idle_lock:
+            conn = self._idle.pop() if self._idle else None
+        reused = conn is not None
+        if conn is None:
+            conn = self._connect()
+
+        merged = {**self._headers, **headers, "Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+        try:
+            try:
+                response, payload = self._exchange(conn, method, target, body, merged)
+            except (http.client.RemoteDisconnected, ConnectionError, http.client.BadStatusLine):
+                conn.close()
+                if not reused:
+                    raise
+                # 서버가 유휴 연결을 닫은 경우 새 연결로 한 번 재시도
+                conn = self._connect()
+                response, payload = self._exchange(conn, method, target, body, merged)
+        except BaseException:
+            # 응답을 끝까지 읽지 못한 연결은 상태를 알 수 없으므로 풀에 돌려놓지 않고 닫음
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            with self._idle_lock:
+                self._idle.append(conn)
+
+        return response.status, response.getheader("Content-Type") or "", payload
+
+    async def request(self, method: str, target: str, body: bytes | None = None,
+                      headers: dict[str, str] | None = None) -> tuple[int, str, bytes]:
+        """(상태코드, Content-Type, 본문) 반환"""
+        async with self._semaphore:
+            return await asyncio.to_thread(self._request_blocking, method, target, body, headers or {})
+
+    def close(self):
+        with self._idle_lock:
+            for conn in self._idle:
+                conn.close()
+            self._idle.clear()
+
+
+class PopupFetcher:
+    """팝업 요청 템플릿 + HTTP 풀로 지역 팝업 테이블을 직접 조회"""
+
+    def __init__(self, template: PopupRequestTemplate, pool: KeepAliveHTTPPool, record_dir: str | None = None):
+        self.template = template
+        self.pool = pool
+        self.record_dir = record_dir
+
+    async def fetch_rows(self, year: str, region_code: str, district: str) -> list[tuple[list[str], list[str]]]:
+        method, target, body = self.template.render(year, region_code, district)
+        status, content_type, payload = await self.pool.request(method, target, body, self.template.headers)
+        if status != 200:
+            raise RuntimeError(f"팝업 HTTP 응답 오류 {status}: {target}")
+        if self.record_dir:
+            save_fixture(self.record_dir, method, target, body, status, content_type, payload)
+        return parse_table_rows(decode_body(payload, content_type))
+
+    def close(self):
+        self.pool.close()
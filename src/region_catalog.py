@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+KG 지역 목록 카탈로그
+(연도, 차종)별 지역 링크 목록(지역코드, 시도, 지역구분)을 행 수와 목록 해시와 함께 저장해 두고,
+다음 실행에서는 지역 표가 뜨기를 기다리지 않고 저장된 목록으로 바로 팝업 조회를 시작
+실제 지역 표는 뒤에서 따로 읽어 행 수/해시가 다를 때만 카탈로그를 갱신
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+from run_log import get_logger
+
+log = get_logger("region_catalog")
+
+# 한국 시간대 (UTC+9)
+KST = timezone(timedelta(hours=9))
+
+# 스크립트 위치 기준 경로 설정
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+CATALOG_FILE = os.path.join(DATA_DIR, "kg_region_catalog.json")
+
+CATALOG_VERSION = 1
+
+
+def regions_digest(regions: list[tuple[str, str, str]]) -> str:
+    """지역 링크 목록 해시 (표 순서 포함)"""
+    digest = hashlib.sha256()
+    for region in regions:
+        digest.update("\x1f".join(region).encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+class RegionCatalog:
+    """(연도, 차종)별 지역 링크 목록 저장소
+
+    항목마다 지역 목록과 행 수, 목록 해시, 갱신 횟수(revision), 마지막 갱신 시각을 보관.
+    목록이 그대로면 파일을 다시 쓰지 않음. refresh이면 저장된 목록은 쓰지 않고 지역 표에서 읽은 목록으로 갱신만 함.
+    """
+
+    def __init__(self, path: str = CATALOG_FILE, refresh: bool = False):
+        self.path = path
+        self.refresh = refresh
+        self.entries: dict[str, dict] = {}
+        self.dirty = False
+
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    catalog = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                log.warning("지역 카탈로그를 읽지 못함 - 지역 표에서 새로 수집", exc_info=e)
+                return
+            if catalog.get("version") == CATALOG_VERSION:
+                self.entries = catalog.get("entries", {})
+
+    @staticmethod
+    def _key(year: str, vehicle_category: str) -> str:
+        return f"{year}|{vehicle_category}"
+
+    def lookup(self, year: str, vehicle_category: str) -> list[tuple[str, str, str]] | None:
+        """저장된 지역 목록 (없거나 저장 내용이 행 수/해시와 맞지 않으면 None)"""
+        entry = self.entries.get(self._key(year, vehicle_category))
+        if entry is None or self.refresh:
+            return None
+        regions = [tuple(region) for region in entry["regions"]]
+        if len(regions) != entry.get("row_count") or regions_digest(regions) != entry.get("digest"):
+            log.warning(f"[{year} {vehicle_category}] 지역 카탈로그 항목 손상 - 지역 표에서 새로 수집")
+            return None
+        return regions
+
+    def matches(self, year: str, vehicle_category: str, regions: list[tuple[str, str, str]]) -> bool:
+        """지역 표에서 읽은 목록이 저장된 목록과 같은지 (행 수 + 해시 비교)"""
+        entry = self.entries.get(self._key(year, vehicle_category))
+        return (entry is not None and entry.get("row_count") == len(regions)
+                and entry.get("digest") == regions_digest(regions))
+
+    def store(self, year: str, vehicle_category: str, regions: list[tuple[str, str, str]]) -> bool:
+        """지역 표에서 읽은 목록 기록 - 저장된 목록과 달라 갱신했으면 True"""
+        if self.matches(year, vehicle_category, regions):
+            return False
+        key = self._key(year, vehicle_category)
+        self.entries[key] = {
+            "regions": [list(region) for region in regions],
+            "row_count": len(regions),
+            "digest": regions_digest(regions),
+            "revision": self.entries.get(key, {}).get("revision", 0) + 1,
+            "updated_at": datetime.now(KST).isoformat(timespec="seconds"),
+        }
+        self.dirty = True
+        return True
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_file = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": CATALOG_VERSION, "entries": self.entries}, f, ensure_ascii=False, indent=1,
+                      sort_keys=True)
+        os.replace(tmp_file, self.path)
+        self.dirty = False
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+KG 지역별 크롤링 상태 저장소 (증분 크롤링용)
+지역별 팝업 테이블 해시, 마지막 조회 시각, 접수현황 요약 행 지문을 기록하여
+공고 내용이 바뀌지 않은 지역은 팝업을 다시 열지 않고 이전 결과를 재사용
+"""
+
+import hashlib
+import json
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+from csv_stream import SCHEMAS, CsvStream, SchemaError
+from run_log import get_logger
+
+log = get_logger("region_state")
+
+# 한국 시간대 (UTC+9)
+KST = timezone(timedelta(hours=9))
+
+# 스크립트 위치 기준 경로 설정
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+STATE_FILE = os.path.join(DATA_DIR, "kg_region_state.json")
+SUMMARY_CSV = os.path.join(DATA_DIR, "ev_subsidy_data.csv")
+KG_CSV = os.path.join(DATA_DIR, "kg_mobility_subsidy.csv")
+
+STATE_VERSION = 1
+
+# 요약 행이 그대로여도 이 시간이 지나면 재조회 (지역별로 최대 50%까지 분산하여 한 번에 몰리지 않도록 함)
+REVALIDATE_AFTER_HOURS = 120
+
+# 접수현황 행 중 보조금 공고와 관련된 필드 (접수/출고 대수는 매일 바뀌므로 제외)
+SUMMARY_FIELDS = [
+    "공고파일", "접수방법",
+    "민간공고대수_전체", "민간공고대수_우선순위", "민간공고대수_법인기관", "민간공고대수_택시", "민간공고대수_일반",
+    "비고",
+]
+
+KG_FIELDNAMES = SCHEMAS["kg_mobility"].columns
+
+
+def _hash(values) -> str:
+    return hashlib.sha1(json.dumps(values, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def rows_hash(rows: list[dict]) -> str:
+    """지역 팝업 결과(CSV 레코드 목록) 해시"""
+    return _hash([[row.get(field, "") for field in KG_FIELDNAMES] for row in rows])
+
+
+def summary_fingerprints(headers: list[str], rows: list[list[str]]) -> dict[tuple[str, str, str], str]:
+    """접수현황 행 → (시도, 지역구분, 차종구분) 별 공고 관련 필드 지문"""
+    index = {name: i for i, name in enumerate(headers)}
+    fingerprints = {}
+    for row in rows:
+        if len(row) < len(headers):
+            continue
+        key = (row[index["시도"]], row[index["지역구분"]], row[index["차종구분"]])
+        fingerprints[key] = _hash([row[index[field]] for field in SUMMARY_FIELDS])
+    return fingerprints
+
+
+def load_summary_csv(filepath: str = SUMMARY_CSV) -> tuple[list[str], list[list[str]]]:
+    """ev_crawler가 저장한 접수현황 CSV 로드 (스키마 컬럼 순서)"""
+    if not os.path.exists(filepath):
+        return [], []
+    stream = CsvStream(filepath, SCHEMAS["ev_subsidy"])
+    rows = list(stream)
+    stream.print_issues()
+    return stream.schema.columns, rows
+
+
+def load_cached_rows(filepath: str = KG_CSV) -> dict[tuple[str, str, str], list[dict]]:
+    """이전 KG CSV를 (시도, 지역구분, 세부차종) 별로 묶어 로드"""
+    grouped = defaultdict(list)
+    if not os.path.exists(filepath):
+        return grouped
+    stream = CsvStream(filepath, SCHEMAS["kg_mobility"])
+    try:
+        for row in stream.iter_dicts():
+            grouped[(row["시도"], row["지역구분"], row["세부차종"])].append(row)
+    except SchemaError as e:
+        # 이전 결과를 쓸 수 없으면 모든 지역 재조회
+        log.warning(f"이전 KG CSV를 사용할 수 없음: {e}")
+        return defaultdict(list)
+    stream.print_issues()
+    return grouped
+
+
+class RegionStateStore:
+    """지역별 조회 상태 저장소
+
+    캐시된 행 자체는 저장하지 않고 이전 KG CSV에서 가져오며,
+    저장된 테이블 해시와 일치할 때만 재사용.
+
+    Args:
+        year: 크롤링 기준년도
+        summary_source: 접수현황 결과 (headers, rows)를 돌려주는 awaitable (없으면 SUMMARY_CSV 사용)
+    """
+
+    def __init__(self, year: str, summary_source=None, state_file: str = STATE_FILE, kg_csv: str = KG_CSV):
+        self.year = year
+        self.state_file = state_file
+        self.regions: dict[str, dict] = {}
+        self.cached_rows = load_cached_rows(kg_csv)
+        self.stats = {"cached": 0, "fetched": 0, "changed": 0}
+        self._summary_source = summary_source
+        self._summaries: dict[tuple[str, str, str], str] | None = None
+
+        if os.path.exists(state_file):
+            with open(state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") == STATE_VERSION:
+                self.regions = state.get("regions", {})
+
+    def _key(self, region_code: str, vehicle_category: str) -> str:
+        return f"{self.year}|{vehicle_category}|{region_code}"
+
+    async def load_summaries(self):
+        """접수현황 요약 지문 로드 (한 번만 수행, 실패 시 모든 지역 재조회)"""
+        if self._summaries is not None:
+            return
+        try:
+            if self._summary_source is not None:
+                headers, rows = await self._summary_source
+            else:
+                headers, rows = load_summary_csv()
+            self._summaries = summary_fingerprints(headers, rows) if headers else {}
+        except Exception as e:
+            log.warning("접수현황 요약을 가져오지 못함 - 전체 지역 재조회", exc_info=e)
+            self._summaries = {}
+
+    def _max_age(self, key: str) -> timedelta:
+        spread = int(hashlib.sha1(key.encode("utf-8")).hexdigest()[:4], 16) / 0xFFFF
+        return timedelta(hours=REVALIDATE_AFTER_HOURS * (1 + 0.5 * spread))
+
+    def lookup(self, region_code: str, sido: str, district: str, vehicle_category: str,
+               now: datetime | None = None) -> list[dict] | None:
+        """재사용 가능한 이전 결과 반환 (재조회가 필요하면 None)"""
+        key = self._key(region_code, vehicle_category)
+        entry = self.regions.get(key)
+        if entry is None or self._summaries is None:
+            return None
+
+        summary = self._summaries.get((sido, district, vehicle_category))
+        if summary is None or summary != entry.get("summary_hash"):
+            return None
+
+        now = now or datetime.now(KST)
+        if now - datetime.fromisoformat(entry["fetched_at"]) > self._max_age(key):
+            return None
+
+        rows = self.cached_rows.get((sido, district, vehicle_category), [])
+        if rows_hash(rows) != entry.get("table_hash"):
+            return None
+
+        self.stats["cached"] += 1
+        return [dict(row) for row in rows]
+
+    def record(self, region_code: str, sido: str, district: str, vehicle_category: str, rows: list[dict]):
+        """조회 결과 기록"""
+        key = self._key(region_code, vehicle_category)
+        table_hash = rows_hash(rows)
+        previous = self.regions.get(key)
+        if previous is not None and previous.get("table_hash") != table_hash:
+            self.stats["changed"] += 1
+        self.stats["fetched"] += 1
+
+        summary = (self._summaries or {}).get((sido, district, vehicle_category))
+        self.regions[key] = {
+            "sido": sido,
+            "district": district,
+            "summary_hash": summary,
+            "table_hash": table_hash,
+            "fetched_at": datetime.now(KST).isoformat(timespec="seconds"),
+        }
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        tmp_file = f"{self.state_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": STATE_VERSION, "regions": self.regions}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_file, self.state_file)
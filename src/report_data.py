@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+보고서용 데이터 계층
+CSV/이력 스냅샷을 한 번만 읽어 숫자 컬럼을 미리 정수 배열로 변환해 두고,
+집계 결과(지역별 총계, 시도/차종별 현황, 변화 감지 등)는 처음 요청될 때 한 번만 계산
+"""
+
+import os
+from array import array
+from collections import defaultdict
+from functools import cached_property
+
+from change_detect import DEFAULT_RULES, ChangeSet, DiffRules, diff_tables
+from csv_stream import SCHEMAS, CsvStream, SchemaError
+from history_store import HISTORY_DB, HistoryStore, dataset_digest
+from number_columns import parse_int_column
+from snapshot_io import read_columns
+from run_log import get_logger
+
+log = get_logger("report_data")
+
+# 보고서에서 합계/비교하는 접수현황 숫자 컬럼
+EV_REPORT_FIELDS = ["민간공고대수_일반", "출고잔여대수_전체"]
+
+
+class TableData:
+    """CSV 한 파일 분량의 데이터 (컬럼 단위 보관)
+
+    문자열 컬럼은 column(), 숫자 컬럼은 numbers()로 (정수 배열, 유효 여부) 형태로 한 번만 변환.
+    빈 값은 0, 정수로 읽을 수 없는 값은 유효하지 않음(합계에서는 0)으로 처리.
+    """
+
+    def __init__(self, schema_name: str, columns: dict[str, list[str]] | None = None):
+        self.schema = SCHEMAS[schema_name]
+        self.columns = columns or {name: [] for name in self.schema.columns}
+        self._numbers: dict[str, tuple[array, bytearray]] = {}
+        self._diffs: dict[tuple[int, int], ChangeSet] = {}
+        self._digest: str | None = None
+
+    @classmethod
+    def from_csv(cls, filepath: str):
+        """CSV 파일을 컬럼 묶음 단위로 읽어 생성 (파일이 없거나 헤더가 스키마와 다르면 빈 데이터)
+
+        CSV와 맞는 컬럼 형식 보조 파일(snapshot_io)이 있으면 CSV 파싱/형식 검증 없이 그 파일의 컬럼을 그대로 사용.
+        """
+        data = cls()
+        if not os.path.exists(filepath):
+            return data
+        columnar = read_columns(filepath)
+        if columnar is not None:
+            header, columns = columnar
+            by_name = dict(zip(header, columns))
+            if all(name in by_name for name in data.schema.columns):
+                data.columns = {name: by_name[name] for name in data.schema.columns}
+                return data
+        stream = CsvStream(filepath, data.schema)
+        try:
+            for batch in stream.iter_batches():
+                for name, values in batch.items():
+                    data.columns[name].extend(values)
+        except SchemaError as e:
+            log.warning(f"CSV 스키마 불일치 - 빈 데이터로 처리: {e}")
+            return cls()
+        stream.print_issues()
+        return data
+
+    @classmethod
+    def from_rows(cls, rows: list[dict]):
+        """행(dict) 목록으로 생성 (이력 스냅샷 등)"""
+        data = cls()
+        for name, values in data.columns.items():
+            values.extend(row.get(name) or "" for row in rows)
+        return data
+
+    def __len__(self) -> int:
+        return len(self.columns[self.schema.columns[0]])
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def column(self, name: str) -> list[str]:
+        return self.columns[name]
+
+    def iter_rows(self):
+        """스키마 컬럼 순서의 행 목록"""
+        return zip(*(self.columns[name] for name in self.schema.columns))
+
+    def numbers(self, name: str) -> tuple[array, bytearray]:
+        """숫자 컬럼 (값 배열, 유효 여부 마스크)"""
+        cached = self._numbers.get(name)
+        if cached is not None:
+            return cached
+
+        self._numbers[name] = parse_int_column(self.columns[name])
+        return self._numbers[name]
+
+    def key_index(self, columns: tuple[str, ...]) -> dict[tuple, int]:
+        """키 컬럼 값 → 행 번호 (키가 중복되면 마지막 행)"""
+        keys = zip(*(self.column(c) for c in columns))
+        return {key: i for i, key in enumerate(keys)}
+
+    def diff(self, prev: "TableData", rules: DiffRules | None = None) -> ChangeSet:
+        """이전 데이터 대비 변경 목록 (rules가 없으면 데이터셋 기본 규칙, 같은 비교는 한 번만 계산)"""
+        rules = rules or DEFAULT_RULES[self.schema.name]
+        cache_key = (id(prev), id(rules))
+        if cache_key not in self._diffs:
+            self._diffs[cache_key] = diff_tables(self, prev, rules)
+        return self._diffs[cache_key]
+
+    def digest(self) -> str:
+        """이력 스냅샷과 비교 가능한 내용 해시 (한 번만 계산)"""
+        if self._digest is None:
+            self._digest = dataset_digest(self.schema.name, self.schema.columns,
+                                          [list(row) for row in self.iter_rows()])
+        return self._digest
+
+
+def load_previous_from_history(current: TableData) -> list[dict] | None:
+    """이력 저장소에서 현재 데이터 직전 스냅샷 로드 (이력이 없으면 None)"""
+    if not os.path.exists(HISTORY_DB) or not current:
+        return None
+    with HistoryStore() as store:
+        prev_rows = store.load_previous(current.schema.name, current.digest())
+    return prev_rows or None
+
+
+class EVSubsidyData(TableData):
+    """ev_subsidy_data (접수현황) 데이터"""
+
+    KEY = ("시도", "지역구분", "차종구분")
+
+    def __init__(self, columns: dict[str, list[str]] | None = None):
+        super().__init__("ev_subsidy", columns)
+
+    def _group_totals(self, keys) -> dict:
+        totals = defaultdict(lambda: {"지역수": 0, "민간공고대수_일반": 0, "출고잔여대수_전체": 0})
+        columns = [(field, self.numbers(field)[0]) for field in EV_REPORT_FIELDS]
+        for i, key in enumerate(keys):
+            stats = totals[key]
+            stats["지역수"] += 1
+            for field, values in columns:
+                stats[field] += values[i]
+        return totals
+
+    @cached_property
+    def regional_totals(self) -> dict:
+        """시도별 지역수/합계"""
+        return self._group_totals(self.column("시도"))
+
+    @cached_property
+    def summary(self) -> dict:
+        """(시도, 차종)별 지역수/합계"""
+        return self._group_totals(zip(self.column("시도"), self.column("차종구분")))
+
+    def changes_from(self, prev: "EVSubsidyData", rules: DiffRules | None = None) -> list[dict]:
+        """이전 데이터 대비 숫자 컬럼 변화 (양쪽에 모두 있는 지역/차종, 항목별 임계값 이상만)"""
+        changes = self.diff(prev, rules)
+        result = []
+        for change in changes.modified:
+            key = changes.key_dict(change.key)
+            result.append({
+                "시도": key.get("시도", ""),
+                "지역": key.get("지역구분", ""),
+                "차종": key.get("차종구분", ""),
+                "항목": change.field,
+                "이전": change.prev,
+                "현재": change.current,
+                "변화": change.diff,
+            })
+        return result
+
+
+class KGMobilityData(TableData):
+    """kg_mobility_subsidy (KG 모빌리티 차종별 보조금) 데이터"""
+
+    def __init__(self, columns: dict[str, list[str]] | None = None):
+        super().__init__("kg_mobility", columns)
+
+    @cached_property
+    def regions_by_sido(self) -> dict[str, set[str]]:
+        """시도별 지역구분 목록 (중복 제거)"""
+        regions = defaultdict(set)
+        for sido, district in zip(self.column("시도"), self.column("지역구분")):
+            if sido and district:
+                regions[sido].add(district)
+        return regions
+
+    def new_regions_from(self, prev: "KGMobilityData") -> dict[str, list[str]]:
+        """이전 데이터 대비 새로 추가된 지역"""
+        prev_regions = prev.regions_by_sido
+        new_regions = {}
+        for sido, districts in self.regions_by_sido.items():
+            added = districts - prev_regions.get(sido, set())
+            if added:
+                new_regions[sido] = sorted(added)
+        return new_regions
+
+
+def load_dataset(cls, current_file: str, prev_file: str) -> tuple[TableData, TableData]:
+    """(현재, 이전) 데이터 로드 - 이전 데이터는 이력 저장소 우선, 없으면 *_prev.csv"""
+    current = cls.from_csv(current_file)
+    prev_rows = load_previous_from_history(current)
+    prev = cls.from_rows(prev_rows) if prev_rows is not None else cls.from_csv(prev_file)
+    return current, prev
@@ -2,12 +2,30 @@
 """
 EV 보조금 데이터 변화 보고서 생성 모듈
 ev_subsidy_data.csv와 kg_mobility_subsidy.csv의 변화를 분석하여 보고서 생성
+
+보고서 내용은 report_model의 섹션/표로 한 번만 구성하고,
+마크다운/HTML/JSON/CSV 출력은 report_render의 렌더러가 파일에 바로 기록
 """
 
-import csv
+import argparse
+import glob
+import hashlib
+import io
+import json
+import logging
 import os
 from datetime import datetime, timezone, timedelta
-from collections import defaultdict
+from functools import cached_property
+
+from change_detect import DEFAULT_RULES, ChangeSet, DiffRules, load_rules
+from metrics import METRICS
+from report_data import EVSubsidyData, KGMobilityData, load_dataset
+from report_model import Report, Section, Table, Text, change_cell, number_cell
+from report_render import RENDERERS
+from run_log import add_logging_arguments, configure_from_args, flush_logs, get_logger
+from trend_analysis import TREND_WINDOW_DAYS, load_trends
+
+log = get_logger("report_generator")
 
 # 한국 시간대 (UTC+9)
 KST = timezone(timedelta(hours=9))
@@ -18,631 +36,393 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 REPORTS_DIR = os.path.join(BASE_DIR, "reports")
 
+REPORT_TITLE = "EV 보조금 데이터 변화 보고서"
 
-class EVSubsidyReportGenerator:
-    """ev_subsidy_data.csv 보고서 생성기"""
+# 기본 출력 형식 (워크플로에서 커밋/메일 첨부하는 형식)
+DEFAULT_FORMATS = ["md", "html"]
 
-    def __init__(self):
-        self.current_file = os.path.join(DATA_DIR, "ev_subsidy_data.csv")
-        self.prev_file = os.path.join(DATA_DIR, "ev_subsidy_data_prev.csv")
+# 이번 보고서의 변경 목록 (알림 메일 본문 등에서 사용, 보고서마다 덮어씀)
+CHANGES_PATH = os.path.join(REPORTS_DIR, "changes.json")
 
-    def load_data(self, filepath: str) -> list[dict]:
-        """CSV 파일 로드"""
-        if not os.path.exists(filepath):
-            return []
-
-        data = []
-        encodings = ["utf-8-sig", "utf-8", "cp949", "euc-kr"]
-        for encoding in encodings:
-            try:
-                with open(filepath, "r", encoding=encoding) as f:
-                    first_line = f.readline()
-                    if not first_line.startswith("#"):
-                        f.seek(0)
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        data.append(row)
-                return data
-            except UnicodeDecodeError:
-                continue
-        return data
+# 보고서 파일 이름에 붙이는 데이터 내용 해시 길이
+REPORT_DIGEST_LENGTH = 12
 
-    def generate_summary(self, data: list[dict]) -> dict:
-        """시도/차종별 현황 요약"""
-        summary = defaultdict(lambda: {"지역수": 0, "민간공고대수_일반": 0, "출고잔여대수_전체": 0})
+# 보고서 표에 표시할 최대 행 수
+MAX_CHANGE_ROWS = 20
+MAX_ROW_CHANGE_ROWS = 50
 
-        for row in data:
-            key = (row.get("시도", ""), row.get("차종구분", ""))
-            summary[key]["지역수"] += 1
 
-            try:
-                summary[key]["민간공고대수_일반"] += int(row.get("민간공고대수_일반", 0) or 0)
-            except ValueError:
-                pass
+class EVSubsidyReportGenerator:
+    """ev_subsidy_data.csv 보고서 생성기
 
-            try:
-                summary[key]["출고잔여대수_전체"] += int(row.get("출고잔여대수_전체", 0) or 0)
-            except ValueError:
-                pass
+    현재/이전 데이터는 생성 시 한 번만 로드하며, 모든 출력 형식이 같은 객체를 공유.
+    rules: 변화 감지 규칙 (없으면 change_detect 기본 규칙)
+    """
 
-        return summary
+    def __init__(self, rules: DiffRules | None = None):
+        self.current_file = os.path.join(DATA_DIR, "ev_subsidy_data.csv")
+        self.prev_file = os.path.join(DATA_DIR, "ev_subsidy_data_prev.csv")
+        self.rules = rules
+        with METRICS.span("report.load", dataset="ev_subsidy"):
+            self.current, self.prev = load_dataset(EVSubsidyData, self.current_file, self.prev_file)
 
-    def generate_regional_totals(self, data: list[dict]) -> dict:
-        totals = defaultdict(lambda: {"지역수": 0, "민간공고대수_일반": 0, "출고잔여대수_전체": 0})
+    def generate_summary(self) -> dict:
+        """시도/차종별 현황 요약"""
+        return self.current.summary
 
-        for row in data:
-            sido = row.get("시도", "")
-            totals[sido]["지역수"] += 1
+    def generate_regional_totals(self) -> dict:
+        return self.current.regional_totals
 
-            try:
-                totals[sido]["민간공고대수_일반"] += int(row.get("민간공고대수_일반", 0) or 0)
-            except ValueError:
-                pass
+    def change_set(self) -> ChangeSet:
+        """이전 데이터 대비 변경 목록 (추가/삭제된 지역, 숫자 컬럼 변화)"""
+        return self.current.diff(self.prev, self.rules)
 
-            try:
-                totals[sido]["출고잔여대수_전체"] += int(row.get("출고잔여대수_전체", 0) or 0)
-            except ValueError:
-                pass
+    def detect_changes(self) -> list[dict]:
+        """이전 데이터 대비 유의미한 변화 감지"""
+        return self.current.changes_from(self.prev, self.rules)
 
-        return totals
+    @cached_property
+    def trends(self) -> tuple[list[dict], list[dict]]:
+        """이력 저장소 기반 (소진 추세, 이상 변동)"""
+        with METRICS.span("report.trends"):
+            return load_trends()
 
-    def detect_changes(self, current_data: list[dict], prev_data: list[dict]) -> list[dict]:
-        """이전 데이터 대비 유의미한 변화 감지"""
-        changes = []
-
-        # 현재 데이터를 키로 매핑
-        current_map = {}
-        for row in current_data:
-            key = (row.get("시도", ""), row.get("지역구분", ""), row.get("차종구분", ""))
-            current_map[key] = row
-
-        # 이전 데이터를 키로 매핑
-        prev_map = {}
-        for row in prev_data:
-            key = (row.get("시도", ""), row.get("지역구분", ""), row.get("차종구분", ""))
-            prev_map[key] = row
-
-        # 변화 감지 (민간공고대수_일반, 출고잔여대수_전체)
-        check_fields = ["민간공고대수_일반", "출고잔여대수_전체"]
-
-        for key, current_row in current_map.items():
-            if key in prev_map:
-                prev_row = prev_map[key]
-                for field in check_fields:
-                    try:
-                        current_val = int(current_row.get(field, 0) or 0)
-                        prev_val = int(prev_row.get(field, 0) or 0)
-                        diff = current_val - prev_val
-
-                        if diff != 0:
-                            changes.append({
-                                "시도": key[0],
-                                "지역": key[1],
-                                "차종": key[2],
-                                "항목": field,
-                                "이전": prev_val,
-                                "현재": current_val,
-                                "변화": diff
-                            })
-                    except ValueError:
-                        continue
-
-        return changes
-
-    def generate_report(self) -> list[str]:
-        """보고서 생성"""
-        lines = []
-
-        current_data = self.load_data(self.current_file)
-        prev_data = self.load_data(self.prev_file)
-
-        lines.append("## EV 보조금 현황 요약 (ev_subsidy_data)")
-        lines.append("")
-
-        if not current_data:
-            lines.append("데이터가 없습니다.")
-            lines.append("")
-            return lines
-
-        regional_totals = self.generate_regional_totals(current_data)
-        lines.append("### 지역별 총계")
-        lines.append("| 시도 | 지역수 | 민간공고대수_일반 합계 | 출고잔여대수_전체 합계 |")
-        lines.append("|------|--------|------------------------|------------------------|")
-
-        for sido, stats in sorted(regional_totals.items()):
-            lines.append(f"| {sido} | {stats['지역수']} | {stats['민간공고대수_일반']:,} | {stats['출고잔여대수_전체']:,} |")
-
-        lines.append("")
-
-        lines.append("### 시도/차종별 현황")
-        lines.append("| 시도 | 차종 | 지역수 | 민간공고대수_일반 합계 | 출고잔여대수_전체 합계 |")
-        lines.append("|------|------|--------|------------------------|------------------------|")
-
-        summary = self.generate_summary(current_data)
-        for (sido, vehicle_type), stats in sorted(summary.items()):
-            lines.append(f"| {sido} | {vehicle_type} | {stats['지역수']} | {stats['민간공고대수_일반']:,} | {stats['출고잔여대수_전체']:,} |")
-
-        lines.append("")
+    def generate_trend_rows(self, limit: int = 20) -> list[list]:
+        """소진 예상일이 빠른 순 추세 표 행 (시도, 지역, 차종, 잔여, 일평균 소진, 소진 예상일)"""
+        expected = [t for t in self.trends[0] if t["소진예상일"] is not None]
+        rows = []
+        for trend in sorted(expected, key=lambda t: t["소진예상일"])[:limit]:
+            rows.append([
+                trend["시도"],
+                trend["지역"],
+                trend["차종"],
+                number_cell(trend["잔여"]),
+                number_cell(trend["일평균소진"], ",.1f"),
+                trend["소진예상일"].strftime("%Y-%m-%d"),
+            ])
+        return rows
+
+    def generate_jump_rows(self, limit: int = 20) -> list[list]:
+        """최근 순 이상 변동 표 행 (시각, 시도, 지역, 차종, 이전, 현재, 변화)"""
+        rows = []
+        for jump in sorted(self.trends[1], key=lambda j: j["시각"], reverse=True)[:limit]:
+            rows.append([
+                jump["시각"].strftime("%Y-%m-%d %H:%M"),
+                jump["시도"],
+                jump["지역"],
+                jump["차종"],
+                number_cell(jump["이전"]),
+                number_cell(jump["현재"]),
+                change_cell(jump["변화"]),
+            ])
+        return rows
+
+    def build_section(self) -> Section:
+        """보고서 섹션 구성"""
+        section = Section("EV 보조금 현황 요약 (ev_subsidy_data)")
+
+        if not self.current:
+            section.add(Text("데이터가 없습니다.", kind="no-data"))
+            return section
+
+        regional_totals = self.generate_regional_totals()
+        section.subsection("지역별 총계").add(Table(
+            ["시도", "지역수", "민간공고대수_일반 합계", "출고잔여대수_전체 합계"],
+            lambda: (
+                [sido, number_cell(stats["지역수"], "d"),
+                 number_cell(stats["민간공고대수_일반"]), number_cell(stats["출고잔여대수_전체"])]
+                for sido, stats in sorted(regional_totals.items())
+            ),
+        ))
+
+        summary = self.generate_summary()
+        section.subsection("시도/차종별 현황").add(Table(
+            ["시도", "차종", "지역수", "민간공고대수_일반 합계", "출고잔여대수_전체 합계"],
+            lambda: (
+                [sido, vehicle_type, number_cell(stats["지역수"], "d"),
+                 number_cell(stats["민간공고대수_일반"]), number_cell(stats["출고잔여대수_전체"])]
+                for (sido, vehicle_type), stats in sorted(summary.items())
+            ),
+        ))
 
         # 유의미한 변화 감지
-        if prev_data:
-            changes = self.detect_changes(current_data, prev_data)
-            if changes:
-                lines.append("### 유의미한 변화")
-                lines.append("| 시도 | 지역 | 차종 | 항목 | 이전 | 현재 | 변화 |")
-                lines.append("|------|------|------|------|------|------|------|")
-
-                for change in sorted(changes, key=lambda x: abs(x["변화"]), reverse=True)[:20]:
-                    diff_text = f"+{change['변화']}대 증가" if change["변화"] > 0 else f"{change['변화']}대 감소"
-                    lines.append(f"| {change['시도']} | {change['지역']} | {change['차종']} | {change['항목']} | {change['이전']:,} | {change['현재']:,} | {diff_text} |")
-
-                lines.append("")
-            else:
-                lines.append("### 유의미한 변화")
-                lines.append("변화 없음")
-                lines.append("")
+        changes_section = section.subsection("유의미한 변화")
+        if not self.prev:
+            changes_section.add(Text("이전 데이터가 없어 비교할 수 없습니다.", kind="no-data"))
+        elif not self.detect_changes():
+            changes_section.add(Text("변화 없음", kind="no-data"))
         else:
-            lines.append("### 유의미한 변화")
-            lines.append("이전 데이터가 없어 비교할 수 없습니다.")
-            lines.append("")
+            changes = sorted(self.detect_changes(), key=lambda x: abs(x["변화"]), reverse=True)[:MAX_CHANGE_ROWS]
+            changes_section.add(Table(
+                ["시도", "지역", "차종", "항목", "이전", "현재", "변화"],
+                lambda: (
+                    [c["시도"], c["지역"], c["차종"], c["항목"],
+                     number_cell(c["이전"]), number_cell(c["현재"]), change_cell(c["변화"])]
+                    for c in changes
+                ),
+            ))
+
+        # 추가/삭제된 지역 (공고 시작/종료 등)
+        if self.prev:
+            add_row_changes(section.subsection("추가/삭제된 지역"), self.change_set(),
+                            ["시도", "지역구분", "차종구분", "출고잔여대수_전체"], "추가/삭제된 지역 없음")
+
+        # 이력 저장소 기반 소진 추세 / 이상 변동
+        trend_section = section.subsection(f"보조금 소진 추세 (최근 {TREND_WINDOW_DAYS}일 기준 소진 예상일)")
+        trend_rows = self.generate_trend_rows()
+        if trend_rows:
+            trend_section.add(Table(["시도", "지역", "차종", "출고잔여", "일평균 소진", "소진 예상일"], trend_rows))
+        else:
+            trend_section.add(Text("소진 추세를 계산할 이력이 부족합니다.", kind="no-data"))
+
+        jump_section = section.subsection("이상 변동")
+        jump_rows = self.generate_jump_rows()
+        if jump_rows:
+            jump_section.add(Table(["시각", "시도", "지역", "차종", "이전", "현재", "변화"], jump_rows))
+        else:
+            jump_section.add(Text("이상 변동 없음", kind="no-data"))
 
-        return lines
+        return section
 
 
 class KGMobilityReportGenerator:
     """kg_mobility_subsidy.csv 보고서 생성기"""
 
-    def __init__(self):
+    def __init__(self, rules: DiffRules | None = None):
         self.current_file = os.path.join(DATA_DIR, "kg_mobility_subsidy.csv")
         self.prev_file = os.path.join(DATA_DIR, "kg_mobility_subsidy_prev.csv")
+        self.rules = rules
+        with METRICS.span("report.load", dataset="kg_mobility"):
+            self.current, self.prev = load_dataset(KGMobilityData, self.current_file, self.prev_file)
 
-    def load_data(self, filepath: str) -> list[dict]:
-        """CSV 파일 로드"""
-        if not os.path.exists(filepath):
-            return []
-
-        data = []
-        # 여러 인코딩 시도
-        encodings = ["utf-8-sig", "utf-8", "cp949", "euc-kr"]
-        for encoding in encodings:
-            try:
-                with open(filepath, "r", encoding=encoding) as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        data.append(row)
-                return data
-            except UnicodeDecodeError:
-                continue
-        return data
-
-    def get_regions_by_sido(self, data: list[dict]) -> dict[str, set[str]]:
+    def get_regions_by_sido(self) -> dict[str, set[str]]:
         """시도별 지역구분 목록 (중복 제거)"""
-        regions = defaultdict(set)
-        for row in data:
-            sido = row.get("시도", "")
-            district = row.get("지역구분", "")
-            # 이전 형식("지역" 컬럼만 있는 경우) 처리
-            if not sido and "지역" in row:
-                # 지역명에서 시도 추출 시도 (예: "서울특별시" -> "서울")
-                region = row.get("지역", "")
-                regions["미분류"].add(region)
-            elif sido and district:
-                regions[sido].add(district)
-        return regions
-
-    def detect_new_regions(self, current_data: list[dict], prev_data: list[dict]) -> dict[str, list[str]]:
-        """새로 추가된 지역 감지"""
-        current_regions = self.get_regions_by_sido(current_data)
-        prev_regions = self.get_regions_by_sido(prev_data)
+        return self.current.regions_by_sido
 
-        new_regions = {}
-        for sido, districts in current_regions.items():
-            prev_districts = prev_regions.get(sido, set())
-            added = districts - prev_districts
-            if added:
-                new_regions[sido] = sorted(added)
-
-        return new_regions
+    def detect_new_regions(self) -> dict[str, list[str]]:
+        """새로 추가된 지역 감지"""
+        return self.current.new_regions_from(self.prev)
 
-    def generate_report(self) -> list[str]:
-        """보고서 생성"""
-        lines = []
+    def detect_removed_regions(self) -> dict[str, list[str]]:
+        """이전 데이터에만 있는 (삭제된) 지역 감지"""
+        return self.prev.new_regions_from(self.current)
 
-        current_data = self.load_data(self.current_file)
-        prev_data = self.load_data(self.prev_file)
+    def change_set(self) -> ChangeSet:
+        """이전 데이터 대비 변경 목록 (추가/삭제된 모델, 국비/지방비/보조금 변화)"""
+        return self.current.diff(self.prev, self.rules)
 
-        lines.append("## KG 모빌리티 보조금 현황 (kg_mobility_subsidy)")
-        lines.append("")
+    def build_section(self) -> Section:
+        """보고서 섹션 구성"""
+        section = Section("KG 모빌리티 보조금 현황 (kg_mobility_subsidy)")
 
-        if not current_data:
-            lines.append("데이터가 없습니다.")
-            lines.append("")
-            return lines
+        if not self.current:
+            section.add(Text("데이터가 없습니다.", kind="no-data"))
+            return section
 
         # 시도별 지역 현황
-        lines.append("### 시도별 지역 현황 (중복제거)")
-        lines.append("| 시도 | 지역 수 | 지역구분 목록 |")
-        lines.append("|------|---------|---------------|")
+        regions_by_sido = self.get_regions_by_sido()
 
-        regions_by_sido = self.get_regions_by_sido(current_data)
-        for sido in sorted(regions_by_sido.keys()):
-            districts = regions_by_sido[sido]
-            district_list = ", ".join(sorted(districts)[:10])
-            if len(districts) > 10:
-                district_list += f" 외 {len(districts) - 10}개"
-            lines.append(f"| {sido} | {len(districts)} | {district_list} |")
+        def region_rows():
+            for sido in sorted(regions_by_sido.keys()):
+                districts = regions_by_sido[sido]
+                district_list = ", ".join(sorted(districts)[:10])
+                if len(districts) > 10:
+                    district_list += f" 외 {len(districts) - 10}개"
+                yield [sido, number_cell(len(districts), "d"), district_list]
 
-        lines.append("")
+        regions_section = section.subsection("시도별 지역 현황 (중복제거)")
+        regions_section.add(Table(["시도", "지역 수", "지역구분 목록"], region_rows))
 
         # 총 데이터 건수
-        lines.append(f"**총 데이터 건수**: {len(current_data)}건")
-        lines.append("")
-
-        # 새로 추가된 지역
-        if prev_data:
-            new_regions = self.detect_new_regions(current_data, prev_data)
-            if new_regions:
-                lines.append("### 새로 추가된 지역")
-                lines.append("| 시도 | 추가 지역 수 | 추가된 지역구분 |")
-                lines.append("|------|--------------|-----------------|")
-
-                for sido in sorted(new_regions.keys()):
-                    added = new_regions[sido]
-                    lines.append(f"| {sido} | {len(added)} | {', '.join(added)} |")
-
-                lines.append("")
+        regions_section.add(Text(f"{len(self.current):,}건", kind="total", label="총 데이터 건수"))
+
+        # 새로 추가된 / 삭제된 지역
+        for title, empty_text, count_header, list_header, detect in [
+            ("새로 추가된 지역", "새로 추가된 지역 없음", "추가 지역 수", "추가된 지역구분", self.detect_new_regions),
+            ("삭제된 지역", "삭제된 지역 없음", "삭제 지역 수", "삭제된 지역구분", self.detect_removed_regions),
+        ]:
+            region_section = section.subsection(title)
+            if not self.prev:
+                region_section.add(Text("이전 데이터가 없어 비교할 수 없습니다.", kind="no-data"))
+                continue
+            regions = detect()
+            if regions:
+                region_section.add(Table(
+                    ["시도", count_header, list_header],
+                    [[sido, number_cell(len(regions[sido]), "d"), ", ".join(regions[sido])] for sido in sorted(regions)],
+                ))
             else:
-                lines.append("### 새로 추가된 지역")
-                lines.append("새로 추가된 지역 없음")
-                lines.append("")
+                region_section.add(Text(empty_text, kind="no-data"))
+
+        if not self.prev:
+            return section
+
+        # 모델별 국비/지방비/보조금 변화
+        changes = self.change_set()
+        amount_section = section.subsection("모델별 보조금 변화")
+        if changes.modified:
+            top = sorted(changes.modified, key=lambda c: abs(c.diff), reverse=True)[:MAX_ROW_CHANGE_ROWS]
+            amount_section.add(Table(
+                [*changes.rules.key, "항목", "이전", "현재", "변화"],
+                lambda: (
+                    [*c.key, c.field, number_cell(c.prev), number_cell(c.current), change_cell(c.diff, "만원")]
+                    for c in top
+                ),
+            ))
+            if len(changes.modified) > len(top):
+                amount_section.add(Text(f"외 {len(changes.modified) - len(top):,}건", kind="note"))
         else:
-            lines.append("### 새로 추가된 지역")
-            lines.append("이전 데이터가 없어 비교할 수 없습니다.")
-            lines.append("")
-
-        return lines
-
-
-def generate_full_report() -> str:
-    """전체 보고서 생성"""
-    now = datetime.now(KST)
-
-    lines = []
-    lines.append("# EV 보조금 데이터 변화 보고서")
-    lines.append(f"**보고서 생성일시**: {now.strftime('%Y년 %m월 %d일 %H:%M:%S')}")
-    lines.append(f"**데이터 기준일**: {now.strftime('%Y-%m-%d')}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    # EV 보조금 보고서
-    ev_generator = EVSubsidyReportGenerator()
-    lines.extend(ev_generator.generate_report())
-
-    lines.append("---")
-    lines.append("")
-
-    # KG 모빌리티 보고서
-    kg_generator = KGMobilityReportGenerator()
-    lines.extend(kg_generator.generate_report())
-
-    return "\n".join(lines)
-
-
-def save_report(content: str) -> str:
-    """보고서를 파일로 저장"""
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-
-    now = datetime.now(KST)
-    filename = f"report_{now.strftime('%Y%m%d_%H%M%S')}.md"
-    filepath = os.path.join(REPORTS_DIR, filename)
-
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
-
-    return filepath
-
-
-# ============================================================
-# HTML 보고서 생성 (애플 스타일 미니멀 디자인)
-# ============================================================
-
-HTML_STYLES = """
-<style>
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    body {
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-        background-color: #ffffff;
-        color: #1d1d1f;
-        line-height: 1.5;
-        padding: 40px 20px;
-        max-width: 800px;
-        margin: 0 auto;
-    }
-    h1 {
-        font-size: 28px;
-        font-weight: 600;
-        margin-bottom: 8px;
-        letter-spacing: -0.5px;
-    }
-    .subtitle {
-        color: #86868b;
-        font-size: 14px;
-        margin-bottom: 32px;
-    }
-    h2 {
-        font-size: 20px;
-        font-weight: 600;
-        margin-top: 32px;
-        margin-bottom: 16px;
-        padding-bottom: 8px;
-        border-bottom: 1px solid #d2d2d7;
-    }
-    h3 {
-        font-size: 16px;
-        font-weight: 600;
-        margin-top: 24px;
-        margin-bottom: 12px;
-        color: #1d1d1f;
-    }
-    table {
-        width: 100%;
-        border-collapse: collapse;
-        margin: 16px 0;
-        font-size: 14px;
-    }
-    th, td {
-        padding: 12px 16px;
-        text-align: left;
-        border-bottom: 1px solid #d2d2d7;
-    }
-    th {
-        font-weight: 600;
-        color: #1d1d1f;
-        background-color: #fafafa;
+            amount_section.add(Text("보조금 변화 없음", kind="no-data"))
+
+        add_row_changes(section.subsection("추가/삭제된 모델"), changes,
+                        ["시도", "지역구분", "세부차종", "모델명", "보조금(만원)"], "추가/삭제된 모델 없음")
+        return section
+
+
+def add_row_changes(section: Section, changes: ChangeSet, columns: list[str], empty_text: str):
+    """추가/삭제된 행 표 (구분 + 지정 컬럼, 최대 MAX_ROW_CHANGE_ROWS행)"""
+    rows = [("추가", row) for row in changes.added] + [("삭제", row) for row in changes.removed]
+    if not rows:
+        section.add(Text(empty_text, kind="no-data"))
+        return
+    section.add(Table(["구분", *columns], [[kind, *(row[c] for c in columns)]
+                                           for kind, row in rows[:MAX_ROW_CHANGE_ROWS]]))
+    if len(rows) > MAX_ROW_CHANGE_ROWS:
+        section.add(Text(f"외 {len(rows) - MAX_ROW_CHANGE_ROWS:,}건", kind="note"))
+
+
+def report_digest(ev_generator: EVSubsidyReportGenerator, kg_generator: KGMobilityReportGenerator) -> str:
+    """보고서에 쓰이는 데이터(데이터셋별 현재/이전)와 변화 감지 규칙의 해시 - 같으면 같은 보고서"""
+    digest = hashlib.sha256()
+    for generator in (ev_generator, kg_generator):
+        name = generator.current.schema.name
+        rules = json.dumps((generator.rules or DEFAULT_RULES[name]).to_dict(), ensure_ascii=False, sort_keys=True)
+        digest.update(f"{name}:{generator.current.digest()}:{generator.prev.digest()}:{rules}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def build_report(ev_generator: EVSubsidyReportGenerator | None = None,
+                 kg_generator: KGMobilityReportGenerator | None = None,
+                 rules: dict[str, DiffRules] | None = None) -> Report:
+    """전체 보고서 모델 구성 (생성기를 넘기면 이미 로드된 데이터 재사용)"""
+    rules = rules or load_rules()
+    ev_generator = ev_generator or EVSubsidyReportGenerator(rules["ev_subsidy"])
+    kg_generator = kg_generator or KGMobilityReportGenerator(rules["kg_mobility"])
+    with METRICS.span("report.build"):
+        return Report(REPORT_TITLE, datetime.now(KST), [
+            ev_generator.build_section(),
+            kg_generator.build_section(),
+        ], change_sets(ev_generator, kg_generator), report_digest(ev_generator, kg_generator))
+
+
+def change_sets(ev_generator: EVSubsidyReportGenerator, kg_generator: KGMobilityReportGenerator) -> list[ChangeSet]:
+    """이전 데이터가 있는 데이터셋의 변경 목록"""
+    return [generator.change_set() for generator in (ev_generator, kg_generator)
+            if generator.current and generator.prev]
+
+
+def save_changes(changes_list: list[ChangeSet], generated_at: datetime, path: str = CHANGES_PATH) -> str:
+    """변경 목록을 JSON으로 저장 (summary: 알림용 요약 문장)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = {
+        "generated_at": generated_at.isoformat(timespec="seconds"),
+        "summary": "\n".join(changes.summary_text() for changes in changes_list) or "비교할 이전 데이터 없음",
+        "datasets": {changes.dataset: changes.to_dict() for changes in changes_list},
     }
-    td {
-        color: #1d1d1f;
-    }
-    tr:last-child td {
-        border-bottom: none;
-    }
-    .increase {
-        color: #34c759;
-        font-weight: 500;
-    }
-    .decrease {
-        color: #ff3b30;
-        font-weight: 500;
-    }
-    .no-data {
-        color: #86868b;
-        font-style: italic;
-        padding: 20px 0;
-    }
-    .total {
-        color: #86868b;
-        font-size: 14px;
-        margin: 16px 0;
-    }
-    hr {
-        border: none;
-        border-top: 1px solid #d2d2d7;
-        margin: 32px 0;
-    }
-</style>
-"""
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_file, path)
+    return path
 
 
-def _build_html_table(headers: list[str], rows: list[list[str]], change_col: int = None) -> str:
-    """테이블 HTML 생성
+def render_report(report: Report, fmt: str) -> str:
+    """보고서를 문자열로 렌더링 (미리보기 등 작은 출력용)"""
+    out = io.StringIO()
+    RENDERERS[fmt]().render(report, out)
+    return out.getvalue()
 
-    Args:
-        headers: 테이블 헤더 목록
-        rows: 테이블 데이터 행 목록
-        change_col: 변화량 컬럼 인덱스 (색상 적용용)
-    """
-    html = ['<table>']
-
-    # 헤더
-    html.append('<thead><tr>')
-    for header in headers:
-        html.append(f'<th>{header}</th>')
-    html.append('</tr></thead>')
-
-    # 바디
-    html.append('<tbody>')
-    for row in rows:
-        html.append('<tr>')
-        for i, cell in enumerate(row):
-            if change_col is not None and i == change_col:
-                # 변화량 컬럼: 색상 적용
-                if '+' in str(cell) or '증가' in str(cell):
-                    html.append(f'<td class="increase">{cell}</td>')
-                elif '-' in str(cell) or '감소' in str(cell):
-                    html.append(f'<td class="decrease">{cell}</td>')
-                else:
-                    html.append(f'<td>{cell}</td>')
-            else:
-                html.append(f'<td>{cell}</td>')
-        html.append('</tr>')
-    html.append('</tbody>')
-
-    html.append('</table>')
-    return '\n'.join(html)
-
-
-def _build_html_section(title: str, content: str) -> str:
-    """섹션 HTML 생성"""
-    return f'<h3>{title}</h3>\n{content}'
-
-
-def generate_html_report() -> str:
-    """HTML 보고서 생성 (이메일용)"""
-    now = datetime.now(KST)
-
-    html = [
-        '<!DOCTYPE html>',
-        '<html lang="ko">',
-        '<head>',
-        '<meta charset="UTF-8">',
-        '<meta name="viewport" content="width=device-width, initial-scale=1.0">',
-        '<title>EV 보조금 데이터 변화 보고서</title>',
-        HTML_STYLES,
-        '</head>',
-        '<body>',
-        '<h1>EV 보조금 데이터 변화 보고서</h1>',
-        f'<p class="subtitle">{now.strftime("%Y년 %m월 %d일 %H:%M")} 기준</p>',
-    ]
-
-    # EV 보조금 섹션
-    html.append('<h2>EV 보조금 현황</h2>')
-    ev_generator = EVSubsidyReportGenerator()
-    current_data = ev_generator.load_data(ev_generator.current_file)
-    prev_data = ev_generator.load_data(ev_generator.prev_file)
-
-    if not current_data:
-        html.append('<p class="no-data">데이터가 없습니다.</p>')
-    else:
-        html.append('<h3>지역별 총계</h3>')
-        regional_totals = ev_generator.generate_regional_totals(current_data)
-        headers = ['시도', '지역수', '민간공고대수', '출고잔여대수']
-        rows = []
-        for sido, stats in sorted(regional_totals.items()):
-            rows.append([
-                sido,
-                str(stats['지역수']),
-                f"{stats['민간공고대수_일반']:,}",
-                f"{stats['출고잔여대수_전체']:,}"
-            ])
-        html.append(_build_html_table(headers, rows))
-
-        html.append('<h3>시도/차종별 현황</h3>')
-        summary = ev_generator.generate_summary(current_data)
-        headers = ['시도', '차종', '지역수', '민간공고대수', '출고잔여대수']
-        rows = []
-        for (sido, vehicle_type), stats in sorted(summary.items()):
-            rows.append([
-                sido,
-                vehicle_type,
-                str(stats['지역수']),
-                f"{stats['민간공고대수_일반']:,}",
-                f"{stats['출고잔여대수_전체']:,}"
-            ])
-        html.append(_build_html_table(headers, rows))
-
-        # 유의미한 변화
-        html.append('<h3>유의미한 변화</h3>')
-        if prev_data:
-            changes = ev_generator.detect_changes(current_data, prev_data)
-            if changes:
-                headers = ['시도', '지역', '차종', '항목', '이전', '현재', '변화']
-                rows = []
-                for change in sorted(changes, key=lambda x: abs(x["변화"]), reverse=True)[:20]:
-                    diff_text = f"+{change['변화']:,}" if change["변화"] > 0 else f"{change['변화']:,}"
-                    rows.append([
-                        change['시도'],
-                        change['지역'],
-                        change['차종'],
-                        change['항목'].replace('민간공고대수_일반', '공고대수').replace('출고잔여대수_전체', '잔여대수'),
-                        f"{change['이전']:,}",
-                        f"{change['현재']:,}",
-                        diff_text
-                    ])
-                html.append(_build_html_table(headers, rows, change_col=6))
-            else:
-                html.append('<p class="no-data">변화 없음</p>')
-        else:
-            html.append('<p class="no-data">이전 데이터가 없어 비교할 수 없습니다.</p>')
-
-    html.append('<hr>')
-
-    # KG 모빌리티 섹션
-    html.append('<h2>KG 모빌리티 보조금 현황</h2>')
-    kg_generator = KGMobilityReportGenerator()
-    kg_current_data = kg_generator.load_data(kg_generator.current_file)
-    kg_prev_data = kg_generator.load_data(kg_generator.prev_file)
 
-    if not kg_current_data:
-        html.append('<p class="no-data">데이터가 없습니다.</p>')
-    else:
-        # 시도별 지역 현황
-        html.append('<h3>시도별 지역 현황</h3>')
-        regions_by_sido = kg_generator.get_regions_by_sido(kg_current_data)
-        headers = ['시도', '지역 수', '지역구분 목록']
-        rows = []
-        for sido in sorted(regions_by_sido.keys()):
-            districts = regions_by_sido[sido]
-            district_list = ", ".join(sorted(districts)[:10])
-            if len(districts) > 10:
-                district_list += f" 외 {len(districts) - 10}개"
-            rows.append([sido, str(len(districts)), district_list])
-        html.append(_build_html_table(headers, rows))
-
-        html.append(f'<p class="total">총 데이터 건수: {len(kg_current_data):,}건</p>')
-
-        # 새로 추가된 지역
-        html.append('<h3>새로 추가된 지역</h3>')
-        if kg_prev_data:
-            new_regions = kg_generator.detect_new_regions(kg_current_data, kg_prev_data)
-            if new_regions:
-                headers = ['시도', '추가 지역 수', '추가된 지역구분']
-                rows = []
-                for sido in sorted(new_regions.keys()):
-                    added = new_regions[sido]
-                    rows.append([sido, str(len(added)), ', '.join(added)])
-                html.append(_build_html_table(headers, rows))
-            else:
-                html.append('<p class="no-data">새로 추가된 지역 없음</p>')
-        else:
-            html.append('<p class="no-data">이전 데이터가 없어 비교할 수 없습니다.</p>')
-
-    html.append('</body>')
-    html.append('</html>')
+def find_report(digest: str, fmt: str) -> str | None:
+    """같은 데이터 해시로 이미 저장된 보고서 파일 (없으면 None)"""
+    pattern = f"report_*_{digest[:REPORT_DIGEST_LENGTH]}.{RENDERERS[fmt].extension}"
+    matches = sorted(glob.glob(os.path.join(REPORTS_DIR, pattern)))
+    return matches[-1] if matches else None
 
-    return '\n'.join(html)
 
+def save_report(report: Report, fmt: str = "md") -> str:
+    """보고서를 형식별 파일로 저장 (렌더러가 파일에 바로 기록)
 
-def save_html_report(content: str) -> str:
-    """HTML 보고서를 파일로 저장"""
+    파일 이름은 report_<날짜>_<데이터 해시>.<확장자>이며, 같은 데이터의 보고서가 이미 있으면 그 파일을 덮어씀.
+    """
     os.makedirs(REPORTS_DIR, exist_ok=True)
 
-    now = datetime.now(KST)
-    filename = f"report_{now.strftime('%Y%m%d_%H%M%S')}.html"
-    filepath = os.path.join(REPORTS_DIR, filename)
+    renderer = RENDERERS[fmt]()
+    if report.digest:
+        filename = (f"report_{report.generated_at.strftime('%Y%m%d')}_"
+                    f"{report.digest[:REPORT_DIGEST_LENGTH]}.{renderer.extension}")
+        filepath = find_report(report.digest, fmt) or os.path.join(REPORTS_DIR, filename)
+    else:
+        filename = f"report_{report.generated_at.strftime('%Y%m%d_%H%M%S')}.{renderer.extension}"
+        filepath = os.path.join(REPORTS_DIR, filename)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
+    with METRICS.span("report.render", format=fmt):
+        with open(filepath, "w", encoding="utf-8", newline="" if fmt == "csv" else None) as f:
+            renderer.render(report, f)
 
     return filepath
 
 
-def main():
-    print("=" * 60)
-    print("EV 보조금 데이터 변화 보고서 생성")
-    print("=" * 60)
-
-    # 마크다운 보고서 생성
-    report_content = generate_full_report()
-    md_filepath = save_report(report_content)
-    print(f"\n마크다운 보고서 생성 완료: {md_filepath}")
+def main(formats: list[str] | None = None, rules_path: str | None = None, force: bool = False) -> list[str]:
+    """보고서 생성 - 형식별 보고서 파일 경로 반환
 
-    # HTML 보고서 생성 (이메일용)
-    html_content = generate_html_report()
-    html_filepath = save_html_report(html_content)
-    print(f"HTML 보고서 생성 완료: {html_filepath}")
-
-    print("\n" + "=" * 60)
-    print("마크다운 보고서 내용 미리보기:")
-    print("=" * 60)
-    print(report_content[:2000])
-    if len(report_content) > 2000:
-        print("\n... (이하 생략)")
+    데이터(현재/이전)와 규칙의 해시가 같은 보고서가 모든 형식으로 이미 있으면 force가 아닌 한 다시 만들지 않음
+    (변경 목록 changes.json은 이번 데이터로 다시 저장).
+    """
+    log.info("=" * 60)
+    log.info("EV 보조금 데이터 변화 보고서 생성")
+    log.info("=" * 60)
+
+    formats = formats or DEFAULT_FORMATS
+    rules = load_rules(rules_path)
+    ev_generator = EVSubsidyReportGenerator(rules["ev_subsidy"])
+    kg_generator = KGMobilityReportGenerator(rules["kg_mobility"])
+    existing = [find_report(report_digest(ev_generator, kg_generator), fmt) for fmt in formats]
+    if not force and all(existing):
+        log.info(f"같은 데이터의 보고서가 이미 있음 - 생성 생략: {', '.join(existing)}")
+        METRICS.add("report.skipped")
+        save_changes(change_sets(ev_generator, kg_generator), datetime.now(KST))
+        return existing
+
+    # 데이터 로드와 보고서 구성은 한 번만 하고 형식별로 렌더링
+    report = build_report(ev_generator, kg_generator, rules)
+    filepaths = []
+    for fmt in formats:
+        filepath = save_report(report, fmt)
+        filepaths.append(filepath)
+        log.info(f"{fmt.upper()} 보고서 생성 완료: {filepath}")
+    for changes in report.changes:
+        log.info(f"변경 감지: {changes.summary_text()}")
+    save_changes(report.changes, report.generated_at)
+
+    # 마크다운 미리보기 (--log-level debug)
+    if log.isEnabledFor(logging.DEBUG):
+        report_content = render_report(report, "md")
+        log.debug("마크다운 보고서 내용 미리보기:\n" + report_content[:2000]
+                  + ("\n... (이하 생략)" if len(report_content) > 2000 else ""))
+    return filepaths
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="EV 보조금 데이터 변화 보고서 생성")
+    parser.add_argument("--format", dest="formats", action="append", choices=sorted(RENDERERS),
+                        help=f"출력 형식 (여러 번 지정 가능, 기본: {', '.join(DEFAULT_FORMATS)})")
+    parser.add_argument("--change-rules", metavar="PATH",
+                        help="변화 감지 규칙 JSON (데이터셋별 키/비교 컬럼/항목별 임계값, change_detect 참고)")
+    parser.add_argument("--force", action="store_true", help="같은 데이터의 보고서가 이미 있어도 다시 생성")
+    add_logging_arguments(parser)
+    args = parser.parse_args()
+    configure_from_args(args)
+    main(args.formats, args.change_rules, args.force)
+    METRICS.write_run_summary("report_generator")
+    flush_logs()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+보고서 중간 모델
+보고서를 섹션/표/문단과 타입이 있는 셀로 표현하여, 출력 형식(마크다운/HTML/JSON/CSV)별
+렌더러가 같은 모델을 그대로 그리도록 함
+"""
+
+from datetime import datetime
+from typing import Callable, Iterable
+
+# 셀 변화 방향
+INCREASE = 1
+DECREASE = -1
+UNCHANGED = 0
+
+
+class Cell:
+    """표 셀 - 표시 문자열, 원래 값(숫자 등), 변화 방향"""
+
+    __slots__ = ("text", "value", "direction")
+
+    def __init__(self, text: str, value=None, direction: int = UNCHANGED):
+        self.text = text
+        self.value = value
+        self.direction = direction
+
+
+def number_cell(value: int | float, fmt: str = ",") -> Cell:
+    """천 단위 구분 숫자 셀"""
+    return Cell(format(value, fmt), value)
+
+
+def change_cell(diff: int, unit: str = "대") -> Cell:
+    """변화량 셀 (+3대 증가 / -2대 감소)"""
+    if diff > 0:
+        return Cell(f"+{diff:,}{unit} 증가", diff, INCREASE)
+    if diff < 0:
+        return Cell(f"{diff:,}{unit} 감소", diff, DECREASE)
+    return Cell("0", diff, UNCHANGED)
+
+
+class Table:
+    """표 - rows는 행 목록 또는 행을 하나씩 만들어 내는 함수
+
+    함수를 넘기면 렌더러마다 새로 호출하므로 큰 표도 중간 목록 없이 그대로 출력됨.
+    행의 각 값은 Cell 또는 문자열.
+    """
+
+    def __init__(self, headers: list[str], rows: Iterable[list] | Callable[[], Iterable[list]]):
+        self.headers = headers
+        self._rows = rows
+
+    def iter_rows(self) -> Iterable[list[Cell]]:
+        rows = self._rows() if callable(self._rows) else self._rows
+        for row in rows:
+            yield [cell if isinstance(cell, Cell) else Cell(str(cell)) for cell in row]
+
+
+class Text:
+    """문단 - kind: note(일반), no-data(데이터 없음 안내), total(건수 등 요약 값)"""
+
+    def __init__(self, text: str, kind: str = "note", label: str | None = None):
+        self.text = text
+        self.kind = kind
+        self.label = label
+
+
+class Section:
+    """제목이 있는 섹션 - blocks는 Table/Text/하위 Section"""
+
+    def __init__(self, title: str, blocks: list | None = None, level: int = 2):
+        self.title = title
+        self.blocks = blocks if blocks is not None else []
+        self.level = level
+
+    def add(self, block):
+        self.blocks.append(block)
+        return block
+
+    def subsection(self, title: str) -> "Section":
+        return self.add(Section(title, level=self.level + 1))
+
+
+class Report:
+    """보고서 - 최상위 섹션 목록과 데이터셋별 변경 목록(change_detect.ChangeSet)
+
+    digest: 보고서에 쓰인 데이터(현재/이전)의 내용 해시 (파일 이름에 사용)
+    """
+
+    def __init__(self, title: str, generated_at: datetime, sections: list[Section] | None = None,
+                 changes: list | None = None, digest: str | None = None):
+        self.title = title
+        self.generated_at = generated_at
+        self.sections = sections if sections is not None else []
+        self.changes = changes if changes is not None else []
+        self.digest = digest
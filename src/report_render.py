@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+보고서 렌더러
+report_model의 보고서를 형식별(마크다운/HTML/JSON/CSV)로 파일 핸들에 바로 기록
+(표 행은 하나씩 출력하므로 큰 표도 전체 문자열을 만들지 않음)
+"""
+
+import csv
+import html
+import json
+from typing import TextIO
+
+from report_model import DECREASE, INCREASE, Report, Section, Table, Text
+
+
+def _md_cell(text: str) -> str:
+    return text.replace("|", "\\|").replace("\n", " ")
+
+
+class MarkdownRenderer:
+    """마크다운 렌더러"""
+
+    extension = "md"
+
+    def render(self, report: Report, out: TextIO):
+        out.write(f"# {report.title}\n")
+        out.write(f"**보고서 생성일시**: {report.generated_at.strftime('%Y년 %m월 %d일 %H:%M:%S')}\n")
+        out.write(f"**데이터 기준일**: {report.generated_at.strftime('%Y-%m-%d')}\n")
+        out.write("\n")
+        for section in report.sections:
+            out.write("---\n\n")
+            self._section(section, out)
+
+    def _section(self, section: Section, out: TextIO):
+        out.write(f"{'#' * section.level} {section.title}\n")
+        if section.level <= 2:
+            out.write("\n")
+        for block in section.blocks:
+            if isinstance(block, Section):
+                self._section(block, out)
+            elif isinstance(block, Table):
+                self._table(block, out)
+            elif isinstance(block, Text):
+                text = f"**{block.label}**: {block.text}" if block.label else block.text
+                out.write(f"{text}\n\n")
+
+    def _table(self, table: Table, out: TextIO):
+        out.write("| " + " | ".join(table.headers) + " |\n")
+        out.write("|" + "|".join("-" * (len(h) + 2) for h in table.headers) + "|\n")
+        for row in table.iter_rows():
+            out.write("| " + " | ".join(_md_cell(cell.text) for cell in row) + " |\n")
+        out.write("\n")
+
+
+HTML_STYLES = """
+<style>
+    * {
+        margin: 0;
+        padding: 0;
+        box-sizing: border-box;
+    }
+    body {
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+        background-color: #ffffff;
+        color: #1d1d1f;
+        line-height: 1.5;
+        padding: 40px 20px;
+        max-width: 800px;
+        margin: 0 auto;
+    }
+    h1 {
+        font-size: 28px;
+        font-weight: 600;
+        margin-bottom: 8px;
+        letter-spacing: -0.5px;
+    }
+    .subtitle {
+        color: #86868b;
+        font-size: 14px;
+        margin-bottom: 32px;
+    }
+    h2 {
+        font-size: 20px;
+        font-weight: 600;
+        margin-top: 32px;
+        margin-bottom: 16px;
+        padding-bottom: 8px;
+        border-bottom: 1px solid #d2d2d7;
+    }
+    h3 {
+        font-size: 16px;
+        font-weight: 600;
+        margin-top: 24px;
+        margin-bottom: 12px;
+        color: #1d1d1f;
+    }
+    table {
+        width: 100%;
+        border-collapse: collapse;
+        margin: 16px 0;
+        font-size: 14px;
+    }
+    th, td {
+        padding: 12px 16px;
+        text-align: left;
+        border-bottom: 1px solid #d2d2d7;
+    }
+    th {
+        font-weight: 600;
+        color: #1d1d1f;
+        background-color: #fafafa;
+    }
+    td {
+        color: #1d1d1f;
+    }
+    tr:last-child td {
+        border-bottom: none;
+    }
+    .increase {
+        color: #34c759;
+        font-weight: 500;
+    }
+    .decrease {
+        color: #ff3b30;
+        font-weight: 500;
+    }
+    .no-data {
+        color: #86868b;
+        font-style: italic;
+        padding: 20px 0;
+    }
+    .total {
+        color: #86868b;
+        font-size: 14px;
+        margin: 16px 0;
+    }
+    hr {
+        border: none;
+        border-top: 1px solid #d2d2d7;
+        margin: 32px 0;
+    }
+</style>
+"""
+
+
+class HtmlRenderer:
+    """HTML 렌더러 (이메일용, 애플 스타일 미니멀 디자인)"""
+
+    extension = "html"
+
+    TEXT_CLASSES = {"no-data": "no-data", "total": "total"}
+    DIRECTION_CLASSES = {INCREASE: "increase", DECREASE: "decrease"}
+
+    def render(self, report: Report, out: TextIO):
+        title = html.escape(report.title)
+        out.write("\n".join([
+            '<!DOCTYPE html>',
+            '<html lang="ko">',
+            '<head>',
+            '<meta charset="UTF-8">',
+            '<meta name="viewport" content="width=device-width, initial-scale=1.0">',
+            f'<title>{title}</title>',
+            HTML_STYLES,
+            '</head>',
+            '<body>',
+            f'<h1>{title}</h1>',
+            f'<p class="subtitle">{report.generated_at.strftime("%Y년 %m월 %d일 %H:%M")} 기준</p>',
+        ]) + "\n")
+        for i, section in enumerate(report.sections):
+            if i:
+                out.write("<hr>\n")
+            self._section(section, out)
+        out.write("</body>\n</html>\n")
+
+    def _section(self, section: Section, out: TextIO):
+        level = min(section.level, 6)
+        out.write(f"<h{level}>{html.escape(section.title)}</h{level}>\n")
+        for block in section.blocks:
+            if isinstance(block, Section):
+                self._section(block, out)
+            elif isinstance(block, Table):
+                self._table(block, out)
+            elif isinstance(block, Text):
+                text = f"{block.label}: {block.text}" if block.label else block.text
+                css = self.TEXT_CLASSES.get(block.kind)
+                attr = f' class="{css}"' if css else ""
+                out.write(f"<p{attr}>{html.escape(text)}</p>\n")
+
+    def _table(self, table: Table, out: TextIO):
+        out.write("<table>\n<thead><tr>")
+        out.write("".join(f"<th>{html.escape(h)}</th>" for h in table.headers))
+        out.write("</tr></thead>\n<tbody>\n")
+        for row in table.iter_rows():
+            out.write("<tr>")
+            for cell in row:
+                css = self.DIRECTION_CLASSES.get(cell.direction)
+                attr = f' class="{css}"' if css else ""
+                out.write(f"<td{attr}>{html.escape(cell.text)}</td>")
+            out.write("</tr>\n")
+        out.write("</tbody>\n</table>\n")
+
+
+class JsonRenderer:
+    """JSON 렌더러 - 셀은 원래 값(숫자)이 있으면 값, 없으면 표시 문자열"""
+
+    extension = "json"
+
+    def render(self, report: Report, out: TextIO):
+        out.write("{")
+        out.write(f'"title": {self._dump(report.title)}, ')
+        out.write(f'"generated_at": {self._dump(report.generated_at.isoformat(timespec="seconds"))}, ')
+        out.write('"sections": [')
+        for i, section in enumerate(report.sections):
+            if i:
+                out.write(", ")
+            self._section(section, out)
+        out.write("], ")
+        changes = {changes.dataset: changes.to_dict() for changes in report.changes}
+        out.write(f'"changes": {self._dump(changes)}}}\n')
+
+    @staticmethod
+    def _dump(value) -> str:
+        return json.dumps(value, ensure_ascii=False)
+
+    def _section(self, section: Section, out: TextIO):
+        out.write(f'{{"type": "section", "title": {self._dump(section.title)}, "blocks": [')
+        for i, block in enumerate(section.blocks):
+            if i:
+                out.write(", ")
+            if isinstance(block, Section):
+                self._section(block, out)
+            elif isinstance(block, Table):
+                out.write(f'{{"type": "table", "headers": {self._dump(block.headers)}, "rows": [')
+                for j, row in enumerate(block.iter_rows()):
+                    values = [cell.text if cell.value is None else cell.value for cell in row]
+                    out.write(("\n" if j == 0 else ",\n") + self._dump(values))
+                out.write("]}")
+            elif isinstance(block, Text):
+                text = {"type": "text", "kind": block.kind, "text": block.text}
+                if block.label:
+                    text["label"] = block.label
+                out.write(self._dump(text))
+        out.write("]}")
+
+
+class CsvRenderer:
+    """CSV 렌더러 - 표만 출력, 표마다 '# 섹션 > 하위 섹션' 주석 줄 + 헤더 + 행, 표 사이 빈 줄"""
+
+    extension = "csv"
+
+    def render(self, report: Report, out: TextIO):
+        writer = csv.writer(out)
+        for section in report.sections:
+            self._section(section, [], writer)
+
+    def _section(self, section: Section, path: list[str], writer):
+        path = path + [section.title]
+        for block in section.blocks:
+            if isinstance(block, Section):
+                self._section(block, path, writer)
+            elif isinstance(block, Table):
+                writer.writerow(["# " + " > ".join(path)])
+                writer.writerow(block.headers)
+                writer.writerows(
+                    [cell.text if cell.value is None else cell.value for cell in row] for row in block.iter_rows()
+                )
+                writer.writerow([])
+
+
+RENDERERS = {
+    "md": MarkdownRenderer,
+    "html": HtmlRenderer,
+    "json": JsonRenderer,
+    "csv": CsvRenderer,
+}
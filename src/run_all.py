@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+EV 보조금 통합 실행기
+브라우저 하나를 띄워 접수현황 크롤러(ev_crawler)와 KG 모빌리티 크롤러(crawl_ev_subsidy)를
+별도 컨텍스트에서 동시에 실행한 뒤, 같은 프로세스에서 보고서를 생성
+--daemon이면 브라우저를 띄워 둔 채 일정 간격으로 크롤링 + 보고서 생성을 반복
+실행(회차)마다 단계별 소요 시간/건수 요약을 metrics/run_summary.jsonl에 추가
+크롤링 결과가 지난 실행(이력의 최신 스냅샷)과 내용이 같으면 이력 저장/보고서 생성을 건너뛰고,
+변경 여부를 metrics/pipeline_status.json에 기록 (워크플로의 커밋/메일 여부 판단용)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+
+from playwright.async_api import Browser, async_playwright
+
+import crawl_ev_subsidy
+import ev_crawler
+import history_store
+import report_generator
+from browser_session import SessionCache
+from metrics import METRICS, METRICS_DIR
+from page_profile import DEFAULT_PROFILE, PROFILES
+from run_log import add_logging_arguments, configure_from_args, flush_logs, get_logger
+from site_fixtures import SiteFixtures, add_fixture_arguments, fixtures_from_args
+from snapshot_io import add_snapshot_arguments, configure_snapshots
+
+log = get_logger("run_all")
+
+# 이번 실행의 데이터 변경 여부/내용 해시/보고서 경로 (실행마다 덮어씀)
+PIPELINE_STATUS_PATH = os.path.join(METRICS_DIR, "pipeline_status.json")
+
+
+async def run_crawlers_with_browser(browser: Browser, fetch_mode: bool = False, profile: str = DEFAULT_PROFILE,
+                                    screenshot: bool = False, incremental: bool = False, resume: bool = False,
+                                    years: list[str] | None = None,
+                                    manufacturers: list[str] | None = crawl_ev_subsidy.DEFAULT_MANUFACTURERS,
+                                    session: SessionCache | None = None, fixtures: SiteFixtures | None = None,
+                                    refresh_regions: bool = False):
+    """이미 실행 중인 브라우저에서 두 크롤러를 동시 실행 (한쪽이 실패해도 다른 쪽은 끝까지 진행)
+
+    증분 크롤링 시 KG 크롤러는 지역 목록 확보 후 이번 접수현황 결과를 기다려 비교에 사용.
+    """
+    ev_task = asyncio.create_task(ev_crawler.crawl_with_browser(browser, profile, screenshot, session, fixtures))
+    with METRICS.span("crawl"):
+        results = await asyncio.gather(
+            ev_task,
+            crawl_ev_subsidy.crawl_with_browser(browser, fetch_mode, profile=profile,
+                                                incremental=incremental, summary_source=ev_task,
+                                                resume=resume, years=years, manufacturers=manufacturers,
+                                                session=session, fixtures=fixtures,
+                                                refresh_regions=refresh_regions),
+            return_exceptions=True,
+        )
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    for name, result in zip(["ev_crawler", "crawl_ev_subsidy"], results):
+        if isinstance(result, BaseException):
+            log.error(f"[{name}] 크롤링 실패", exc_info=result)
+    if errors:
+        raise errors[0]
+
+
+async def run_crawlers(fetch_mode: bool = False, profile: str = DEFAULT_PROFILE, screenshot: bool = False,
+                       incremental: bool = False, resume: bool = False, years: list[str] | None = None,
+                       manufacturers: list[str] | None = crawl_ev_subsidy.DEFAULT_MANUFACTURERS,
+                       session: SessionCache | None = None, fixtures: SiteFixtures | None = None,
+                       refresh_regions: bool = False):
+    """브라우저를 띄워 두 크롤러를 한 번 실행"""
+    async with async_playwright() as p:
+        with METRICS.span("browser.launch"):
+            browser = await p.chromium.launch(headless=True)
+        try:
+            await run_crawlers_with_browser(browser, fetch_mode, profile, screenshot, incremental, resume,
+                                            years, manufacturers, session, fixtures, refresh_regions)
+        finally:
+            await browser.close()
+
+
+def write_pipeline_status(changed: bool, digests: dict[str, str | None], changed_datasets: list[str],
+                          reports: list[str], path: str = PIPELINE_STATUS_PATH) -> str:
+    """이번 실행의 변경 여부를 JSON으로 저장"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = {
+        "checked_at": datetime.now(history_store.KST).isoformat(timespec="seconds"),
+        "changed": changed,
+        "datasets": {dataset: {"digest": digest, "changed": dataset in changed_datasets}
+                     for dataset, digest in digests.items()},
+        "reports": reports,
+    }
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_file, path)
+    return path
+
+
+def store_and_report(skip_report: bool = False, force: bool = False) -> bool:
+    """이번 결과를 이력 저장소에 스냅샷으로 추가 (보고서의 이전 데이터 비교 기준) 후 보고서 생성
+
+    데이터셋별 내용 해시(정렬된 행 기준)가 모두 이력의 최신 스냅샷과 같으면 force가 아닌 한 둘 다 건너뜀.
+    데이터 변경 여부 반환.
+    """
+    with METRICS.span("digest"):
+        digests = history_store.current_digests()
+        latest = history_store.latest_digests()
+    changed = [dataset for dataset, digest in digests.items() if digest != latest.get(dataset)]
+
+    if not changed and not force:
+        log.info("지난 실행과 데이터가 같음 - 이력 저장/보고서 생성 생략")
+        METRICS.add("pipeline.unchanged")
+        write_pipeline_status(False, digests, changed, [])
+        return False
+
+    log.info(f"데이터 변경: {', '.join(changed) or '없음 (강제 실행)'}")
+    with METRICS.span("history.append"):
+        snapshots = history_store.append_current()
+    for dataset, snapshot_id in snapshots.items():
+        log.info(f"이력 저장: {dataset} 스냅샷 #{snapshot_id}")
+
+    reports = []
+    if not skip_report:
+        with METRICS.span("report"):
+            reports = report_generator.main(force=force)
+    write_pipeline_status(bool(changed), digests, changed, reports)
+    return bool(changed)
+
+
+def write_metrics(command: str, status: str, prometheus_path: str | None = None):
+    """실행 요약을 JSONL에 추가하고 (지정 시) Prometheus textfile 갱신"""
+    summary = METRICS.write_run_summary(command, status)
+    if prometheus_path:
+        METRICS.write_prometheus(prometheus_path, command, status)
+    log.info(f"실행 요약 기록: {status}, {summary['duration']:.1f}초")
+    flush_logs()
+
+
+async def run_daemon(interval_minutes: float, skip_report: bool = False, session: SessionCache | None = None,
+                     prometheus_path: str | None = None, force: bool = False, **crawl_options):
+    """브라우저 프로세스를 유지한 채 interval_minutes 간격으로 크롤링 반복 (Ctrl+C로 종료)
+
+    회차마다 새 컨텍스트를 쓰므로 회차 간 상태는 섞이지 않으며, 브라우저 기동 비용만 한 번으로 줄어듦.
+    브라우저가 종료되어 있으면 다음 회차에 다시 띄우고, 한 회차가 실패해도 다음 회차는 그대로 진행.
+    KG 크롤링이 일부 지역을 남기고 중단되면(부분 결과) 다음 회차를 앞당겨 저널에서 이어서 진행.
+    메트릭은 회차마다 새로 모아 회차별 실행 요약으로 기록.
+    """
+    async with async_playwright() as p:
+        browser = None
+        resume = crawl_options.pop("resume", False)
+        try:
+            while True:
+                METRICS.reset()
+                started = time.monotonic()
+                status = "failed"
+                retry_after = None
+                try:
+                    if browser is None or not browser.is_connected():
+                        with METRICS.span("browser.launch"):
+                            browser = await p.chromium.launch(headless=True)
+                        log.info("브라우저 실행")
+
+                    log.info(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 크롤링 시작")
+                    await run_crawlers_with_browser(browser, session=session, resume=resume, **crawl_options)
+                    store_and_report(skip_report, force)
+                    status = "ok"
+                    resume = False
+                except crawl_ev_subsidy.PartialCrawlError as e:
+                    status = "partial"
+                    retry_after = e.retry_after
+                    resume = True
+                    log.error(f"이번 회차 부분 완료 - {e}")
+                except Exception as e:
+                    log.error("이번 회차 실패 - 다음 회차에 다시 시도", exc_info=e)
+                write_metrics("run_all --daemon", status, prometheus_path)
+                elapsed = time.monotonic() - started
+
+                wait_seconds = max(0.0, interval_minutes * 60 - elapsed)
+                if retry_after is not None:
+                    wait_seconds = min(wait_seconds, retry_after)
+                log.info(f"회차 소요 {elapsed:.1f}초, 다음 크롤링까지 {wait_seconds / 60:.1f}분 대기")
+                await asyncio.sleep(wait_seconds)
+        finally:
+            if browser is not None and browser.is_connected():
+                await browser.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EV 보조금 크롤링 + 보고서 생성 통합 실행")
+    parser.add_argument("--fetch", action="store_true", help="KG 지역 팝업을 HTTP로 직접 조회")
+    parser.add_argument("--skip-report", action="store_true", help="보고서 생성 생략")
+    parser.add_argument("--force", action="store_true",
+                        help="지난 실행과 데이터가 같아도 이력 저장/보고서 생성 진행")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default=DEFAULT_PROFILE,
+                        help="리소스 차단 프로필 (lean: 이미지/폰트/스타일시트/분석 스크립트 차단)")
+    parser.add_argument("--screenshot", action="store_true", help="접수현황 페이지 스크린샷 저장")
+    parser.add_argument("--incremental", action="store_true", help="KG 크롤링 시 변경 없는 지역은 이전 결과 재사용")
+    parser.add_argument("--resume", action="store_true", help="중단된 KG 크롤링을 저널에서 이어서 진행")
+    parser.add_argument("--years", help=f"차종별 보조금 크롤링 연도 (쉼표 구분, 기본: {crawl_ev_subsidy.CRAWL_YEAR})")
+    parser.add_argument("--manufacturers", help="차종별 보조금 제조사 필터 (쉼표 구분 또는 all, 기본: 케이지모빌리티)")
+    parser.add_argument("--session-cache", action="store_true",
+                        help="브라우저 쿠키/세션을 저장해 두고 다음 실행에서 재사용 (data/browser_state.json)")
+    parser.add_argument("--refresh-regions", action="store_true",
+                        help="KG 지역 카탈로그(data/kg_region_catalog.json)를 쓰지 않고 지역 표에서 다시 수집")
+    parser.add_argument("--daemon", action="store_true", help="브라우저를 유지한 채 일정 간격으로 크롤링 반복")
+    parser.add_argument("--interval-minutes", type=float, default=60, help="--daemon 반복 간격 (분, 기본: 60)")
+    parser.add_argument("--prometheus-textfile", metavar="PATH",
+                        help="실행 메트릭을 Prometheus textfile 형식으로 저장할 경로 (node_exporter textfile 수집용)")
+    add_fixture_arguments(parser)
+    add_snapshot_arguments(parser)
+    add_logging_arguments(parser)
+    args = parser.parse_args()
+    configure_from_args(args)
+    configure_snapshots(args)
+
+    log.info("=" * 60)
+    log.info("EV 보조금 통합 크롤링")
+    log.info("=" * 60)
+
+    session = SessionCache() if args.session_cache else None
+    crawl_options = {
+        "fetch_mode": args.fetch,
+        "profile": args.profile,
+        "screenshot": args.screenshot,
+        "incremental": args.incremental,
+        "resume": args.resume,
+        "years": crawl_ev_subsidy.parse_list_arg(args.years),
+        "manufacturers": crawl_ev_subsidy.parse_manufacturers_arg(args.manufacturers),
+        "fixtures": fixtures_from_args(args),
+        "refresh_regions": args.refresh_regions,
+    }
+
+    try:
+        if args.daemon:
+            try:
+                asyncio.run(run_daemon(args.interval_minutes, args.skip_report, session, args.prometheus_textfile,
+                                       args.force, **crawl_options))
+            except KeyboardInterrupt:
+                log.info("데몬 종료")
+            return
+
+        status = "failed"
+        try:
+            asyncio.run(run_crawlers(session=session, **crawl_options))
+            store_and_report(args.skip_report, args.force)
+            status = "ok"
+        except crawl_ev_subsidy.PartialCrawlError as e:
+            # 줄어든 KG 결과로 이력/보고서를 만들지 않음 (워크플로는 --resume으로 한 번 더 실행)
+            status = "partial"
+            log.error(f"{e} - --resume으로 남은 지역을 이어서 크롤링")
+            raise SystemExit(2)
+        finally:
+            write_metrics("run_all", status, args.prometheus_textfile)
+    finally:
+        if crawl_options["fixtures"] is not None:
+            crawl_options["fixtures"].close()
+
+
+if __name__ == "__main__":
+    main()
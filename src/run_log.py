@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+실행 로그 (표준 logging 기반)
+크롤러/보고서의 진행 메시지를 단계(level)별로 남기고, 콘솔 출력은 버퍼에 모아 한 번에 기록
+
+- text: 기존 print 출력과 같은 사람이 읽는 형식 (기본)
+- progress: 지역별 성공 줄은 생략하고 일정 간격으로 진행 요약 한 줄만 출력 (느린 CI 콘솔용)
+- json: 한 줄에 JSON 한 건 (ts, level, logger, msg, event, 필드)
+
+지역별 결과(건수, 소요 시간, 재시도, 오류)는 event="region" 레코드로 남기며,
+--log-file을 지정하면 형식과 관계없이 JSON Lines로 저장되어 실행 후 실패를 집계할 수 있음
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import traceback
+from datetime import datetime
+
+LOGGER_NAME = "ev_subsidy"
+LOG_FORMATS = ["text", "progress", "json"]
+LOG_LEVELS = ["debug", "info", "warning", "error"]
+
+# 콘솔 버퍼: 레코드 수 또는 경과 시간이 넘으면 기록 (경고 이상은 즉시 기록)
+BUFFER_CAPACITY = 50
+BUFFER_FLUSH_SEC = 2.0
+
+# progress 형식의 진행 요약 출력 간격 (초)
+PROGRESS_INTERVAL_SEC = 10.0
+
+# 콘솔 단계 표시 (info는 표시 없이 메시지만)
+LEVEL_PREFIX = {logging.DEBUG: "[디버그] ", logging.WARNING: "[경고] ", logging.ERROR: "[오류] ",
+                logging.CRITICAL: "[오류] "}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """모듈별 로거 (설정 전에 사용하면 기본 text/info 설정 적용)"""
+    root = logging.getLogger(LOGGER_NAME)
+    if not root.handlers:
+        configure_logging()
+    return root.getChild(name)
+
+
+def event(logger: logging.Logger, name: str, msg: str, level: int = logging.INFO,
+          exc: BaseException | None = None, **fields):
+    """구조화 이벤트 기록 (fields는 JSON 출력에 그대로 포함)"""
+    logger.log(level, msg, exc_info=exc, extra={"event": name, "fields": fields})
+
+
+def region_outcome(logger: logging.Logger, msg: str, lane: str, sido: str, district: str, status: str,
+                   rows: int = 0, latency: float | None = None, retries: int = 0, source: str = "fetched",
+                   done: int | None = None, total: int | None = None, exc: BaseException | None = None):
+    """지역 한 곳의 크롤링 결과 기록 (status: ok/failed, 실패는 경고 단계)"""
+    fields = {"lane": lane, "sido": sido, "district": district, "status": status, "rows": rows,
+              "retries": retries, "source": source, "done": done, "total": total}
+    if latency is not None:
+        fields["latency"] = round(latency, 3)
+    if exc is not None:
+        fields["error_type"] = type(exc).__name__
+        fields["error"] = str(exc)
+    event(logger, "region", msg, logging.INFO if status == "ok" else logging.WARNING, exc, **fields)
+
+
+class TextFormatter(logging.Formatter):
+    """사람이 읽는 형식 (스택 트레이스는 tracebacks=True일 때만, 아니면 예외 타입/메시지 한 줄)"""
+
+    def __init__(self, tracebacks: bool = False):
+        super().__init__()
+        self.tracebacks = tracebacks
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = LEVEL_PREFIX.get(record.levelno, "") + record.getMessage()
+        if record.exc_info and record.exc_info[1] is not None:
+            if self.tracebacks:
+                text += "\n" + "".join(traceback.format_exception(*record.exc_info)).rstrip()
+            else:
+                exc = record.exc_info[1]
+                text += f" ({type(exc).__name__}: {exc})"
+        return text
+
+
+class JsonFormatter(logging.Formatter):
+    """JSON Lines 형식"""
+
+    def __init__(self, tracebacks: bool = True):
+        super().__init__()
+        self.tracebacks = tracebacks
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if getattr(record, "event", None):
+            entry["event"] = record.event
+            entry.update(record.fields)
+        if record.exc_info and record.exc_info[1] is not None:
+            exc = record.exc_info[1]
+            entry.setdefault("error_type", type(exc).__name__)
+            entry.setdefault("error", str(exc))
+            if self.tracebacks:
+                entry["traceback"] = "".join(traceback.format_exception(*record.exc_info))
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """출력 버퍼 핸들러 (capacity건 또는 flush_sec초마다 한 번에 기록, 경고 이상은 즉시 기록)"""
+
+    def __init__(self, stream=None, capacity: int = BUFFER_CAPACITY, flush_sec: float = BUFFER_FLUSH_SEC):
+        super().__init__(stream)
+        self.capacity = capacity
+        self.flush_sec = flush_sec
+        self.buffer: list[str] = []
+        self.flushed_at = time.monotonic()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        if (record.levelno >= logging.WARNING or len(self.buffer) >= self.capacity
+                or time.monotonic() - self.flushed_at >= self.flush_sec):
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            if self.buffer:
+                self.stream.write("\n".join(self.buffer) + "\n")
+                self.buffer = []
+            self.flushed_at = time.monotonic()
+            if hasattr(self.stream, "flush"):
+                self.stream.flush()
+
+
+class ProgressStreamHandler(BufferedStreamHandler):
+    """progress 형식: 성공한 지역 레코드는 모아서 interval초마다 진행 요약 한 줄로 대체 (실패는 그대로 출력)"""
+
+    def __init__(self, stream=None, interval: float = PROGRESS_INTERVAL_SEC):
+        super().__init__(stream)
+        self.interval = interval
+        self.reset()
+
+    def reset(self):
+        self.ok = 0
+        self.failed = 0
+        self.rows = 0
+        self.reported_at = time.monotonic()
+
+    def emit(self, record: logging.LogRecord):
+        if getattr(record, "event", None) != "region":
+            super().emit(record)
+            return
+        fields = record.fields
+        if fields["status"] == "ok":
+            self.ok += 1
+            self.rows += fields["rows"]
+        else:
+            self.failed += 1
+            super().emit(record)
+
+        done, total = fields.get("done"), fields.get("total")
+        finished = done is not None and done == total
+        if not finished and time.monotonic() - self.reported_at < self.interval:
+            return
+        position = f" [{done}/{total}]" if done is not None else ""
+        self.buffer.append(f"  진행{position} 성공 {self.ok}개, 실패 {self.failed}개, {self.rows}건")
+        self.reported_at = time.monotonic()
+        if finished:
+            self.reset()
+            self.flush()
+
+
+def configure_logging(level: str = "info", fmt: str = "text", path: str | None = None, stream=None):
+    """로거 설정 (다시 호출하면 기존 핸들러를 비우고 교체)"""
+    root = logging.getLogger(LOGGER_NAME)
+    for handler in list(root.handlers):
+        handler.flush()
+        handler.close()
+        root.removeHandler(handler)
+    root.setLevel(logging.DEBUG)
+    root.propagate = False
+
+    console = (ProgressStreamHandler if fmt == "progress" else BufferedStreamHandler)(stream or sys.stdout)
+    console.setLevel(level.upper())
+    debug = console.level <= logging.DEBUG
+    console.setFormatter(JsonFormatter(tracebacks=debug) if fmt == "json" else TextFormatter(tracebacks=debug))
+    root.addHandler(console)
+
+    if path:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        file_handler = logging.FileHandler(path, encoding="utf-8")
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(JsonFormatter())
+        root.addHandler(file_handler)
+
+
+def flush_logs():
+    """버퍼에 남은 로그 기록"""
+    for handler in logging.getLogger(LOGGER_NAME).handlers:
+        handler.flush()
+
+
+def add_logging_arguments(parser: argparse.ArgumentParser):
+    """로그 관련 명령행 인자 추가"""
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default="info",
+                        help="콘솔 로그 단계 (debug면 미리보기/스택 트레이스까지 출력)")
+    parser.add_argument("--log-format", choices=LOG_FORMATS, default="text",
+                        help="콘솔 로그 형식 (progress: 지역별 줄 대신 진행 요약, json: JSON Lines)")
+    parser.add_argument("--log-file", metavar="PATH",
+                        help="전체 로그(debug 포함)를 JSON Lines로 저장할 파일 (지역별 결과 집계용)")
+
+
+def configure_from_args(args: argparse.Namespace):
+    """명령행 인자로 로거 설정"""
+    configure_logging(args.log_level, args.log_format, args.log_file)
+
+
+def summarize_regions(path: str) -> dict:
+    """JSON 로그 파일의 지역별 결과 집계 (같은 지역이 여러 번 기록되면 마지막 결과 기준)"""
+    outcomes = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("event") == "region":
+                outcomes[(entry["lane"], entry["sido"], entry["district"])] = entry
+
+    failures: dict[str, list[str]] = {}
+    for (lane, sido, district), entry in outcomes.items():
+        if entry["status"] != "ok":
+            failures.setdefault(entry.get("error_type", "unknown"), []).append(f"{lane} {sido} {district}")
+    latencies = sorted((entry.get("latency") or 0, f"{lane} {sido} {district}")
+                       for (lane, sido, district), entry in outcomes.items())
+    return {
+        "regions": len(outcomes),
+        "ok": sum(1 for entry in outcomes.values() if entry["status"] == "ok"),
+        "rows": sum(entry.get("rows", 0) for entry in outcomes.values()),
+        "retries": sum(entry.get("retries", 0) for entry in outcomes.values()),
+        "failures": failures,
+        "slowest": latencies[-5:][::-1],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON 로그 파일(--log-file)의 지역별 크롤링 결과 집계")
+    parser.add_argument("path", help="JSON Lines 로그 파일")
+    summary = summarize_regions(parser.parse_args().path)
+    print(f"지역 {summary['regions']}개: 성공 {summary['ok']}개, 실패 {summary['regions'] - summary['ok']}개, "
+          f"{summary['rows']}건, 재시도 {summary['retries']}회")
+    for error_type, regions in sorted(summary["failures"].items(), key=lambda item: -len(item[1])):
+        print(f"  {error_type}: {len(regions)}개 - {', '.join(regions)}")
+    if summary["slowest"]:
+        print("가장 오래 걸린 지역: " + ", ".join(f"{name} {latency:.1f}초" for latency, name in summary["slowest"]))
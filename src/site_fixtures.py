@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+ev.or.kr 응답 녹화/재생
+크롤러 컨텍스트의 ev.or.kr 요청(메인 페이지, 탭 전환, 지역 팝업 등)을 라우트 단계에서 가로채
+녹화 디렉터리(index.jsonl + *.body, popup_fetch.save_fixture 형식)에 저장하거나,
+로컬 대역 서버(fixture_server)로 돌려 실제 사이트 없이 크롤러를 실행
+"""
+
+import argparse
+import re
+from urllib.parse import urlsplit
+
+from playwright.async_api import BrowserContext, Route
+
+from fixture_server import start_fixture_server
+from popup_fetch import save_fixture
+from run_log import get_logger
+
+log = get_logger("site_fixtures")
+
+# 녹화/재생 대상 요청 (ev.or.kr 도메인)
+SITE_URL_RE = re.compile(r"^https?://(www\.)?ev\.or\.kr/")
+
+
+def request_target(url: str) -> str:
+    """URL에서 출처를 뺀 요청 대상 (경로 + 쿼리) - 녹화 조회 키 기준"""
+    parts = urlsplit(url)
+    return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+
+class SiteFixtures:
+    """크롤러 컨텍스트의 녹화/재생 설정
+
+    record_dir: 응답을 녹화할 디렉터리 (실제 사이트 또는 재생 서버 응답을 저장)
+    replay_origin: 요청을 보낼 로컬 대역 서버 주소 (예: http://127.0.0.1:8765)
+
+    사용 예:
+        fixtures = SiteFixtures.replay("benchmarks/fixtures/site", latency_ms=300)
+        context = await new_profiled_context(browser, profile, setup=fixtures.attach)
+        ...
+        fixtures.close()
+    """
+
+    def __init__(self, record_dir: str | None = None, replay_origin: str | None = None):
+        self.record_dir = record_dir
+        self.replay_origin = replay_origin.rstrip("/") if replay_origin else None
+        self.server = None
+        self.stats = {"recorded": 0, "replayed": 0}
+
+    @classmethod
+    def replay(cls, fixture_dir: str, latency_ms: float = 0, jitter_ms: float = 0,
+               record_dir: str | None = None) -> "SiteFixtures":
+        """녹화 디렉터리를 제공하는 대역 서버를 백그라운드로 띄우고 그 서버로 재생"""
+        server, origin = start_fixture_server(fixture_dir, latency_ms=latency_ms, jitter_ms=jitter_ms)
+        fixtures = cls(record_dir, origin)
+        fixtures.server = server
+        log.info(f"녹화 재생 서버: {origin} ({fixture_dir}, 지연 {latency_ms:g}±{jitter_ms:g}ms)")
+        return fixtures
+
+    @property
+    def replaying(self) -> bool:
+        return self.replay_origin is not None
+
+    async def attach(self, context: BrowserContext):
+        """컨텍스트에 녹화/재생 라우트 등록 (new_profiled_context의 setup으로 사용)"""
+
+        async def handle(route: Route):
+            request = route.request
+            target = request_target(request.url)
+            if self.replaying:
+                response = await route.fetch(url=self.replay_origin + target)
+                self.stats["replayed"] += 1
+            else:
+                response = await route.fetch()
+            if self.record_dir and response.ok:
+                save_fixture(self.record_dir, request.method, target, request.post_data_buffer,
+                             response.status, response.headers.get("content-type", ""), await response.body())
+                self.stats["recorded"] += 1
+            await route.fulfill(response=response)
+
+        await context.route(SITE_URL_RE, handle)
+
+    def close(self):
+        """재생 서버 종료 후 요약 출력"""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            stats = self.server.stats
+            log.info(f"녹화 재생: 일치 {stats.get('hit', 0)}건, 경로 대체 {stats.get('fallback', 0)}건, "
+                     f"없음 {stats.get('miss', 0)}건")
+            self.server = None
+        if self.record_dir:
+            log.info(f"녹화 저장: {self.stats['recorded']}건 ({self.record_dir})")
+
+
+def add_fixture_arguments(parser: argparse.ArgumentParser):
+    """녹화/재생 관련 명령행 인자 추가"""
+    parser.add_argument("--record-fixtures", metavar="DIR", help="ev.or.kr 응답을 녹화할 디렉터리")
+    parser.add_argument("--replay-fixtures", metavar="DIR",
+                        help="실제 사이트 대신 녹화 디렉터리를 로컬 대역 서버로 재생")
+    parser.add_argument("--replay-latency-ms", type=float, default=0, help="재생 서버 응답 지연 (밀리초)")
+
+
+def fixtures_from_args(args: argparse.Namespace) -> SiteFixtures | None:
+    """명령행 인자로 녹화/재생 설정 생성 (둘 다 없으면 None)"""
+    if args.replay_fixtures:
+        return SiteFixtures.replay(args.replay_fixtures, args.replay_latency_ms, record_dir=args.record_fixtures)
+    if args.record_fixtures:
+        return SiteFixtures(record_dir=args.record_fixtures)
+    return None
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+데이터 스냅샷 파일 저장/읽기
+CSV(BOM 포함 UTF-8 - 엑셀 호환)는 같은 디렉터리의 임시 파일에 쓰고 fsync한 뒤 원래 이름으로 교체하여,
+쓰는 도중 중단되어도 잘린 파일 대신 이전 파일이 그대로 남도록 함
+
+CSV 옆에 보조 파일을 함께 저장할 수 있음 (--snapshot-formats, 기본: cols):
+- cols: 컬럼마다 고유 값 목록 + 값 번호 배열로 바꿔 gzip 압축한 컬럼 형식 (<이름>.cols.gz)
+        이력 저장소/보고서는 CSV보다 이 파일을 먼저 읽음 (기록된 CSV 크기/수정 시각이 지금과 다르면 CSV 사용)
+- gz, zst: 압축 CSV (<이름>.csv.gz, <이름>.csv.zst - zst는 compression.zstd 또는 zstandard 모듈이 있을 때만)
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+from contextlib import contextmanager
+
+from run_log import get_logger
+
+log = get_logger("snapshot_io")
+
+SIDECAR_FORMATS = ["cols", "gz", "zst"]
+DEFAULT_SIDECARS = ["cols"]
+SIDECAR_SUFFIXES = {"cols": ".cols.gz", "gz": ".csv.gz", "zst": ".csv.zst"}
+
+COLUMNS_VERSION = 1
+
+# gzip 압축 수준 (9는 크기 차이에 비해 저장이 느림)
+COMPRESS_LEVEL = 6
+
+# 이번 실행에서 CSV와 함께 저장할 보조 파일 (configure_snapshots로 변경)
+_sidecars = list(DEFAULT_SIDECARS)
+
+
+def _zstd_compressor():
+    """zstd 압축 함수 (Python 3.14+ compression.zstd, 없으면 zstandard 모듈, 둘 다 없으면 None)"""
+    try:
+        from compression import zstd
+        return zstd.compress
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard.ZstdCompressor().compress
+
+
+def _fsync_dir(directory: str):
+    """파일 교체(이름 변경)가 디스크에 반영되도록 디렉터리 fsync (지원하지 않는 OS는 생략)"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = "w", **open_kwargs):
+    """임시 파일에 쓰고 fsync한 뒤 path로 교체 (예외가 나면 임시 파일만 지우고 기존 파일은 그대로 둠)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, mode, **open_kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+    _fsync_dir(directory)
+
+
+def sidecar_path(path: str, fmt: str) -> str:
+    """CSV 경로의 보조 파일 경로 (data/x.csv → data/x.cols.gz 등)"""
+    base = path[:-4] if path.endswith(".csv") else path
+    return base + SIDECAR_SUFFIXES[fmt]
+
+
+def render_csv(header: list[str], rows: list[list[str]], comment: str | None = None) -> str:
+    """CSV 텍스트 (comment가 있으면 헤더 앞 한 줄 - '# 출처' 등)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if comment is not None:
+        writer.writerow([comment])
+    writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def encode_columns(header: list[str], rows: list[list[str]], source: dict, comment: str | None = None) -> bytes:
+    """컬럼 형식 파일 내용 - 컬럼마다 고유 값 목록(등장 순서)과 행별 값 번호 (gzip 압축 전)"""
+    columns = []
+    for i in range(len(header)):
+        index: dict[str, int] = {}
+        codes = [index.setdefault(row[i] if i < len(row) else "", len(index)) for row in rows]
+        columns.append({"values": list(index), "codes": codes})
+    snapshot = {"version": COLUMNS_VERSION, "source": source, "comment": comment, "header": header,
+                "rows": len(rows), "columns": columns}
+    return json.dumps(snapshot, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_snapshot(path: str, header: list[str], rows: list[list[str]], comment: str | None = None,
+                   sidecars: list[str] | None = None) -> list[str]:
+    """CSV를 원자적으로 저장하고 보조 파일 생성 - 저장한 보조 파일 경로 목록 반환
+
+    sidecars가 없으면 configure_snapshots로 정한 형식 사용.
+    이번에 만들지 않는 형식의 이전 보조 파일은 CSV와 내용이 다르므로 삭제.
+    """
+    sidecars = _sidecars if sidecars is None else sidecars
+    rows = [["" if value is None else str(value) for value in row] for row in rows]
+    data = render_csv(header, rows, comment).encode("utf-8-sig")
+    with atomic_write(path, "wb") as f:
+        f.write(data)
+
+    stat = os.stat(path)
+    written = []
+    for fmt in SIDECAR_FORMATS:
+        target = sidecar_path(path, fmt)
+        payload = None
+        if fmt in sidecars:
+            if fmt == "cols":
+                source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+                payload = gzip.compress(encode_columns(header, rows, source, comment),
+                                        compresslevel=COMPRESS_LEVEL, mtime=0)
+            elif fmt == "gz":
+                payload = gzip.compress(data, compresslevel=COMPRESS_LEVEL, mtime=0)
+            else:
+                compress = _zstd_compressor()
+                if compress is None:
+                    log.warning(f"zstd 모듈 없음 - {os.path.basename(target)} 생략")
+                else:
+                    payload = compress(data)
+        if payload is None:
+            if os.path.exists(target):
+                os.remove(target)
+            continue
+        with atomic_write(target, "wb") as f:
+            f.write(payload)
+        written.append(target)
+    return written
+
+
+def read_columns(path: str) -> tuple[list[str], list[list[str]]] | None:
+    """CSV의 컬럼 형식 보조 파일 읽기 - (헤더, 컬럼별 값 목록)
+
+    보조 파일이 없거나 읽을 수 없거나, 기록된 CSV 크기/수정 시각이 지금 CSV와 다르면 None (CSV를 읽어야 함).
+    """
+    sidecar = sidecar_path(path, "cols")
+    if not os.path.exists(sidecar) or not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    try:
+        with gzip.open(sidecar, "rb") as f:
+            snapshot = json.loads(f.read())
+    except (OSError, EOFError, ValueError) as e:
+        log.warning(f"컬럼 형식 파일을 읽지 못함 - CSV 사용: {sidecar}", exc_info=e)
+        return None
+    if (snapshot.get("version") != COLUMNS_VERSION
+            or snapshot.get("source") != {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}):
+        log.debug(f"컬럼 형식 파일이 CSV와 다름 - CSV 사용: {sidecar}")
+        return None
+    columns = [list(map(column["values"].__getitem__, column["codes"])) for column in snapshot["columns"]]
+    return snapshot["header"], columns
+
+
+def parse_snapshot_formats(value: str) -> list[str]:
+    """--snapshot-formats 인자 ('none'이면 보조 파일 없음)"""
+    formats = [fmt.strip() for fmt in value.split(",") if fmt.strip()]
+    if formats == ["none"]:
+        return []
+    unknown = [fmt for fmt in formats if fmt not in SIDECAR_FORMATS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"알 수 없는 형식: {', '.join(unknown)} (가능: {', '.join(SIDECAR_FORMATS)}, none)")
+    return formats
+
+
+def add_snapshot_arguments(parser: argparse.ArgumentParser):
+    """스냅샷 보조 파일 관련 명령행 인자 추가"""
+    parser.add_argument("--snapshot-formats", type=parse_snapshot_formats, default=",".join(DEFAULT_SIDECARS),
+                        help=f"CSV와 함께 저장할 보조 파일 (쉼표 구분: {','.join(SIDECAR_FORMATS)} 또는 none, "
+                             f"기본: {','.join(DEFAULT_SIDECARS)})")
+
+
+def configure_snapshots(args: argparse.Namespace):
+    """명령행 인자로 보조 파일 형식 설정"""
+    global _sidecars
+    _sidecars = list(args.snapshot_formats)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+테이블 일괄 추출 모듈
+테이블 전체를 페이지 안에서 한 번의 evaluate 호출로 직렬화하여
+셀 단위 inner_text() 왕복(CDP round-trip)을 제거
+"""
+
+# 행 목록을 [셀 텍스트 목록, onclick 인자 목록] 배열로 직렬화
+# - 셀 텍스트는 innerText 기준, 연속 공백을 한 칸으로 정리
+#   (기존 셀 단위 추출은 strip()만 했음 - 셀 안에 줄바꿈/연속 공백이 있으면 값이 달라지지만 현재 두 데이터에는
+#    그런 셀이 없음. HTTP 조회(popup_fetch)의 HTML 파싱 결과와 같게 하려고 정리함)
+# - onclick 인자는 linkSelector에 해당하는 첫 번째 링크의 작은따옴표 인자 ('2026','1100',...)
+TABLE_ROWS_JS = """
+(rows, linkSelector) => rows.map(row => {
+    const cells = Array.from(row.querySelectorAll('td'), td =>
+        (td.innerText || td.textContent || '').replace(/\\s+/g, ' ').trim()
+    );
+    const link = row.querySelector(linkSelector);
+    const onclick = link ? (link.getAttribute('onclick') || '') : '';
+    const args = Array.from(onclick.matchAll(/'([^']*)'/g), m => m[1]);
+    return [cells, args];
+})
+"""
+
+DEFAULT_LINK_SELECTOR = "a[onclick]"
+
+
+def _to_rows(raw: list) -> list[tuple[list[str], list[str]]]:
+    return [(cells, args) for cells, args in raw]
+
+
+async def extract_rows(rows_locator, link_selector: str = DEFAULT_LINK_SELECTOR) -> list[tuple[list[str], list[str]]]:
+    """행 Locator(async API)의 전체 행을 한 번에 추출 - [(셀 목록, onclick 인자 목록), ...]"""
+    raw = await rows_locator.evaluate_all(TABLE_ROWS_JS, link_selector)
+    return _to_rows(raw)
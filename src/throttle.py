@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+크롤링 요청 속도 제한 유틸리티
+여러 작업자(팝업/페이지)가 공유하며 최소 요청 간격을 보장하고 응답 지연/오류에 따라 간격을 조절하는
+페이싱 컨트롤러(AdaptivePacer)와, 최근 오류율/지연으로 사이트 장애를 감지해 요청을 멈추거나
+크롤링을 중단하는 회로 차단기(CircuitBreaker) 제공
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from metrics import METRICS
+from run_log import event, get_logger
+
+log = get_logger("throttle")
+
+
+class AdaptivePacer:
+    """응답 지연/오류에 따라 요청 간격을 조절하는 페이싱 컨트롤러
+
+    고정 랜덤 대기 대신 요청 간 간격만 관리하며, 간격은 항상 min_interval 이상을 보장.
+    최근 응답 지연(지수 이동 평균)이 slow_latency를 넘거나 오류가 나면 간격을 backoff배로 늘리고
+    (최대 max_interval), 정상 응답이 이어지면 recovery배씩 min_interval까지 되돌림.
+    log_path가 있으면 모든 대기/간격 변경 결정이 JSONL로 기록되어
+    실행별 대기 시간 합계를 확인할 수 있음.
+
+    사용 예:
+        pacer = AdaptivePacer("kg", min_interval=2.0)
+        await pacer.acquire("팝업")
+        with pacer.measure():      # 응답 지연 측정, 예외가 나면 오류로 기록
+            ...
+        pacer.close()
+    """
+
+    def __init__(self, name: str, min_interval: float, max_interval: float = 30.0, slow_latency: float = 5.0,
+                 backoff: float = 2.0, recovery: float = 0.8, smoothing: float = 0.3, log_path: str | None = None):
+        if min_interval <= 0:
+            raise ValueError(f"min_interval은 0보다 커야 합니다: {min_interval}")
+        self.name = name
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.slow_latency = slow_latency
+        self.backoff = backoff
+        self.recovery = recovery
+        self.smoothing = smoothing
+        self.interval = min_interval
+        self.latency: float | None = None
+        self.requests = 0
+        self.errors = 0
+        self.idle_by_reason: dict[str, float] = {}
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+        self._log_file = None
+        if log_path:
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            self._log_file = open(log_path, "w", encoding="utf-8")
+
+    def _log(self, event: str, **fields):
+        if self._log_file is None:
+            return
+        decision = {"time": round(time.time(), 3), "pacer": self.name, "event": event,
+                    "interval": round(self.interval, 3), **fields}
+        self._log_file.write(json.dumps(decision, ensure_ascii=False) + "\n")
+
+    async def acquire(self, reason: str = "요청") -> float:
+        """직전 요청 후 현재 간격이 지날 때까지 대기 (요청 순서대로 처리) - 대기한 초 반환"""
+        async with self._lock:
+            wait = max(0.0, self._next_at - time.monotonic())
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_at = time.monotonic() + self.interval
+        self.requests += 1
+        self.idle_by_reason[reason] = self.idle_by_reason.get(reason, 0.0) + wait
+        METRICS.observe("pacing.wait", wait, pacer=self.name, reason=reason)
+        self._log("wait", reason=reason, wait=round(wait, 3))
+        return wait
+
+    def _set_interval(self, interval: float, cause: str):
+        interval = min(self.max_interval, max(self.min_interval, interval))
+        if abs(interval - self.interval) < 1e-6:
+            return
+        previous = self.interval
+        self.interval = interval
+        # 이미 예약된 다음 요청 시각도 새 간격 기준으로 조정
+        self._next_at += interval - previous
+        self._log("interval", cause=cause, previous=round(previous, 3))
+
+    def record(self, latency: float | None = None, ok: bool = True):
+        """요청 결과 반영 - 오류이거나 평균 지연이 느리면 간격을 늘리고, 아니면 줄임"""
+        if latency is not None:
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += self.smoothing * (latency - self.latency)
+
+        if not ok:
+            self.errors += 1
+            METRICS.add("pacing.errors", pacer=self.name)
+            self._set_interval(self.interval * self.backoff, "error")
+        elif self.latency is not None and self.latency > self.slow_latency:
+            self._set_interval(self.interval * self.backoff, f"slow {self.latency:.2f}s")
+        else:
+            self._set_interval(self.interval * self.recovery, "recover")
+
+    @contextmanager
+    def measure(self):
+        """블록 실행 시간을 응답 지연으로 기록 (예외가 나면 오류로 기록 후 다시 발생)"""
+        start = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self.record(time.monotonic() - start, ok=False)
+            raise
+        self.record(time.monotonic() - start)
+
+    @property
+    def total_idle(self) -> float:
+        return sum(self.idle_by_reason.values())
+
+    def print_summary(self):
+        """요청 수/오류 수/대기 시간 합계 기록"""
+        reasons = ", ".join(f"{reason} {idle:.1f}초" for reason, idle in
+                            sorted(self.idle_by_reason.items(), key=lambda item: -item[1]) if idle > 0)
+        latency = f", 평균 응답 {self.latency:.2f}초" if self.latency is not None else ""
+        event(log, "pacing", f"[{self.name}] 페이싱: 요청 {self.requests}회, 오류 {self.errors}회, "
+                             f"대기 합계 {self.total_idle:.1f}초{f' ({reasons})' if reasons else ''}, "
+                             f"최종 간격 {self.interval:.2f}초{latency}",
+              pacer=self.name, requests=self.requests, errors=self.errors, idle=round(self.total_idle, 3),
+              interval=round(self.interval, 3))
+
+    def close(self):
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+
+class CircuitOpenError(RuntimeError):
+    """회로 차단기가 크롤링을 중단한 뒤 요청하려 할 때"""
+
+
+class CircuitBreaker:
+    """최근 요청의 오류율/응답 지연으로 사이트 장애를 감지하는 회로 차단기
+
+    최근 window개 요청 중 실패했거나 slow_latency보다 느린 요청 비율이 max_error_rate 이상이면
+    (최소 min_samples개) 열림 상태가 되어 cooldown초 동안 새 요청을 멈추고, 그 뒤 요청 하나만 시험으로 통과시킴.
+    시험 요청이 성공하면 닫힘, 실패하거나 probe_timeout초 안에 결과가 기록되지 않으면
+    (시험 요청이 취소되는 등) 다시 열림. 열림이 max_trips번을 넘거나 abort()가 호출되면
+    중단 상태가 되어 이후 acquire()는 CircuitOpenError를 발생시킴 (남은 작업은 다음 실행으로 미룸).
+
+    사용 예:
+        breaker = CircuitBreaker("kg")
+        await breaker.acquire()    # 열림이면 대기, 중단이면 CircuitOpenError
+        breaker.record(ok=True, latency=1.2)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    ABORTED = "aborted"
+
+    def __init__(self, name: str, window: int = 20, min_samples: int = 8, max_error_rate: float = 0.5,
+                 slow_latency: float = 10.0, cooldown: float = 60.0, max_trips: int = 3,
+                 probe_timeout: float = 60.0):
+        self.name = name
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.slow_latency = slow_latency
+        self.cooldown = cooldown
+        self.max_trips = max_trips
+        self.probe_timeout = probe_timeout
+        self.state = self.CLOSED
+        self.trips = 0
+        self.paused = 0.0
+        self.reason = ""
+        self._results: deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_started = 0.0
+        self._changed = asyncio.Event()
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self._results) / len(self._results) if self._results else 0.0
+
+    @property
+    def aborted(self) -> bool:
+        return self.state == self.ABORTED
+
+    def _set_state(self, state: str):
+        self.state = state
+        # 대기 중인 작업자를 깨우고 다음 변경을 위한 새 이벤트로 교체
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _trip(self, reason: str):
+        self.trips += 1
+        self.reason = reason
+        METRICS.add("breaker.trips", breaker=self.name)
+        if self.trips > self.max_trips:
+            self.abort(f"차단 {self.trips}회 - {reason}")
+            return
+        self._opened_at = time.monotonic()
+        self._set_state(self.OPEN)
+        event(log, "breaker_open", f"[{self.name}] 회로 차단: {reason} - {self.cooldown:.0f}초 동안 요청 중지",
+              logging.WARNING, breaker=self.name, reason=reason, trips=self.trips,
+              error_rate=round(self.error_rate, 3))
+
+    def abort(self, reason: str):
+        """크롤링 중단 - 이후 acquire()는 모두 CircuitOpenError"""
+        if self.aborted:
+            return
+        self.reason = reason
+        self._set_state(self.ABORTED)
+        event(log, "breaker_abort", f"[{self.name}] 크롤링 중단: {reason}", logging.ERROR,
+              breaker=self.name, reason=reason, trips=self.trips)
+
+    async def acquire(self):
+        """요청 전 호출 - 열림이면 cooldown이 끝날 때까지, 시험 요청 중이면 결과가 나올 때까지 대기"""
+        while True:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.ABORTED:
+                raise CircuitOpenError(f"[{self.name}] 크롤링 중단됨: {self.reason}")
+            changed = self._changed
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.cooldown - time.monotonic()
+                if remaining <= 0:
+                    # 이 요청이 시험 요청
+                    self._probe_started = time.monotonic()
+                    self._set_state(self.HALF_OPEN)
+                    return
+            else:
+                remaining = self._probe_started + self.probe_timeout - time.monotonic()
+                if remaining <= 0:
+                    # 시험 요청이 결과를 기록하지 못함 (취소/예외) - 다시 열고 cooldown 후 새 시험 요청
+                    self._trip(f"시험 요청 응답 없음 ({self.probe_timeout:.0f}초)")
+                    continue
+            start = time.monotonic()
+            try:
+                await asyncio.wait_for(changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+            self.paused += time.monotonic() - start
+
+    def record(self, ok: bool = True, latency: float | None = None):
+        """요청 결과 반영 (실패 또는 slow_latency 초과는 나쁜 요청)"""
+        bad = not ok or (latency is not None and latency > self.slow_latency)
+        if self.state == self.HALF_OPEN:
+            if bad:
+                self._trip("시험 요청 실패")
+            else:
+                self._results.clear()
+                self._set_state(self.CLOSED)
+                event(log, "breaker_close", f"[{self.name}] 회로 복구: 시험 요청 성공 - 요청 재개",
+                      breaker=self.name, trips=self.trips)
+            return
+        if self.state != self.CLOSED:
+            return
+        self._results.append(bad)
+        if len(self._results) >= self.min_samples and self.error_rate >= self.max_error_rate:
+            self._trip(f"최근 {len(self._results)}회 중 오류/지연 {self.error_rate:.0%}")
+
+    def print_summary(self):
+        """차단 횟수/멈춘 시간/최종 상태 기록 (차단이 없었으면 생략)"""
+        if not self.trips and not self.aborted:
+            return
+        event(log, "breaker", f"[{self.name}] 회로 차단기: 차단 {self.trips}회, 대기 합계 {self.paused:.1f}초, "
+                              f"최종 상태 {self.state}" + (f" ({self.reason})" if self.reason else ""),
+              breaker=self.name, trips=self.trips, paused=round(self.paused, 3), state=self.state)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+접수현황 시계열 추세 분석
+이력 저장소의 ev_subsidy 스냅샷 전체를 컬럼 단위로 읽어
+시도/지역/차종별 출고잔여대수 일평균 소진량, 소진 예상일, 이상 변동을 계산
+"""
+
+import math
+import os
+from datetime import datetime, timedelta
+
+from history_store import HISTORY_DB, KST, HistoryStore
+
+# 소진 속도 계산에 사용할 최근 기간 (일)
+TREND_WINDOW_DAYS = 14
+
+# 소진 속도를 추정하기 위한 최소 관측 기간 (일)
+MIN_SPAN_DAYS = 1.0
+
+# 이상 변동 판정 기준: 지역별 변화량 분포 대비 robust z-score, 최소 변화 대수
+JUMP_Z_THRESHOLD = 5.0
+JUMP_MIN_UNITS = 20
+
+# 평소 변화량 분포를 잡기 위한 최소 변화 횟수 (이보다 적으면 판정하지 않음)
+JUMP_MIN_HISTORY = 5
+
+KEY_COLUMNS = ["시도", "지역구분", "차종구분"]
+VALUE_COLUMN = "출고잔여대수_전체"
+
+
+def build_series(columns: dict[str, list]) -> dict[tuple[str, str, str], tuple[list[float], list[int]]]:
+    """load_columns 결과 → 키별 (경과일 목록, 잔여대수 목록) 시계열
+
+    경과일은 첫 스냅샷 기준 일 단위 실수. 값이 없는 행은 제외.
+    """
+    taken_at = columns["taken_at"]
+    if not taken_at:
+        return {}
+
+    # 같은 스냅샷의 행은 시각이 같으므로 시각 문자열별로 한 번만 변환
+    origin = datetime.fromisoformat(taken_at[0])
+    day_of = {}
+    for t in set(taken_at):
+        day_of[t] = (datetime.fromisoformat(t) - origin).total_seconds() / 86400
+
+    series = {}
+    for t, sido, district, category, value in zip(
+        taken_at, columns["시도"], columns["지역구분"], columns["차종구분"], columns[VALUE_COLUMN]
+    ):
+        if value is None:
+            continue
+        key = (sido, district, category)
+        entry = series.get(key)
+        if entry is None:
+            entry = series[key] = ([], [])
+        entry[0].append(day_of[t])
+        entry[1].append(value)
+    return series
+
+
+def _slope(xs: list[float], ys: list[int]) -> float | None:
+    """최소제곱 기울기 (점이 2개 미만이거나 시간 폭이 없으면 None)"""
+    n = len(xs)
+    if n < 2:
+        return None
+    mean_x = math.fsum(xs) / n
+    mean_y = math.fsum(ys) / n
+    sxx = math.fsum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    sxy = math.fsum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return sxy / sxx
+
+
+def _median(values: list[float]) -> float:
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    return ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+
+def analyze_trends(series: dict, origin: datetime, window_days: float = TREND_WINDOW_DAYS) -> list[dict]:
+    """키별 일평균 소진량과 소진 예상일
+
+    최근 window_days 기간의 잔여대수에 직선을 맞춰 감소 기울기를 소진 속도로 사용.
+    """
+    trends = []
+    for (sido, district, category), (days, values) in series.items():
+        last_day = days[-1]
+        start = 0
+        while start < len(days) and days[start] < last_day - window_days:
+            start += 1
+        slope = None
+        if last_day - days[start] >= MIN_SPAN_DAYS:
+            slope = _slope(days[start:], values[start:])
+        rate = -slope if slope is not None and slope < 0 else 0.0
+        remaining = values[-1]
+
+        exhaustion = None
+        if remaining > 0 and rate > 0:
+            exhaustion = origin + timedelta(days=last_day + remaining / rate)
+        trends.append({
+            "시도": sido,
+            "지역": district,
+            "차종": category,
+            "잔여": remaining,
+            "일평균소진": rate,
+            "소진예상일": exhaustion,
+            "스냅샷수": len(days) - start,
+        })
+    return trends
+
+
+def detect_jumps(series: dict, origin: datetime, z_threshold: float = JUMP_Z_THRESHOLD,
+                 min_units: int = JUMP_MIN_UNITS) -> list[dict]:
+    """연속 스냅샷 간 변화량 중 지역별 평소 변화 대비 이례적으로 큰 변화 (증가는 예산 추가/정정 등)"""
+    jumps = []
+    for (sido, district, category), (days, values) in series.items():
+        diffs = [b - a for a, b in zip(values, values[1:])]
+        if len(diffs) < JUMP_MIN_HISTORY:
+            continue
+        center = _median(diffs)
+        # MAD가 0이면(대부분 변화 없음) 최소 변화 대수만으로 판정
+        scale = 1.4826 * _median([abs(d - center) for d in diffs])
+        for i, diff in enumerate(diffs):
+            if abs(diff) < min_units:
+                continue
+            if scale > 0 and abs(diff - center) / scale < z_threshold:
+                continue
+            jumps.append({
+                "시도": sido,
+                "지역": district,
+                "차종": category,
+                "시각": origin + timedelta(days=days[i + 1]),
+                "이전": values[i],
+                "현재": values[i + 1],
+                "변화": diff,
+            })
+    return jumps
+
+
+def load_trends(path: str = HISTORY_DB, days: int | None = None,
+                now: datetime | None = None) -> tuple[list[dict], list[dict]]:
+    """이력 저장소에서 (추세 목록, 이상 변동 목록) 계산 (이력이 없으면 빈 목록)
+
+    Args:
+        days: 최근 며칠의 스냅샷만 사용 (None이면 전체)
+    """
+    if not os.path.exists(path):
+        return [], []
+    start = None
+    if days is not None:
+        start = ((now or datetime.now(KST)) - timedelta(days=days)).isoformat(timespec="seconds")
+    with HistoryStore(path) as store:
+        columns = store.load_columns("ev_subsidy", KEY_COLUMNS + [VALUE_COLUMN], start=start)
+    if not columns["taken_at"]:
+        return [], []
+
+    origin = datetime.fromisoformat(columns["taken_at"][0])
+    series = build_series(columns)
+    return analyze_trends(series, origin), detect_jumps(series, origin)